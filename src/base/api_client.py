@@ -1,12 +1,232 @@
+import threading
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Type
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from src.base.settings import settings_instance
+
+if TYPE_CHECKING:
+    from src.base.cassette import Cassette, CassetteAdapter, CassetteMode
+
+
+class PoolStats:
+    """
+    Connection reuse counters for the shared pool.
+
+    A checkout is every connection taken from a host pool. A miss is a checkout
+    that found no idle keep-alive connection and had to open a new one.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.misses = 0
+
+    def record_checkout(self) -> None:
+        with self._lock:
+            self.checkouts += 1
+
+    def record_miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    @property
+    def hits(self) -> int:
+        return self.checkouts - self.misses
+
+    @property
+    def reuse_rate(self) -> float:
+        return self.hits / self.checkouts if self.checkouts else 0.0
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "hits": self.hits,
+                "misses": self.misses,
+                "reuse_rate": self.reuse_rate,
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checkouts = 0
+            self.misses = 0
+
+
+def _counting_pool(
+    pool_cls: Type[HTTPConnectionPool], stats: PoolStats
+) -> Type[HTTPConnectionPool]:
+    class TimedConnection(pool_cls.ConnectionCls):
+        # Read and cleared by RequestsTransport, so a reused connection reports 0
+        connect_ns = 0
+
+        def connect(self) -> None:
+            start = perf_counter_ns()
+            super().connect()
+            self.connect_ns = perf_counter_ns() - start
+
+    class CountingConnectionPool(pool_cls):
+        ConnectionCls = TimedConnection
+
+        def _get_conn(self, timeout: Optional[float] = None):
+            stats.record_checkout()
+            return super()._get_conn(timeout)
+
+        def _new_conn(self):
+            stats.record_miss()
+            return super()._new_conn()
+
+    CountingConnectionPool.__name__ = f"Counting{pool_cls.__name__}"
+    return CountingConnectionPool
+
+
+class SharedHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter meant to be mounted on many sessions at once.
+
+    Sessions close their adapters when they are closed, so ``close`` is a no-op
+    here and the keep-alive sockets outlive any single service. Use ``shutdown``
+    to actually release the pool.
+    """
+
+    def __init__(self, stats: PoolStats, **kwargs) -> None:
+        self.stats = stats
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _counting_pool(HTTPConnectionPool, self.stats),
+            "https": _counting_pool(HTTPSConnectionPool, self.stats),
+        }
+
+    def close(self) -> None:
+        pass
+
+    def shutdown(self) -> None:
+        super().close()
 
 
 class ApiClient:
+    """
+    Owns the process-wide connection pool shared by every service.
+
+    Each service is still its own ``requests.Session`` (headers and cookies stay
+    isolated through ``CookieHeaderStore``), but all of them send through the same
+    adapter, so TCP/TLS connections are reused across services and fixtures.
+
+    Pool settings are read from the environment the first time the pool is used,
+    unless ``configure`` was called before:
+        POOL_CONNECTIONS: number of hosts to keep a pool for (default 10).
+        POOL_MAXSIZE: keep-alive connections kept per host (default 10).
+        POOL_BLOCK: "true" to wait for a free connection when a host pool is
+            exhausted instead of opening a throwaway one (default false).
+    """
+
     def __init__(self):
+        self.stats = PoolStats()
+        self._adapter: Optional[SharedHTTPAdapter] = None
+        # Pools replaced by ``configure``, still used by older services
+        self._retired: List[SharedHTTPAdapter] = []
+        self._cassette_adapter: Optional["CassetteAdapter"] = None
+        self._lock = threading.Lock()
         self.client = requests.Session()
         self.client.headers.update(
             {"Content-Type": "application/json", "Accept": "application/json"}
         )
 
+    @property
+    def adapter(self) -> SharedHTTPAdapter:
+        if self._adapter is None:
+            with self._lock:
+                if self._adapter is None:
+                    self._adapter = self._build_adapter(
+                        pool_connections=int(
+                            settings_instance.get("POOL_CONNECTIONS", 10)
+                        ),
+                        pool_maxsize=int(settings_instance.get("POOL_MAXSIZE", 10)),
+                        pool_block=settings_instance.get("POOL_BLOCK", "false").lower()
+                        == "true",
+                    )
+        return self._adapter
+
+    def configure(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+    ) -> None:
+        """
+        Replaces the shared pool for services created from now on. Services
+        created before this call keep sending through the previous one (and its
+        keep-alive connections), which is only shut down by ``close``.
+        """
+        with self._lock:
+            if self._adapter is not None:
+                self._retired.append(self._adapter)
+            self._adapter = self._build_adapter(
+                pool_connections, pool_maxsize, pool_block
+            )
+
+    def mount(self, session: requests.Session) -> None:
+        adapter = self._cassette_adapter or self.adapter
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+    def use_cassette(
+        self,
+        path: str,
+        mode: "CassetteMode",
+        latency_scale: float = 0.0,
+        passthrough_hosts: Iterable[str] = (),
+    ) -> "Cassette":
+        """
+        Sends the requests of services created from now on through a cassette:
+        recorded to ``path`` (saved by ``eject_cassette``) or replayed from it.
+        See CassetteAdapter for ``latency_scale`` and ``passthrough_hosts``.
+        """
+        from src.base.cassette import Cassette, CassetteAdapter, CassetteMode
+
+        cassette = Cassette(path)
+        if mode == CassetteMode.RECORD:
+            cassette.exchanges.clear()
+        self._cassette_adapter = CassetteAdapter(
+            cassette, mode, self.adapter, latency_scale, passthrough_hosts
+        )
+        return cassette
+
+    def eject_cassette(self) -> None:
+        """
+        Goes back to the network for new services, saving the cassette if recording.
+        """
+        adapter, self._cassette_adapter = self._cassette_adapter, None
+        if adapter and adapter.mode.name == "RECORD":
+            adapter.cassette.save()
+
+    def close(self) -> None:
+        with self._lock:
+            for adapter in self._retired:
+                adapter.shutdown()
+            self._retired.clear()
+            if self._adapter is not None:
+                self._adapter.shutdown()
+                self._adapter = None
+
+    def _build_adapter(
+        self, pool_connections: int, pool_maxsize: int, pool_block: bool
+    ) -> SharedHTTPAdapter:
+        adapter = SharedHTTPAdapter(
+            self.stats,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.client.mount("http://", adapter)
+        self.client.mount("https://", adapter)
+        return adapter
+
 
 api_client_instance = ApiClient()
@@ -0,0 +1,297 @@
+import asyncio
+import os
+from http import HTTPMethod
+from time import perf_counter_ns
+from types import SimpleNamespace
+from typing import Any, Dict, Optional, Type
+
+import aiohttp
+
+from src.base.auth import Authenticator, AuthMethod
+from src.base.cookie_store import CookieHeaderStore
+from src.base.decoding import DecodeMode
+from src.base.encoding import encode_payload
+from src.base.metrics import metrics_instance
+from src.base.rate_limit import rate_limiter_instance
+from src.base.service_base import T
+from src.base.session_manager import SessionManager
+from src.base.settings import settings_instance
+from src.models.requests.credentials.credentials_model import CredentialsModel
+from src.models.responses.auth.auth_response import AuthResponse
+from src.models.responses.base.response import Response, Timings
+
+# Seconds the token lookup waits for POST /auth on the event loop
+AUTH_TIMEOUT = 30.0
+
+
+class AsyncServiceBase:
+    """
+    Asyncio counterpart of ServiceBase. Should be inherited by async service implementations.
+
+    Requests are sent through an ``aiohttp.ClientSession`` so a single worker can keep
+    many calls in flight (e.g. with ``asyncio.gather``). Verb methods, response
+    model parsing and the ``Response`` envelope behave like the sync version.
+    The client session is bound to the event loop of the first request.
+
+    Example:
+        class AsyncUserService(AsyncServiceBase):
+            def __init__(self):
+                super().__init__("users", base_url="https://api.example.com")
+
+        async with AsyncUserService() as service:
+            responses = await asyncio.gather(*(service.get(url) for url in urls))
+    """
+
+    def __init__(
+        self,
+        path: str = "",
+        base_url: str = "",
+        store_name: str = None,
+        max_connections: int = 100,
+    ) -> None:
+        self.base_url = base_url or settings_instance.get("BASE_URL")
+        if not self.base_url:
+            raise ValueError("A valid base_url must be provided.")
+        self.max_connections = max_connections
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.headers: Dict[str, str] = {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+        self.cookies: Dict[str, str] = {}
+        self.url = f"{self.base_url}/{path.strip('/')}"
+        self.default_config: Dict[str, Any] = {}
+        self.decode_mode = DecodeMode.STANDARD
+
+        if not store_name:
+            store_name = os.urandom(15).hex()
+        self.store = CookieHeaderStore(store_name)
+        self.headers.update(self.store.headers)
+        self.cookies.update(self.store.cookies)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections),
+                trace_configs=[_connect_timing()],
+            )
+        return self.session
+
+    async def aclose(self) -> None:
+        if self.session is not None:
+            await self.session.close()
+
+    async def __aenter__(self) -> "AsyncServiceBase":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def get(
+        self, url: str, response_model: Type[T] = None, **kwargs: Any
+    ) -> Response[T]:
+        return await self._request(
+            HTTPMethod.GET, url, response_model=response_model, **kwargs
+        )
+
+    async def post(
+        self,
+        url: str,
+        data: Optional[Any] = None,
+        response_model: Type[T] = None,
+        **kwargs: Any,
+    ) -> Response[T]:
+        return await self._request(
+            HTTPMethod.POST, url, data, response_model=response_model, **kwargs
+        )
+
+    async def put(
+        self,
+        url: str,
+        data: Optional[Any] = None,
+        response_model: Type[T] = None,
+        **kwargs: Any,
+    ) -> Response[T]:
+        return await self._request(
+            HTTPMethod.PUT, url, data, response_model=response_model, **kwargs
+        )
+
+    async def patch(
+        self,
+        url: str,
+        data: Optional[Any] = None,
+        response_model: Type[T] = None,
+        **kwargs: Any,
+    ) -> Response[T]:
+        return await self._request(
+            HTTPMethod.PATCH, url, data, response_model=response_model, **kwargs
+        )
+
+    async def delete(
+        self, url: str, response_model: Type[T] = None, **kwargs: Any
+    ) -> Response[T]:
+        return await self._request(
+            HTTPMethod.DELETE, url, response_model=response_model, **kwargs
+        )
+
+    async def options(
+        self, url: str, response_model: Type[T] = None, **kwargs: Any
+    ) -> Response[T]:
+        return await self._request(
+            HTTPMethod.OPTIONS, url, response_model=response_model, **kwargs
+        )
+
+    async def head(
+        self, url: str, response_model: Type[T] = None, **kwargs: Any
+    ) -> Response[T]:
+        return await self._request(
+            HTTPMethod.HEAD, url, response_model=response_model, **kwargs
+        )
+
+    async def trace(
+        self, url: str, response_model: Type[T] = None, **kwargs: Any
+    ) -> Response[T]:
+        return await self._request(
+            HTTPMethod.TRACE, url, response_model=response_model, **kwargs
+        )
+
+    async def connect(
+        self, url: str, response_model: Type[T] = None, **kwargs: Any
+    ) -> Response[T]:
+        return await self._request(
+            HTTPMethod.CONNECT, url, response_model=response_model, **kwargs
+        )
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Any] = None,
+        config: Optional[Dict[str, Any]] = None,
+        response_model: Type[T] = None,
+        decode_mode: Optional[DecodeMode] = None,
+        **kwargs: Any,
+    ) -> Response[T]:
+        config = config or self.default_config
+        start = perf_counter_ns()
+        timings = Timings()
+
+        body = encode_payload(data)
+
+        options = {**config, **kwargs}
+        headers = {**self.headers, **options.pop("headers", {})}
+        cookies = {**self.cookies, **options.pop("cookies", {})}
+        trace_context = SimpleNamespace(connect_ns=0)
+
+        throttled = await rate_limiter_instance.acquire_async(url)
+        timings.throttle_ns = int(throttled * 1_000_000_000)
+
+        sent = perf_counter_ns()
+        async with self._get_session().request(
+            method,
+            url,
+            data=body,
+            headers=headers,
+            cookies=cookies,
+            trace_request_ctx=trace_context,
+            **options,
+        ) as response:
+            headers_received = perf_counter_ns()
+            content = await response.read()
+        downloaded = perf_counter_ns()
+
+        timings.connect_ns = trace_context.connect_ns
+        timings.ttfb_ns = headers_received - sent - timings.connect_ns
+        timings.download_ns = downloaded - headers_received
+
+        timings.total_ns = perf_counter_ns() - start
+        metrics_instance.record(method, url, response.status, timings)
+
+        return Response(
+            response.status,
+            response.headers,
+            content,
+            response_model,
+            response.charset,
+            decode_mode or self.decode_mode,
+            timings,
+        )
+
+    async def authenticate(
+        self,
+        auth_method: AuthMethod = AuthMethod.USERNAME_PASSWORD,
+        credentials: Dict[str, Any] = None,
+    ) -> None:
+        """
+        Uses the specified authentication method to generate the auth headers.
+
+        Args:
+            auth_method (AuthMethod): The authentication method to use.
+            credentials (Dict[str, Any]): A dictionary of credentials.
+                Same shapes as ServiceBase.authenticate.
+        """
+        if not credentials:
+            credentials = {
+                "username": settings_instance.get("USERNAME"),
+                "password": settings_instance.get("PASSWORD"),
+            }
+
+        auth_config = Authenticator.authenticate(auth_method, credentials)
+
+        if auth_method != AuthMethod.USERNAME_PASSWORD:
+            self.default_config = auth_config
+            return
+
+        username = credentials.get("username")
+        password = credentials.get("password")
+        token = await self._get_or_create_token(username, password)
+        self.store.headers["Cookie"] = f"token={token}"
+        self.headers.update(self.store.headers)
+
+    async def _get_or_create_token(self, username: str, password: str) -> str:
+        # SessionManager collapses concurrent refreshes with blocking locks (and
+        # the file lock of a shared store), so the lookup runs in a thread while
+        # the POST /auth itself runs on this loop. The fetcher only works while
+        # the loop runs, so it is not handed to the background renewal
+        loop = asyncio.get_running_loop()
+
+        async def post_credentials() -> str:
+            credentials_req = CredentialsModel(username=username, password=password)
+            response = await self.post(f"{self.base_url}/auth", data=credentials_req)
+            return AuthResponse.model_validate(response.data).token
+
+        def fetch_token() -> str:
+            if not loop.is_running():
+                raise RuntimeError("The event loop of the async service has stopped")
+            future = asyncio.run_coroutine_threadsafe(post_credentials(), loop)
+            try:
+                return future.result(timeout=AUTH_TIMEOUT)
+            except TimeoutError:
+                future.cancel()
+                raise
+
+        return await asyncio.to_thread(
+            SessionManager.get_or_create_token,
+            username,
+            password,
+            fetch_token,
+            renew_in_background=False,
+        )
+
+
+def _connect_timing() -> aiohttp.TraceConfig:
+    """
+    Records the time spent opening a new connection (DNS lookup included) in the
+    ``trace_request_ctx`` passed to each request.
+    """
+
+    async def on_start(session, context, params) -> None:
+        context.connect_start = perf_counter_ns()
+
+    async def on_end(session, context, params) -> None:
+        context.trace_request_ctx.connect_ns = perf_counter_ns() - context.connect_start
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_connection_create_start.append(on_start)
+    trace_config.on_connection_create_end.append(on_end)
+    return trace_config
@@ -0,0 +1,247 @@
+from itertools import islice
+from time import perf_counter_ns
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from pydantic import BaseModel
+
+from src.base.decoding import type_adapter
+from src.models.responses.base.response import Response
+
+T = TypeVar("T")
+ItemT = TypeVar("ItemT")
+
+
+class BulkFailure:
+    """
+    An item of a bulk operation that raised, that got an error status (>= 400),
+    or whose body did not validate (``error`` is then the ValidationError).
+    """
+
+    def __init__(
+        self,
+        index: int,
+        item: Any,
+        error: Optional[BaseException] = None,
+        response: Optional[Response] = None,
+    ) -> None:
+        self.index = index
+        self.item = item
+        self.error = error
+        self.response = response
+
+    def __repr__(self) -> str:
+        reason = repr(self.error) if self.error else f"status {self.response.status}"
+        return f"BulkFailure(index={self.index}, {reason})"
+
+
+class BulkResult(Generic[T]):
+    """
+    Outcome of a bulk operation.
+
+    ``responses`` follows the input order of ``items``, with None for items that
+    raised. ``failures`` lists every failed item, ordered by index.
+    """
+
+    def __init__(
+        self,
+        responses: List[Optional[Response[T]]],
+        failures: List[BulkFailure],
+        items: Optional[List[Any]] = None,
+    ) -> None:
+        self.responses = responses
+        self.failures = failures
+        self.items = items if items is not None else []
+
+    @property
+    def succeeded(self) -> bool:
+        return not self.failures
+
+    def __len__(self) -> int:
+        return len(self.responses)
+
+    def __iter__(self) -> Iterator[Optional[Response[T]]]:
+        return iter(self.responses)
+
+    def __getitem__(self, index: int) -> Optional[Response[T]]:
+        return self.responses[index]
+
+
+def run_bulk(
+    operation: Callable[[ItemT], Response[T]],
+    items: Sequence[ItemT],
+    concurrency: int = 10,
+) -> BulkResult[T]:
+    """
+    Runs ``operation`` for every item on a pool of at most ``concurrency`` threads.
+
+    Failures are collected instead of aborting the whole batch. Keep
+    ``concurrency`` within the connection pool size (POOL_MAXSIZE) so every
+    thread can reuse a keep-alive connection.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    items = list(items)
+    if not items:
+        return BulkResult([], [])
+
+    def call(item: ItemT) -> Any:
+        try:
+            return operation(item)
+        except Exception as error:
+            return error
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(items))) as executor:
+        outcomes = list(executor.map(call, items))
+    return _collect(items, outcomes)
+
+
+async def run_bulk_async(
+    operation: Callable[[ItemT], Awaitable[Response[T]]],
+    items: Sequence[ItemT],
+    concurrency: int = 100,
+) -> BulkResult[T]:
+    """
+    Async counterpart of run_bulk: at most ``concurrency`` operations are awaited
+    at the same time.
+    """
+    import asyncio
+
+    items = list(items)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def call(item: ItemT) -> Any:
+        async with semaphore:
+            try:
+                return await operation(item)
+            except Exception as error:
+                return error
+
+    outcomes = await asyncio.gather(*(call(item) for item in items))
+    return _collect(items, outcomes)
+
+
+def iter_bulk(
+    operation: Callable[[ItemT], Response[T]],
+    items: Iterable[ItemT],
+    concurrency: int = 10,
+) -> Iterator[Tuple[int, ItemT, Union[Response[T], BulkFailure]]]:
+    """
+    Like run_bulk, but yields ``(index, item, outcome)`` as soon as each operation
+    completes, in completion order. ``index`` is the position of the item in
+    ``items``. The outcome is the Response, or a BulkFailure when the operation
+    raised or got an error status.
+
+    Items are consumed lazily and at most ``2 * concurrency`` operations are
+    queued, so very long id lists do not pile up futures. Stopping the iteration
+    early cancels the operations that have not started.
+    """
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+    items = iter(enumerate(items))
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    pending: Dict[Any, Tuple[int, ItemT]] = {}
+    try:
+        while True:
+            for index, item in islice(items, 2 * concurrency - len(pending)):
+                pending[executor.submit(operation, item)] = (index, item)
+            if not pending:
+                return
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, item = pending.pop(future)
+                error = future.exception()
+                if error is not None:
+                    yield index, item, BulkFailure(index, item, error=error)
+                elif future.result().status >= 400:
+                    yield index, item, BulkFailure(
+                        index, item, response=future.result()
+                    )
+                else:
+                    yield index, item, future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def validate_bulk(result: BulkResult, item_model: Type[BaseModel]) -> int:
+    """
+    Validates the bodies of the successful, not yet parsed responses of
+    ``result`` against ``item_model`` in a single TypeAdapter call and stores
+    the results as their ``data``. Returns the number of responses validated.
+
+    If some body does not match the model, every body is validated on its own.
+    The ones that don't match are moved to ``result.failures`` (their response
+    becomes None, as for items that raised), rather than being parsed on
+    access into their raw text.
+    """
+    pending = [
+        (index, response)
+        for index, response in enumerate(result.responses)
+        if response is not None
+        and response.status < 400
+        and response.content is not None
+    ]
+    if not pending:
+        return 0
+
+    started = perf_counter_ns()
+    body = b"[" + b",".join(response.content for _, response in pending) + b"]"
+    try:
+        items = type_adapter(List[item_model]).validate_json(body)
+    except ValueError:
+        return _validate_each(result, pending, item_model)
+    validation_ns = (perf_counter_ns() - started) // len(pending)
+    for (_, response), item in zip(pending, items):
+        response.set_data(item, validation_ns)
+    return len(pending)
+
+
+def _validate_each(
+    result: BulkResult,
+    pending: List[Tuple[int, Response]],
+    item_model: Type[BaseModel],
+) -> int:
+    adapter = type_adapter(item_model)
+    validated = 0
+    for index, response in pending:
+        started = perf_counter_ns()
+        try:
+            item = adapter.validate_json(response.content)
+        except ValueError as error:
+            result.responses[index] = None
+            result.failures.append(
+                BulkFailure(index, result.items[index], error=error, response=response)
+            )
+            continue
+        response.set_data(item, perf_counter_ns() - started)
+        validated += 1
+    result.failures.sort(key=lambda failure: failure.index)
+    return validated
+
+
+def _collect(items: List[Any], outcomes: List[Any]) -> BulkResult:
+    responses: List[Optional[Response]] = []
+    failures: List[BulkFailure] = []
+    for index, (item, outcome) in enumerate(zip(items, outcomes)):
+        if isinstance(outcome, BaseException):
+            responses.append(None)
+            failures.append(BulkFailure(index, item, error=outcome))
+            continue
+        responses.append(outcome)
+        if outcome.status >= 400:
+            failures.append(BulkFailure(index, item, response=outcome))
+    return BulkResult(responses, failures, items)
@@ -0,0 +1,204 @@
+import base64
+import gzip
+import hashlib
+import json
+import os
+import threading
+from datetime import timedelta
+from enum import Enum, auto
+from io import BytesIO
+from time import perf_counter_ns, sleep
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3 import HTTPResponse
+
+# The recorded body is already decoded and whole
+_TRANSPORT_HEADERS = {"content-encoding", "transfer-encoding", "content-length"}
+
+
+class CassetteMode(Enum):
+    """
+    RECORD: requests go to the server and every exchange is saved to the cassette.
+    REPLAY: requests are answered from the cassette, nothing is sent.
+    """
+
+    RECORD = auto()
+    REPLAY = auto()
+
+
+class CassetteMissError(LookupError):
+    """
+    Raised in replay mode for a request that was never recorded.
+    """
+
+
+def request_key(method: str, url: str, body: Any) -> str:
+    """
+    Index key of an exchange: method, full URL (query included) and a hash of
+    the request body.
+    """
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    body_hash = hashlib.sha256(body or b"").hexdigest()[:16]
+    return f"{method.upper()} {url} {body_hash}"
+
+
+class Cassette:
+    """
+    Recorded HTTP exchanges, stored as gzipped JSON lines (one exchange per line).
+
+    Exchanges are indexed by ``request_key``. The same request recorded several
+    times is replayed in the recorded order, and its last response is repeated
+    once the recordings run out.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.exchanges: Dict[str, List[Dict[str, Any]]] = {}
+        self._positions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            self.load()
+
+    def __len__(self) -> int:
+        return sum(len(exchanges) for exchanges in self.exchanges.values())
+
+    def load(self) -> None:
+        with gzip.open(self.path, "rt", encoding="utf-8") as file:
+            for line in file:
+                exchange = json.loads(line)
+                self.exchanges.setdefault(exchange["key"], []).append(exchange)
+
+    def save(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            exchanges = [item for items in self.exchanges.values() for item in items]
+        with gzip.open(self.path, "wt", encoding="utf-8") as file:
+            for exchange in exchanges:
+                file.write(json.dumps(exchange, separators=(",", ":")) + "\n")
+
+    def record(
+        self,
+        request: requests.PreparedRequest,
+        response: requests.Response,
+        elapsed_ns: int,
+    ) -> None:
+        content = response.content
+        try:
+            body = {"text": content.decode("utf-8")}
+        except UnicodeDecodeError:
+            body = {"base64": base64.b64encode(content).decode("ascii")}
+        exchange = {
+            "key": request_key(request.method, request.url, request.body),
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": {
+                name: value
+                for name, value in response.headers.items()
+                if name.lower() not in _TRANSPORT_HEADERS
+            },
+            "elapsed_ns": elapsed_ns,
+            **body,
+        }
+        with self._lock:
+            self.exchanges.setdefault(exchange["key"], []).append(exchange)
+
+    def play(self, request: requests.PreparedRequest) -> Dict[str, Any]:
+        """
+        Raises:
+            CassetteMissError: If the request was not recorded.
+        """
+        key = request_key(request.method, request.url, request.body)
+        with self._lock:
+            exchanges = self.exchanges.get(key)
+            if not exchanges:
+                raise CassetteMissError(f"No recorded response for {key}")
+            position = self._positions.get(key, 0)
+            self._positions[key] = position + 1
+        return exchanges[min(position, len(exchanges) - 1)]
+
+    def rewind(self) -> None:
+        with self._lock:
+            self._positions.clear()
+
+
+class CassetteAdapter(BaseAdapter):
+    """
+    Transport adapter that records exchanges sent through ``adapter`` or replays
+    them from the cassette.
+
+    In replay mode the recorded response time is slept for, scaled by
+    ``latency_scale`` (0 replays instantly, 1.0 at the recorded speed).
+    Requests to ``passthrough_hosts`` (e.g. the local stub server) always go
+    through ``adapter`` and are not recorded.
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        mode: CassetteMode,
+        adapter: Optional[HTTPAdapter] = None,
+        latency_scale: float = 0.0,
+        passthrough_hosts: Iterable[str] = (),
+    ) -> None:
+        super().__init__()
+        if adapter is None and (mode == CassetteMode.RECORD or passthrough_hosts):
+            raise ValueError("Recording and passthrough need an adapter to send to")
+        self.cassette = cassette
+        self.mode = mode
+        self.adapter = adapter
+        self.latency_scale = latency_scale
+        self.passthrough_hosts = set(passthrough_hosts)
+
+    def send(
+        self, request: requests.PreparedRequest, **kwargs: Any
+    ) -> requests.Response:
+        if urlsplit(request.url).hostname in self.passthrough_hosts:
+            return self.adapter.send(request, **kwargs)
+        if self.mode == CassetteMode.RECORD:
+            start = perf_counter_ns()
+            response = self.adapter.send(request, **kwargs)
+            response.content  # read the body so it can be recorded
+            self.cassette.record(request, response, perf_counter_ns() - start)
+            return response
+
+        exchange = self.cassette.play(request)
+        if self.latency_scale:
+            sleep(exchange["elapsed_ns"] * self.latency_scale / 1_000_000_000)
+        return self._build_response(request, exchange)
+
+    def close(self) -> None:
+        pass
+
+    @staticmethod
+    def _build_response(
+        request: requests.PreparedRequest, exchange: Dict[str, Any]
+    ) -> requests.Response:
+        if "base64" in exchange:
+            content = base64.b64decode(exchange["base64"])
+        else:
+            content = exchange["text"].encode("utf-8")
+
+        response = requests.Response()
+        response.status_code = exchange["status"]
+        response.reason = exchange["reason"]
+        response.headers = CaseInsensitiveDict(exchange["headers"])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.raw = HTTPResponse(
+            body=BytesIO(content),
+            headers=exchange["headers"],
+            status=exchange["status"],
+            preload_content=False,
+        )
+        response._content = content
+        response.url = request.url
+        response.request = request
+        response.elapsed = timedelta(microseconds=exchange["elapsed_ns"] // 1000)
+        return response
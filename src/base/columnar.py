@@ -0,0 +1,240 @@
+import json
+import struct
+import sys
+from array import array
+from datetime import date, timedelta
+from typing import Any, Dict, Iterator, List, Mapping, Optional
+
+_MAGIC = b"COLS1\n"
+_EPOCH = date(1970, 1, 1)
+MISSING_DATE = -(2**31)
+
+
+class Column:
+    """
+    A typed column backed by stdlib ``array`` buffers (one machine value per
+    row, no per-row Python object). ``kind`` selects the storage:
+
+    int: signed 64-bit integers. float: doubles. bool: one byte per row.
+    date: days since 1970-01-01 as 32-bit integers (ISO ``YYYY-MM-DD`` in and
+        ``datetime.date`` out); missing or malformed dates are stored as
+        MISSING_DATE and read as None.
+    """
+
+    _TYPECODES = {"int": "q", "float": "d", "bool": "b", "date": "i"}
+
+    def __init__(self, kind: str) -> None:
+        if kind not in self._TYPECODES:
+            raise ValueError(f"Unsupported column kind: {kind}")
+        self.kind = kind
+        self.values = array(self._TYPECODES[kind])
+
+    def append(self, value: Any) -> None:
+        if self.kind == "date":
+            value = _to_days(value)
+        self.values.append(value)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, index: int) -> Any:
+        value = self.values[index]
+        if self.kind == "bool":
+            return bool(value)
+        if self.kind == "date":
+            return None if value == MISSING_DATE else _EPOCH + timedelta(days=value)
+        return value
+
+    def __iter__(self) -> Iterator[Any]:
+        return (self[index] for index in range(len(self)))
+
+    def sum(self) -> Any:
+        return sum(self.values)
+
+    def count(self, value: Any = True) -> int:
+        """
+        Rows equal to ``value`` (e.g. ``count(True)`` on a bool column).
+        """
+        if self.kind == "date":
+            value = _to_days(value)
+        return self.values.count(int(value) if self.kind == "bool" else value)
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.values) * self.values.itemsize
+
+    def buffers(self) -> List[bytes]:
+        return [_little_endian(self.values).tobytes()]
+
+    def load_buffers(self, buffers: List[bytes]) -> None:
+        self.values.frombytes(buffers[0])
+        if sys.byteorder == "big":
+            self.values.byteswap()
+
+    def to_numpy(self) -> Any:
+        import numpy
+
+        values = numpy.frombuffer(self.values, dtype=self.values.typecode)
+        if self.kind == "bool":
+            return values.astype(bool)
+        if self.kind == "date":
+            dates = values.astype("datetime64[D]")
+            dates[values == MISSING_DATE] = numpy.datetime64("NaT")
+            return dates
+        return values.copy()
+
+
+class StringColumn(Column):
+    """
+    UTF-8 strings stored Arrow-style: one contiguous byte buffer plus the end
+    offset of every value.
+    """
+
+    def __init__(self) -> None:
+        self.kind = "str"
+        self.data = bytearray()
+        self.offsets = array("q")
+
+    def append(self, value: Optional[str]) -> None:
+        self.data += (value or "").encode("utf-8")
+        self.offsets.append(len(self.data))
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += len(self)
+        start = self.offsets[index - 1] if index else 0
+        return self.data[start : self.offsets[index]].decode("utf-8")
+
+    def sum(self) -> Any:
+        raise TypeError("Cannot sum a string column.")
+
+    def count(self, value: Any = True) -> int:
+        return sum(1 for item in self if item == value)
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.data) + len(self.offsets) * self.offsets.itemsize
+
+    def buffers(self) -> List[bytes]:
+        return [_little_endian(self.offsets).tobytes(), bytes(self.data)]
+
+    def load_buffers(self, buffers: List[bytes]) -> None:
+        self.offsets.frombytes(buffers[0])
+        if sys.byteorder == "big":
+            self.offsets.byteswap()
+        self.data = bytearray(buffers[1])
+
+    def to_numpy(self) -> Any:
+        import numpy
+
+        return numpy.array(list(self), dtype=str)
+
+
+class ColumnTable:
+    """
+    Columnar storage for large result sets: rows are appended one at a time
+    (e.g. while a bulk fetch streams in) and kept as typed column buffers, a few
+    bytes per value instead of a pydantic model per row. Aggregates run over the
+    buffers (``table["totalprice"].sum()``, ``table["depositpaid"].count(True)``)
+    and ``to_numpy`` hands them to numpy when it is installed.
+
+    ``save`` writes a compact binary file: a JSON header followed by the raw
+    little-endian buffers, which ``load`` (or ``numpy.frombuffer``) reads back.
+
+    Example:
+        table = ColumnTable({"bookingid": "int", "firstname": "str"})
+        table.append({"bookingid": 1, "firstname": "Jim"})
+    """
+
+    def __init__(self, schema: Mapping[str, str]) -> None:
+        self.schema = dict(schema)
+        self.columns: Dict[str, Column] = {
+            name: StringColumn() if kind == "str" else Column(kind)
+            for name, kind in self.schema.items()
+        }
+
+    def append(self, row: Mapping[str, Any]) -> None:
+        for name, column in self.columns.items():
+            column.append(row[name])
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()), ()))
+
+    def __getitem__(self, name: str) -> Column:
+        return self.columns[name]
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        for index in range(len(self)):
+            yield {name: column[index] for name, column in self.columns.items()}
+
+    @property
+    def nbytes(self) -> int:
+        return sum(column.nbytes for column in self.columns.values())
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """
+        The columns as numpy arrays (requires numpy).
+        """
+        return {name: column.to_numpy() for name, column in self.columns.items()}
+
+    def save(self, path: str) -> None:
+        buffers = {name: column.buffers() for name, column in self.columns.items()}
+        header = json.dumps(
+            {
+                "rows": len(self),
+                "columns": [
+                    {
+                        "name": name,
+                        "kind": self.schema[name],
+                        "buffers": [len(buffer) for buffer in buffers[name]],
+                    }
+                    for name in self.columns
+                ],
+            }
+        ).encode("utf-8")
+        with open(path, "wb") as file:
+            file.write(_MAGIC)
+            file.write(struct.pack("<I", len(header)))
+            file.write(header)
+            for column_buffers in buffers.values():
+                for buffer in column_buffers:
+                    file.write(buffer)
+
+    @classmethod
+    def load(cls, path: str) -> "ColumnTable":
+        """
+        Raises:
+            ValueError: If ``path`` is not a file written by ``save``.
+        """
+        with open(path, "rb") as file:
+            if file.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError(f"{path} is not a column table file")
+            (header_length,) = struct.unpack("<I", file.read(4))
+            header = json.loads(file.read(header_length))
+            table = cls(
+                {column["name"]: column["kind"] for column in header["columns"]}
+            )
+            for column in header["columns"]:
+                table[column["name"]].load_buffers(
+                    [file.read(length) for length in column["buffers"]]
+                )
+        return table
+
+
+def _to_days(value: Any) -> int:
+    if isinstance(value, date):
+        return (value - _EPOCH).days
+    try:
+        return (date.fromisoformat(value) - _EPOCH).days
+    except (TypeError, ValueError):
+        return MISSING_DATE
+
+
+def _little_endian(values: array) -> array:
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values
@@ -0,0 +1,53 @@
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Iterable, Optional, Tuple
+
+# Content codings the HTTP clients decode, and the packages they need for it
+# (urllib3 and httpx decode gzip and deflate with the standard library)
+_DECODER_PACKAGES = {
+    "gzip": (),
+    "deflate": (),
+    "br": ("brotli", "brotlicffi"),
+    "zstd": ("zstandard",),
+}
+
+
+@lru_cache(maxsize=None)
+def supported_encodings() -> Tuple[str, ...]:
+    """
+    The response content codings that can be decoded with the installed
+    packages, in order of preference for ``Accept-Encoding``.
+    """
+    preferred = ("zstd", "br", "gzip", "deflate")
+    return tuple(
+        encoding
+        for encoding in preferred
+        if not _DECODER_PACKAGES[encoding]
+        or any(find_spec(package) for package in _DECODER_PACKAGES[encoding])
+    )
+
+
+def accept_encoding(encodings: Optional[Iterable[str]] = None) -> str:
+    """
+    The ``Accept-Encoding`` header value for ``encodings`` (all supported ones by
+    default). Codings that cannot be decoded here are left out, so asking for
+    ``["br", "gzip"]`` without brotli installed gives ``"gzip"``. ``identity``
+    (or an empty list) asks for uncompressed responses.
+
+    Example:
+        booking_service.headers["Accept-Encoding"] = accept_encoding(["gzip"])
+    """
+    if encodings is None:
+        return ", ".join(supported_encodings())
+    accepted = [
+        encoding
+        for encoding in (encoding.strip().lower() for encoding in encodings)
+        if encoding in supported_encodings()
+    ]
+    return ", ".join(accepted) or "identity"
+
+
+def gzip_body(body: bytes, level: int = 6) -> bytes:
+    import gzip
+
+    return gzip.compress(body, compresslevel=level, mtime=0)
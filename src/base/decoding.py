@@ -0,0 +1,189 @@
+import json
+from enum import Enum, auto
+from functools import lru_cache
+from time import perf_counter_ns
+from types import NoneType, UnionType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    List,
+    Optional,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel, TypeAdapter
+
+if TYPE_CHECKING:
+    from src.models.responses.base.response import Timings
+
+try:
+    import orjson
+
+    fast_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is optional
+    fast_loads = json.loads
+
+
+class DecodeMode(Enum):
+    """
+    How a response body is turned into ``Response.data``.
+
+    STANDARD: stdlib json, then ``model_validate`` per item (default).
+    FAST_JSON: orjson when installed, then ``model_validate`` per item.
+    JSON_BYTES: pydantic parses and validates straight from the body bytes.
+    BULK: fast JSON, then the whole payload is validated in one ``TypeAdapter`` call.
+    TRUSTED: fast JSON, then models are built without validation (``model_construct``).
+        pydantic-core validation is faster than ``model_construct`` for plain
+        models, so this only pays off for models with expensive custom validators.
+        Only use it for payloads known to match.
+    """
+
+    STANDARD = auto()
+    FAST_JSON = auto()
+    JSON_BYTES = auto()
+    BULK = auto()
+    TRUSTED = auto()
+
+
+def parse_response_data(
+    content: bytes,
+    response_model: Type = None,
+    encoding: Optional[str] = None,
+    decode_mode: DecodeMode = DecodeMode.STANDARD,
+    timings: Optional["Timings"] = None,
+) -> Any:
+    """
+    Decodes a response body and validates it against the given response model.
+
+    Works on the raw body bytes, so it is shared by the sync (requests) and
+    async (aiohttp) services. Falls back to the decoded text when the body is
+    not valid JSON or does not match the model. When ``timings`` is given, its
+    ``decode_ns`` and ``validation_ns`` are filled in.
+    """
+    start = decoded = perf_counter_ns()
+    try:
+        match decode_mode:
+            case DecodeMode.STANDARD:
+                raw_data = json.loads(content)
+                decoded = perf_counter_ns()
+                return _validate_items(raw_data, response_model)
+            case DecodeMode.FAST_JSON:
+                raw_data = fast_loads(content)
+                decoded = perf_counter_ns()
+                return _validate_items(raw_data, response_model)
+            case DecodeMode.JSON_BYTES:
+                if not response_model:
+                    raw_data = fast_loads(content)
+                    decoded = perf_counter_ns()
+                    return raw_data
+                if _is_model(response_model):
+                    return response_model.model_validate_json(content)
+                return type_adapter(response_model).validate_json(content)
+            case DecodeMode.BULK:
+                raw_data = fast_loads(content)
+                decoded = perf_counter_ns()
+                if not response_model:
+                    return raw_data
+                return type_adapter(response_model).validate_python(raw_data)
+            case DecodeMode.TRUSTED:
+                raw_data = fast_loads(content)
+                decoded = perf_counter_ns()
+                return construct(response_model, raw_data)
+            case _:
+                raise ValueError(f"Unsupported decode mode: {decode_mode}")
+    except ValueError:
+        return content.decode(encoding or "utf-8", errors="replace")
+    finally:
+        if timings is not None:
+            timings.decode_ns = decoded - start
+            timings.validation_ns = perf_counter_ns() - decoded
+
+
+def _validate_items(raw_data: Any, response_model: Type) -> Any:
+    if response_model and isinstance(raw_data, list):
+        model = get_args(response_model)[0]
+        return [model.model_validate(item) for item in raw_data]
+    if response_model:
+        return response_model.model_validate(raw_data)
+    return raw_data
+
+
+@lru_cache(maxsize=None)
+def type_adapter(response_model: Type) -> TypeAdapter:
+    return TypeAdapter(response_model)
+
+
+def construct(response_model: Type, raw_data: Any) -> Any:
+    """
+    Builds (nested) models from trusted data without running validation.
+    """
+    if response_model is None:
+        return raw_data
+    return _builder(response_model)(raw_data)
+
+
+@lru_cache(maxsize=None)
+def _builder(response_model: Type) -> Callable[[Any], Any]:
+    """
+    Compiles a function that builds ``response_model`` (a model or a list of
+    models) from decoded JSON, resolving the nested models of each field once.
+    """
+    if _is_model(response_model):
+        return _model_builder(response_model)
+    item_type = get_args(response_model)[0] if get_args(response_model) else None
+    if get_origin(response_model) in (list, List) and item_type is not None:
+        build_item = _builder(item_type)
+        return lambda raw: (
+            [build_item(item) for item in raw] if isinstance(raw, list) else raw
+        )
+    return lambda raw: raw
+
+
+def _model_builder(model: Type[BaseModel]) -> Callable[[Any], Any]:
+    """
+    Builds instances with ``model_construct`` (defaults, private attributes and
+    ``model_post_init`` included), after building the nested models of the
+    fields, which ``model_construct`` would leave as dicts.
+    """
+    fields = []
+    for name, field in model.model_fields.items():
+        nested_model = _nested_model(field.annotation)
+        build_nested = _builder(nested_model) if nested_model else None
+        fields.append((name, field.alias or name, build_nested))
+
+    def build(raw: Any) -> Any:
+        if not isinstance(raw, dict):
+            return raw
+        values = {}
+        for name, key, build_nested in fields:
+            if key in raw:
+                value = raw[key]
+                values[name] = build_nested(value) if build_nested else value
+        return model.model_construct(set(values), **values)
+
+    return build
+
+
+def _nested_model(annotation: Any) -> Optional[Type]:
+    """
+    Returns the type ``construct`` must recurse into for a field annotation:
+    a model, ``List[model]``, or None when the field holds plain values.
+    """
+    if _is_model(annotation):
+        return annotation
+    origin = get_origin(annotation)
+    if origin in (Union, UnionType):
+        candidates = [arg for arg in get_args(annotation) if arg is not NoneType]
+        return _nested_model(candidates[0]) if len(candidates) == 1 else None
+    if origin in (list, List) and get_args(annotation):
+        item_model = _nested_model(get_args(annotation)[0])
+        return List[item_model] if item_model else None
+    return None
+
+
+def _is_model(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
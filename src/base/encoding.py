@@ -0,0 +1,78 @@
+import json
+from functools import lru_cache
+from typing import Any, Callable, Optional, Type
+
+from pydantic import BaseModel
+
+from src.base.decoding import type_adapter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+def fast_dumps(payload: Any) -> bytes:
+    """
+    Compact JSON bytes, with orjson when installed and the stdlib otherwise (or
+    for values orjson does not support).
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload)
+        except TypeError:
+            pass
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+class EncodedPayload:
+    """
+    A request body serialized once and sent as is, for payloads reused across
+    calls (e.g. fixture bookings posted on every iteration).
+
+    Example:
+        payload = EncodedPayload(booking)
+        for _ in range(1000):
+            booking_service.add_booking(payload)
+    """
+
+    __slots__ = ("content",)
+
+    def __init__(self, data: Any, exclude_none: bool = True) -> None:
+        self.content = encode_payload(data, exclude_none)
+
+    def __repr__(self) -> str:
+        return f"EncodedPayload({self.content!r})"
+
+
+def encode_payload(data: Any, exclude_none: bool = True) -> Optional[bytes]:
+    """
+    Serializes a request body straight to JSON bytes.
+
+    Models go through their compiled pydantic-core serializer in a single pass,
+    instead of ``model_dump`` followed by a second ``json`` encoding. Lists of
+    models use a cached TypeAdapter, other values the fast encoder (orjson when
+    installed). ``exclude_none`` only applies to models.
+    """
+    if data is None:
+        return None
+    if isinstance(data, EncodedPayload):
+        return data.content
+    if isinstance(data, (bytes, bytearray)):
+        return bytes(data)
+    return _encoder(type(data), exclude_none)(data)
+
+
+@lru_cache(maxsize=None)
+def _encoder(payload_type: Type, exclude_none: bool) -> Callable[[Any], bytes]:
+    if issubclass(payload_type, BaseModel):
+        serializer = payload_type.__pydantic_serializer__
+        return lambda data: serializer.to_json(data, exclude_none=exclude_none)
+    return lambda data: _encode_value(data, exclude_none)
+
+
+def _encode_value(data: Any, exclude_none: bool) -> bytes:
+    if isinstance(data, list) and data and isinstance(data[0], BaseModel):
+        adapter = type_adapter(list[type(data[0])])
+        return adapter.dump_json(data, exclude_none=exclude_none)
+    return fast_dumps(data)
@@ -0,0 +1,118 @@
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional
+
+if TYPE_CHECKING:
+    from src.models.responses.base.response import Response, Timings
+
+
+class RequestContext:
+    """
+    One request going through ServiceBase, handed to every RequestHook stage.
+
+    ``options`` (headers, params, timeout...) can still be changed in
+    ``before_send``. ``status``, ``headers`` and ``content`` are set from
+    ``after_receive`` on, or ``error`` when sending raised. ``response`` is set
+    from ``before_parse`` on. ``state`` is scratch space for hooks, keyed by
+    the hook.
+    """
+
+    __slots__ = (
+        "service",
+        "method",
+        "url",
+        "body",
+        "options",
+        "timings",
+        "status",
+        "headers",
+        "content",
+        "error",
+        "response",
+        "state",
+    )
+
+    def __init__(
+        self,
+        service: Any,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        options: Dict[str, Any],
+        timings: "Timings",
+    ) -> None:
+        self.service = service
+        self.method = str(method).upper()
+        self.url = url
+        self.body = body
+        self.options = options
+        self.timings = timings
+        self.status: Optional[int] = None
+        self.headers: Optional[Mapping[str, str]] = None
+        self.content: Optional[bytes] = None
+        self.error: Optional[BaseException] = None
+        self.response: Optional["Response"] = None
+        self.state: Dict[Any, Any] = {}
+
+
+class RequestHook:
+    """
+    Called at each stage of the requests sent by ServiceBase. Subclass, override
+    the stages you need and register with ``request_hooks_instance.add_hook``.
+
+    before_send: the payload is encoded, nothing was sent yet.
+    after_receive: the response arrived (or ``context.error`` was raised);
+        ``timings.total_ns`` is final.
+    before_parse / after_parse: around the lazy parsing of ``Response.data``,
+        which only happens if the data is read. ``after_parse`` also runs when
+        parsing raised.
+    """
+
+    def before_send(self, context: RequestContext) -> None:
+        pass
+
+    def after_receive(self, context: RequestContext) -> None:
+        pass
+
+    def before_parse(self, context: RequestContext) -> None:
+        pass
+
+    def after_parse(self, context: RequestContext) -> None:
+        pass
+
+
+class RequestHooks:
+    """
+    Runs the registered RequestHooks for every request sent by ServiceBase.
+    Without hooks, a request costs a single list check and no RequestContext is
+    created.
+    """
+
+    def __init__(self) -> None:
+        self.hooks: List[RequestHook] = []
+
+    def add_hook(self, hook: RequestHook) -> RequestHook:
+        if hook not in self.hooks:
+            self.hooks.append(hook)
+        return hook
+
+    def remove_hook(self, hook: RequestHook) -> None:
+        if hook in self.hooks:
+            self.hooks.remove(hook)
+
+    def before_send(self, context: RequestContext) -> None:
+        for hook in list(self.hooks):
+            hook.before_send(context)
+
+    def after_receive(self, context: RequestContext) -> None:
+        for hook in list(self.hooks):
+            hook.after_receive(context)
+
+    def before_parse(self, context: RequestContext) -> None:
+        for hook in list(self.hooks):
+            hook.before_parse(context)
+
+    def after_parse(self, context: RequestContext) -> None:
+        for hook in list(self.hooks):
+            hook.after_parse(context)
+
+
+request_hooks_instance = RequestHooks()
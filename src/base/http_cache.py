@@ -0,0 +1,278 @@
+import base64
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from time import time
+from typing import Any, Dict, List, Mapping, Optional
+from urllib.parse import urlsplit
+
+from requests.models import PreparedRequest
+
+# Request headers that select whose view of a resource is returned
+CREDENTIAL_HEADERS = ("authorization", "cookie")
+
+
+class CacheStats:
+    """
+    Counters of an HttpCache.
+
+    A hit is a response served from the cache: either fresh (no request sent) or
+    revalidated (a conditional request answered with 304 Not Modified).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.fresh_hits = 0
+            self.revalidated_hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.invalidations = 0
+
+    def record(self, counter: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+    @property
+    def hits(self) -> int:
+        return self.fresh_hits + self.revalidated_hits
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "fresh_hits": self.fresh_hits,
+                "revalidated_hits": self.revalidated_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "hit_rate": self.hit_rate,
+            }
+
+
+class CacheEntry:
+    def __init__(
+        self,
+        status: int,
+        headers: Dict[str, str],
+        content: bytes,
+        stored_at: Optional[float] = None,
+    ) -> None:
+        self.status = status
+        self.headers = headers
+        self.content = content
+        self.stored_at = stored_at if stored_at is not None else time()
+
+    def validators(self) -> Dict[str, str]:
+        """
+        Conditional request headers built from the entry's ETag / Last-Modified.
+        """
+        headers = {}
+        for name, value in self.headers.items():
+            if name.lower() == "etag":
+                headers["If-None-Match"] = value
+            elif name.lower() == "last-modified":
+                headers["If-Modified-Since"] = value
+        return headers
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "headers": self.headers,
+            "content": base64.b64encode(self.content).decode("ascii"),
+            "stored_at": self.stored_at,
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "CacheEntry":
+        return cls(
+            data["status"],
+            data["headers"],
+            base64.b64decode(data["content"]),
+            data["stored_at"],
+        )
+
+
+class HttpCache:
+    """
+    Opt-in cache of GET/HEAD responses for ServiceBase.
+
+    Entries live in an in-memory LRU of at most ``max_entries`` and are fresh for
+    ``ttl`` seconds. A stale entry with an ETag or Last-Modified header is
+    revalidated with a conditional request instead of being fetched again.
+    With ``directory`` set, entries are also written to disk and survive the
+    process (e.g. across pytest runs).
+
+    Any other method sent to a resource invalidates it and the collections above
+    it: ``PUT /booking/5`` drops ``/booking/5`` and ``/booking?firstname=Jim``.
+    Entries are kept apart per credentials (``Authorization``, ``Cookie`` and the
+    session cookies), so a response is only served back to the same user.
+
+    Example:
+        cache = HttpCache(ttl=30)
+        booking_service.cache = cache
+        auth_booking_service.cache = cache  # share it to share invalidations
+    """
+
+    def __init__(
+        self, max_entries: int = 256, ttl: float = 60.0, directory: Optional[str] = None
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.directory = directory
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(
+        method: str,
+        url: str,
+        params: Any = None,
+        headers: Optional[Mapping[str, str]] = None,
+        cookies: Optional[Mapping[str, str]] = None,
+    ) -> str:
+        """
+        ``"<METHOD> <url>"``, followed by a hash of the credentials in ``headers``
+        and ``cookies`` when there are any (they are not kept in the cache).
+        """
+        prepared = PreparedRequest()
+        prepared.prepare_url(url, params)
+        key = f"{str(method).upper()} {prepared.url}"
+        credentials = sorted(
+            (name.lower(), value)
+            for name, value in (headers or {}).items()
+            if name.lower() in CREDENTIAL_HEADERS
+        ) + sorted((cookies or {}).items())
+        if credentials:
+            digest = hashlib.sha256(json.dumps(credentials).encode("utf-8"))
+            key = f"{key} {digest.hexdigest()[:32]}"
+        return key
+
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        """
+        Returns the entry for ``key`` (fresh or stale), or None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is None and self.directory:
+            entry = self._read(key)
+            if entry is not None:
+                self._put(key, entry)
+        return entry
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        return time() - entry.stored_at < self.ttl
+
+    def store(self, key: str, entry: CacheEntry) -> None:
+        cache_control = next(
+            (v for k, v in entry.headers.items() if k.lower() == "cache-control"), ""
+        )
+        if "no-store" in cache_control.lower():
+            return
+        self._put(key, entry)
+        if self.directory:
+            self._write(key, entry)
+
+    def revalidated(self, key: str, entry: CacheEntry) -> None:
+        """
+        Marks ``entry`` fresh again after a 304 Not Modified.
+        """
+        entry.stored_at = time()
+        self.stats.record("revalidated_hits")
+        self.store(key, entry)
+
+    def invalidate(self, url: str) -> int:
+        """
+        Drops the entries of the resource at ``url`` and of its parent collections.
+        Returns the number of entries dropped.
+        """
+        parts = urlsplit(url)
+        path = parts.path.rstrip("/")
+
+        def touched(key: str) -> bool:
+            entry_parts = urlsplit(key.split(" ")[1])
+            entry_path = entry_parts.path.rstrip("/")
+            return entry_parts.netloc == parts.netloc and (
+                entry_path == path or path.startswith(entry_path + "/")
+            )
+
+        with self._lock:
+            keys = {key for key in self._entries if touched(key)}
+            for key in keys:
+                del self._entries[key]
+        if self.directory:
+            # Entries evicted from memory may still be on disk
+            keys |= {key for key in self._disk_keys() if touched(key)}
+            for key in keys:
+                self._remove(key)
+        self.stats.record("invalidations", len(keys))
+        return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+        if self.directory:
+            for key in self._disk_keys():
+                self._remove(key)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _put(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.record("evictions")
+
+    def _path(self, key: str) -> str:
+        name = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{name}.json")
+
+    def _read(self, key: str) -> Optional[CacheEntry]:
+        try:
+            with open(self._path(key), encoding="utf-8") as file:
+                return CacheEntry.from_json(json.load(file))
+        except (FileNotFoundError, ValueError, KeyError):
+            return None
+
+    def _write(self, key: str, entry: CacheEntry) -> None:
+        path = self._path(key)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump({"key": key, **entry.to_json()}, file)
+        os.replace(temp_path, path)
+
+    def _disk_keys(self) -> List[str]:
+        keys = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(self.directory, name), encoding="utf-8") as file:
+                    keys.append(json.load(file)["key"])
+            except (FileNotFoundError, ValueError, KeyError):
+                continue
+        return keys
+
+    def _remove(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,314 @@
+import multiprocessing
+import queue
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from math import sqrt
+from time import perf_counter, perf_counter_ns, sleep
+from typing import Any, Dict, List, Optional, Type
+
+from src.base.metrics import HistogramSink, LatencyHistogram, metrics_instance
+from src.base.tracing import BatchSpanProcessor, FileSpanExporter, tracer_instance
+
+
+class Scenario:
+    """
+    One virtual user of a load test, written against the service classes.
+
+    ``setup`` runs once per virtual user (e.g. to create and authenticate its
+    services), ``run`` is a single iteration and should raise (an assertion or an
+    HTTP error) when it fails. Scenarios must be importable at module level when
+    the runner uses more than one process.
+
+    Example:
+        class GetBooking(Scenario):
+            def __init__(self, base_url: str):
+                self.base_url = base_url
+
+            def setup(self):
+                self.booking_service = BookingService(base_url=self.base_url)
+
+            def run(self):
+                assert self.booking_service.get_booking(1).status == 200
+    """
+
+    def setup(self) -> None:
+        pass
+
+    def run(self) -> None:
+        raise NotImplementedError
+
+    def teardown(self) -> None:
+        pass
+
+
+class LoadReport:
+    """
+    Outcome of a load run: throughput, error rate, scenario latency and the
+    latency of every request sent by the scenarios, per endpoint.
+    """
+
+    def __init__(
+        self,
+        iterations: int,
+        errors: int,
+        elapsed: float,
+        latency: LatencyHistogram,
+        requests: HistogramSink,
+        error_types: Dict[str, int],
+    ) -> None:
+        self.iterations = iterations
+        self.errors = errors
+        self.elapsed = elapsed
+        self.latency = latency
+        self.requests = requests
+        self.error_types = error_types
+
+    @property
+    def throughput(self) -> float:
+        return self.iterations / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.iterations if self.iterations else 0.0
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "iterations": self.iterations,
+            "errors": self.errors,
+            "error_rate": self.error_rate,
+            "throughput": self.throughput,
+            "p50_ms": self.latency.percentile_ms(50),
+            "p95_ms": self.latency.percentile_ms(95),
+            "p99_ms": self.latency.percentile_ms(99),
+            "max_ms": self.latency.max_ns / 1_000_000,
+        }
+
+    def format(self) -> List[str]:
+        summary = self.summary()
+        lines = [
+            f"iterations: {self.iterations} in {self.elapsed:.1f}s "
+            f"({summary['throughput']:.1f}/s)",
+            f"errors: {self.errors} ({summary['error_rate']:.2%})",
+            f"latency: p50 {summary['p50_ms']:.1f}ms, p95 {summary['p95_ms']:.1f}ms, "
+            f"p99 {summary['p99_ms']:.1f}ms, max {summary['max_ms']:.1f}ms",
+        ]
+        lines += [f"  {name}: {count}" for name, count in self.error_types.items()]
+        return lines + self.requests.format_summary()
+
+
+class LoadRunner:
+    """
+    Drives a Scenario for ``duration`` seconds.
+
+    Closed loop (default): ``concurrency`` virtual users each run iterations back
+    to back, so the load adapts to the response time.
+    Open loop (``rps`` set): iterations start at a fixed rate whatever the
+    response time, on up to ``concurrency`` virtual users. Latency is measured
+    from the scheduled start, so time spent queued behind a slow system counts.
+
+    ``ramp_up`` seconds are spent starting the users (closed loop) or raising the
+    rate linearly to ``rps`` (open loop). ``processes`` > 1 splits users and rate
+    across worker processes, to use more than one core.
+
+    ``trace_file`` records tracing spans of every iteration and its requests in
+    that file (OTLP/JSON lines, see ``src.base.tracing``).
+    """
+
+    def __init__(
+        self,
+        scenario: Type[Scenario],
+        duration: float = 10.0,
+        concurrency: int = 10,
+        rps: Optional[float] = None,
+        ramp_up: float = 0.0,
+        processes: int = 1,
+        scenario_kwargs: Optional[Dict[str, Any]] = None,
+        trace_file: Optional[str] = None,
+    ) -> None:
+        if processes < 1 or concurrency < processes:
+            raise ValueError("Need at least one process and one user per process")
+        self.scenario = scenario
+        self.duration = duration
+        self.concurrency = concurrency
+        self.rps = rps
+        self.ramp_up = ramp_up
+        self.processes = processes
+        self.scenario_kwargs = scenario_kwargs or {}
+        self.trace_file = trace_file
+
+    def run(self) -> LoadReport:
+        shares = [
+            (
+                self.concurrency // self.processes
+                + int(index < self.concurrency % self.processes),
+                self.rps / self.processes if self.rps else None,
+                index / self.rps if self.rps else 0.0,
+            )
+            for index in range(self.processes)
+        ]
+        if self.processes == 1:
+            results = [_run_worker(self, *shares[0])]
+        else:
+            context = multiprocessing.get_context("spawn")
+            with context.Pool(self.processes) as pool:
+                results = pool.starmap(
+                    _run_worker, [(self, *share) for share in shares]
+                )
+
+        latency = LatencyHistogram()
+        requests = HistogramSink()
+        error_types: Counter = Counter()
+        for result in results:
+            latency.merge(result["latency"])
+            requests.merge(result["requests"])
+            error_types.update(result["error_types"])
+        return LoadReport(
+            iterations=sum(result["iterations"] for result in results),
+            errors=sum(result["errors"] for result in results),
+            elapsed=max(result["elapsed"] for result in results),
+            latency=latency,
+            requests=requests,
+            error_types=dict(error_types),
+        )
+
+
+class _WorkerStats:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.iterations = 0
+        self.errors = 0
+        self.error_types: Counter = Counter()
+        self.latency = LatencyHistogram()
+
+    def record(self, duration_ns: int, error: Optional[BaseException]) -> None:
+        self.latency.record(duration_ns)
+        with self._lock:
+            self.iterations += 1
+            if error is not None:
+                self.errors += 1
+                self.error_types[type(error).__name__] += 1
+
+
+def _run_worker(
+    runner: LoadRunner, concurrency: int, rps: Optional[float], offset: float
+) -> Dict[str, Any]:
+    sink = metrics_instance.add_sink(HistogramSink())
+    if runner.trace_file:
+        tracer_instance.start(BatchSpanProcessor(FileSpanExporter(runner.trace_file)))
+    stats = _WorkerStats()
+    start = perf_counter()
+    try:
+        if rps:
+            _open_loop(runner, stats, concurrency, rps, offset)
+        else:
+            _closed_loop(runner, stats, concurrency)
+    finally:
+        metrics_instance.remove_sink(sink)
+        if runner.trace_file:
+            tracer_instance.stop()
+    return {
+        "iterations": stats.iterations,
+        "errors": stats.errors,
+        "error_types": dict(stats.error_types),
+        "latency": stats.latency,
+        "requests": sink,
+        "elapsed": perf_counter() - start,
+    }
+
+
+def _iterate(scenario: Scenario, stats: _WorkerStats, started_ns: int) -> None:
+    error = None
+    try:
+        with tracer_instance.span(f"iteration {type(scenario).__name__}"):
+            scenario.run()
+    except Exception as exception:
+        error = exception
+    stats.record(perf_counter_ns() - started_ns, error)
+
+
+def _closed_loop(runner: LoadRunner, stats: _WorkerStats, concurrency: int) -> None:
+    deadline = perf_counter() + runner.duration
+
+    def user(index: int) -> None:
+        sleep(runner.ramp_up * index / concurrency)
+        scenario = runner.scenario(**runner.scenario_kwargs)
+        try:
+            scenario.setup()
+        except Exception as error:
+            stats.record(0, error)
+            return
+        try:
+            while perf_counter() < deadline:
+                _iterate(scenario, stats, perf_counter_ns())
+        finally:
+            scenario.teardown()
+
+    threads = [
+        threading.Thread(target=user, args=(index,), daemon=True)
+        for index in range(concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def _open_loop(
+    runner: LoadRunner,
+    stats: _WorkerStats,
+    concurrency: int,
+    rps: float,
+    offset: float,
+) -> None:
+    users: queue.Queue = queue.Queue()
+    # Users whose setup failed are recorded as errors and left out, as in the
+    # closed loop
+    scenarios = []
+    for _ in range(concurrency):
+        scenario = runner.scenario(**runner.scenario_kwargs)
+        try:
+            scenario.setup()
+        except Exception as error:
+            stats.record(0, error)
+            continue
+        scenarios.append(scenario)
+        users.put(scenario)
+    if not scenarios:
+        return
+
+    def iteration(scheduled_ns: int) -> None:
+        scenario = users.get()
+        try:
+            _iterate(scenario, stats, scheduled_ns)
+        finally:
+            users.put(scenario)
+
+    try:
+        with ThreadPoolExecutor(max_workers=len(scenarios)) as executor:
+            start_ns = perf_counter_ns()
+            arrival = 0
+            while True:
+                at = _arrival_time(arrival, rps, runner.ramp_up) + offset
+                if at >= runner.duration:
+                    break
+                scheduled_ns = start_ns + int(at * 1_000_000_000)
+                delay = (scheduled_ns - perf_counter_ns()) / 1_000_000_000
+                if delay > 0:
+                    sleep(delay)
+                executor.submit(iteration, scheduled_ns)
+                arrival += 1
+    finally:
+        for scenario in scenarios:
+            scenario.teardown()
+
+
+def _arrival_time(arrival: int, rps: float, ramp_up: float) -> float:
+    """
+    Start time (seconds) of the nth iteration when the rate grows linearly from
+    0 to ``rps`` during ``ramp_up`` and then stays constant.
+    """
+    ramp_arrivals = rps * ramp_up / 2
+    if arrival < ramp_arrivals:
+        return sqrt(2 * arrival * ramp_up / rps)
+    return ramp_up + (arrival - ramp_arrivals) / rps
@@ -0,0 +1,325 @@
+import re
+import threading
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from src.models.responses.base.response import Timings
+
+_ID_SEGMENT = re.compile(
+    r"^(\d+|[0-9a-fA-F]{16,}|[0-9a-fA-F]{8}-([0-9a-fA-F]{4}-){3}[0-9a-fA-F]{12})$"
+)
+
+
+def route_template(url: str) -> str:
+    """
+    Turns a request URL into its route, replacing ids with ``{id}`` so every call
+    to the same endpoint lands in the same histogram:
+    ``https://host/booking/42?x=1`` -> ``/booking/{id}``.
+    """
+    segments = urlsplit(url).path.split("/")
+    return "/".join(
+        "{id}" if _ID_SEGMENT.match(segment) else segment for segment in segments
+    )
+
+
+class LatencyHistogram:
+    """
+    HDR-style histogram of latencies in nanoseconds.
+
+    Values are counted in log-linear buckets: every power of two is split into
+    ``2 ** precision_bits`` sub-buckets, so a recorded value is off by less than
+    ``1 / 2 ** (precision_bits - 1)`` (under 1% by default) whatever its
+    magnitude, and memory only grows with the range of values, not their count.
+    Percentiles report the highest value of the bucket they fall into.
+    """
+
+    def __init__(self, precision_bits: int = 8) -> None:
+        self.precision_bits = precision_bits
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns: Optional[int] = None
+        self.max_ns = 0
+        self._lock = threading.Lock()
+
+    def record(self, value_ns: int) -> None:
+        value_ns = max(int(value_ns), 0)
+        key = self._bucket(value_ns)
+        with self._lock:
+            self.counts[key] = self.counts.get(key, 0) + 1
+            self.count += 1
+            self.total_ns += value_ns
+            self.max_ns = max(self.max_ns, value_ns)
+            self.min_ns = (
+                value_ns if self.min_ns is None else min(self.min_ns, value_ns)
+            )
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        if other.precision_bits != self.precision_bits:
+            raise ValueError("Cannot merge histograms with a different precision")
+        with self._lock:
+            for key, count in other.counts.items():
+                self.counts[key] = self.counts.get(key, 0) + count
+            self.count += other.count
+            self.total_ns += other.total_ns
+            self.max_ns = max(self.max_ns, other.max_ns)
+            if other.min_ns is not None:
+                self.min_ns = (
+                    other.min_ns
+                    if self.min_ns is None
+                    else min(self.min_ns, other.min_ns)
+                )
+
+    def __getstate__(self) -> Dict:
+        # Histograms are sent back from load-runner worker processes
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def percentile(self, percentile: float) -> int:
+        """
+        Returns the value (ns) below or at which ``percentile`` % of the samples fall.
+        """
+        if not 0 <= percentile <= 100:
+            raise ValueError("percentile must be between 0 and 100")
+        with self._lock:
+            if not self.count:
+                return 0
+            rank = max(1, -(-self.count * percentile // 100))
+            seen = 0
+            for key in sorted(self.counts):
+                seen += self.counts[key]
+                if seen >= rank:
+                    return min(self._highest_value(key), self.max_ns)
+        return self.max_ns
+
+    def percentile_ms(self, percentile: float) -> float:
+        return self.percentile(percentile) / 1_000_000
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.count if self.count else 0.0
+
+    def _bucket(self, value_ns: int) -> int:
+        shift = max(value_ns.bit_length() - self.precision_bits, 0)
+        return (shift << self.precision_bits) + (value_ns >> shift)
+
+    def _highest_value(self, key: int) -> int:
+        shift, sub_bucket = divmod(key, 1 << self.precision_bits)
+        return ((sub_bucket + 1) << shift) - 1
+
+
+class MetricsSink:
+    """
+    Receives every request sent by the services. Subclass and register with
+    ``metrics_instance.add_sink`` to export latencies elsewhere.
+    """
+
+    def record(self, method: str, route: str, status: int, timings: Timings) -> None:
+        raise NotImplementedError
+
+
+class HistogramSink(MetricsSink):
+    """
+    Keeps a LatencyHistogram of the total request time per ``(method, route)``.
+    """
+
+    def __init__(self, precision_bits: int = 8) -> None:
+        self.precision_bits = precision_bits
+        self.histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def record(self, method: str, route: str, status: int, timings: Timings) -> None:
+        self.histogram(method, route).record(timings.total_ns)
+
+    def histogram(self, method: str, route: str) -> LatencyHistogram:
+        key = (str(method).upper(), route)
+        with self._lock:
+            if key not in self.histograms:
+                self.histograms[key] = LatencyHistogram(self.precision_bits)
+            return self.histograms[key]
+
+    def reset(self) -> None:
+        with self._lock:
+            self.histograms.clear()
+
+    def merge(self, other: "HistogramSink") -> None:
+        for (method, route), histogram in list(other.histograms.items()):
+            self.histogram(method, route).merge(histogram)
+
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def assert_percentile(
+        self,
+        method: str,
+        route: str,
+        percentile: float,
+        max_ms: float,
+        min_samples: int = 1,
+    ) -> None:
+        """
+        Asserts that the given percentile of ``method route`` is under ``max_ms``.
+
+        Example:
+            sink.assert_percentile("GET", "/booking/{id}", 95, 300, min_samples=50)
+
+        Raises:
+            AssertionError: If fewer than ``min_samples`` calls were recorded or the
+                percentile is not under ``max_ms``.
+        """
+        histogram = self.histogram(method, route)
+        assert histogram.count >= min_samples, (
+            f"{method} {route}: {histogram.count} samples recorded, "
+            f"{min_samples} required"
+        )
+        value_ms = histogram.percentile_ms(percentile)
+        assert value_ms < max_ms, (
+            f"{method} {route}: p{percentile:g} is {value_ms:.1f} ms "
+            f"over {histogram.count} samples, expected < {max_ms} ms"
+        )
+
+    def summary(self) -> List[Dict[str, float]]:
+        with self._lock:
+            items = sorted(self.histograms.items())
+        return [
+            {
+                "method": method,
+                "route": route,
+                "count": histogram.count,
+                "mean_ms": histogram.mean_ns / 1_000_000,
+                "p50_ms": histogram.percentile_ms(50),
+                "p95_ms": histogram.percentile_ms(95),
+                "p99_ms": histogram.percentile_ms(99),
+                "max_ms": histogram.max_ns / 1_000_000,
+            }
+            for (method, route), histogram in items
+            if histogram.count
+        ]
+
+    def format_summary(self) -> List[str]:
+        rows = self.summary()
+        if not rows:
+            return []
+        width = max(len(f"{row['method']} {row['route']}") for row in rows)
+        lines = [
+            f"{'endpoint':<{width}} {'count':>6} {'p50':>9} {'p95':>9} "
+            f"{'p99':>9} {'max':>9}"
+        ]
+        for row in rows:
+            endpoint = f"{row['method']} {row['route']}"
+            lines.append(
+                f"{endpoint:<{width}} {row['count']:>6} {row['p50_ms']:>7.1f}ms "
+                f"{row['p95_ms']:>7.1f}ms {row['p99_ms']:>7.1f}ms "
+                f"{row['max_ms']:>7.1f}ms"
+            )
+        return lines
+
+
+class TransferSink(MetricsSink):
+    """
+    Adds up the body bytes of the requests per ``(method, route)``: as sent and
+    received over the network, against their size uncompressed. ``saved_ratio``
+    is the share of bandwidth saved by compression.
+    """
+
+    FIELDS = ("payload_bytes", "sent_bytes", "decoded_bytes", "received_bytes")
+
+    def __init__(self) -> None:
+        self.totals: Dict[Tuple[str, str], Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, method: str, route: str, status: int, timings: Timings) -> None:
+        key = (str(method).upper(), route)
+        with self._lock:
+            totals = self.totals.setdefault(
+                key, {"count": 0, **{field: 0 for field in self.FIELDS}}
+            )
+            totals["count"] += 1
+            for field in self.FIELDS:
+                totals[field] += getattr(timings, field)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.totals.clear()
+
+    def total(self) -> Dict[str, int]:
+        with self._lock:
+            rows = list(self.totals.values())
+        return {
+            field: sum(row[field] for row in rows) for field in ("count",) + self.FIELDS
+        }
+
+    def saved_ratio(self) -> float:
+        total = self.total()
+        uncompressed = total["payload_bytes"] + total["decoded_bytes"]
+        if not uncompressed:
+            return 0.0
+        return 1 - (total["sent_bytes"] + total["received_bytes"]) / uncompressed
+
+    def format_summary(self) -> List[str]:
+        with self._lock:
+            items = sorted(self.totals.items())
+        if not items:
+            return []
+        columns = ("sent_bytes", "payload_bytes", "received_bytes", "decoded_bytes")
+        width = max(len(f"{method} {route}") for (method, route), _ in items)
+        lines = [
+            f"{'endpoint':<{width}} {'count':>6} {'sent':>12} {'uncompressed':>12} "
+            f"{'received':>12} {'decoded':>12}"
+        ]
+        for (method, route), totals in items:
+            sizes = " ".join(f"{_format_bytes(totals[name]):>12}" for name in columns)
+            lines.append(
+                f"{method + ' ' + route:<{width}} {totals['count']:>6} {sizes}"
+            )
+        lines.append(f"bandwidth saved by compression: {self.saved_ratio():.0%}")
+        return lines
+
+
+class Metrics:
+    """
+    Dispatches the timings of every request sent by ServiceBase and
+    AsyncServiceBase to the registered sinks. Without sinks, recording costs a
+    single list check per request.
+    """
+
+    def __init__(self) -> None:
+        self.sinks: List[MetricsSink] = []
+
+    def add_sink(self, sink: MetricsSink) -> MetricsSink:
+        if sink not in self.sinks:
+            self.sinks.append(sink)
+        return sink
+
+    def remove_sink(self, sink: MetricsSink) -> None:
+        if sink in self.sinks:
+            self.sinks.remove(sink)
+
+    def record(self, method: str, url: str, status: int, timings: Timings) -> None:
+        if not self.sinks:
+            return
+        route = route_template(url)
+        for sink in self.sinks:
+            sink.record(str(method).upper(), route, status, timings)
+
+
+metrics_instance = Metrics()
+
+
+def _format_bytes(count: float) -> str:
+    if count < 1024:
+        return f"{count:.0f} B"
+    if count < 1024 * 1024:
+        return f"{count / 1024:.1f} KiB"
+    return f"{count / 1024 / 1024:.1f} MiB"
@@ -0,0 +1,261 @@
+import itertools
+import os
+import re
+import threading
+from typing import Any, Collection, List, Optional
+
+from src.base.hooks import RequestContext, RequestHook
+from src.base.metrics import route_template
+
+_UNSAFE_CHARACTERS = re.compile(r"[^\w.-]+")
+
+
+class _Capture:
+    __slots__ = ("data", "running", "path")
+
+    def __init__(self, data: Any) -> None:
+        self.data = data
+        self.running = True
+        self.path: Optional[str] = None
+
+
+class RequestProfiler(RequestHook):
+    """
+    Base of the request profilers. A capture starts in ``before_send`` for the
+    requests to ``endpoint`` (a route template such as ``/booking/{id}``) with
+    one of ``methods``. It pauses when the response arrives, resumes while
+    ``Response.data`` is parsed, and is written to
+    ``directory/<label>/<n>-<method>-<route><suffix>`` when the request is kept.
+
+    A request is kept when its status is in ``statuses`` (requests that raised
+    count as matching) or it took at least ``min_latency_ms``. Either one is
+    enough, and all requests are kept when neither is set. The file is written
+    after the response arrives and again after parsing, so it covers both.
+
+    ``label`` defaults to the id of the running pytest test.
+    """
+
+    suffix = ""
+
+    def __init__(
+        self,
+        directory: str,
+        endpoint: Optional[str] = None,
+        methods: Optional[Collection[str]] = None,
+        statuses: Optional[Collection[int]] = None,
+        min_latency_ms: Optional[float] = None,
+        label: Optional[str] = None,
+    ) -> None:
+        self.directory = directory
+        self.endpoint = endpoint
+        self.methods = {method.upper() for method in methods} if methods else None
+        self.statuses = set(statuses) if statuses else None
+        self.min_latency_ms = min_latency_ms
+        self.label = label
+        self._sequence = itertools.count(1)
+
+    def matches(self, context: RequestContext) -> bool:
+        """
+        Whether the request is captured at all (endpoint and method).
+        """
+        if self.methods is not None and context.method not in self.methods:
+            return False
+        return self.endpoint is None or route_template(context.url) == self.endpoint
+
+    def keeps(self, context: RequestContext) -> bool:
+        """
+        Whether a captured request is written (status or latency).
+        """
+        if self.statuses is None and self.min_latency_ms is None:
+            return True
+        if self.statuses is not None and (
+            context.error is not None or context.status in self.statuses
+        ):
+            return True
+        return (
+            self.min_latency_ms is not None
+            and context.timings.total_ns + context.timings.parsing_ns
+            >= self.min_latency_ms * 1_000_000
+        )
+
+    def before_send(self, context: RequestContext) -> None:
+        if self.matches(context):
+            data = self.start(context)
+            if data is not None:
+                context.state[self] = _Capture(data)
+
+    def after_receive(self, context: RequestContext) -> None:
+        self._finish(context)
+
+    def before_parse(self, context: RequestContext) -> None:
+        capture = context.state.get(self)
+        if capture is not None:
+            capture.running = self.resume(capture.data)
+
+    def after_parse(self, context: RequestContext) -> None:
+        self._finish(context)
+
+    def start(self, context: RequestContext) -> Any:
+        """
+        Starts capturing and returns the capture, or None to skip the request.
+        """
+        raise NotImplementedError
+
+    def pause(self, data: Any) -> None:
+        raise NotImplementedError
+
+    def resume(self, data: Any) -> bool:
+        """
+        Resumes a paused capture. Returns False if it could not be resumed.
+        """
+        raise NotImplementedError
+
+    def write(self, data: Any, path: str) -> None:
+        raise NotImplementedError
+
+    def _finish(self, context: RequestContext) -> None:
+        capture = context.state.get(self)
+        if capture is None:
+            return
+        if capture.running:
+            self.pause(capture.data)
+            capture.running = False
+        if self.keeps(context):
+            if capture.path is None:
+                capture.path = self._path(context)
+            self.write(capture.data, capture.path)
+
+    def _path(self, context: RequestContext) -> str:
+        # PYTEST_CURRENT_TEST is "path::test (call)"
+        test = os.getenv("PYTEST_CURRENT_TEST", "requests").rsplit(" ", 1)[0]
+        label = self.label or test
+        route = route_template(context.url)
+        name = f"{next(self._sequence):04d}-{context.method}-{route}"
+        directory = os.path.join(self.directory, _safe(label))
+        os.makedirs(directory, exist_ok=True)
+        return os.path.join(directory, _safe(name) + self.suffix)
+
+
+class CProfileProfiler(RequestProfiler):
+    """
+    Writes ``cProfile`` stats of the captured requests (``.prof`` files, open
+    them with ``pstats`` or snakeviz). The profile covers the thread that sent
+    the request. Only one request is profiled at a time, and requests sent
+    concurrently with it are skipped.
+    """
+
+    suffix = ".prof"
+    _profiling = threading.Lock()
+
+    def start(self, context: RequestContext) -> Any:
+        import cProfile
+
+        profile = cProfile.Profile()
+        return profile if self.resume(profile) else None
+
+    def pause(self, data: Any) -> None:
+        data.disable()
+        self._profiling.release()
+
+    def resume(self, data: Any) -> bool:
+        if not self._profiling.acquire(blocking=False):
+            return False
+        data.enable()
+        return True
+
+    def write(self, data: Any, path: str) -> None:
+        data.dump_stats(path)
+
+
+class _Allocations:
+    __slots__ = ("before", "after", "sections")
+
+    def __init__(self, before: Any) -> None:
+        self.before = before
+        self.after = None
+        self.sections: List[str] = []
+
+
+class TracemallocProfiler(RequestProfiler):
+    """
+    Writes the memory allocated during the captured requests (``.allocations.txt``
+    files): tracemalloc snapshots taken before and after sending the request
+    (and around parsing, in a second section) are compared, and the ``top``
+    lines that grew the most are listed. Tracing is started on the first
+    request (with ``frames`` frames per traceback) and stopped by ``close`` if
+    this profiler started it.
+
+    Snapshots cover the whole process. Taking them costs a few milliseconds per
+    captured request, and comparing them is only done for the kept ones, so
+    narrow it down with ``endpoint`` when many requests are sent. Unlike
+    CProfileProfiler, ``statuses`` and ``min_latency_ms`` are checked when the
+    response arrives, and parsing is only captured for requests kept then.
+    """
+
+    suffix = ".allocations.txt"
+
+    def __init__(
+        self, directory: str, *args: Any, top: int = 25, frames: int = 1, **kwargs: Any
+    ) -> None:
+        super().__init__(directory, *args, **kwargs)
+        self.top = top
+        self.frames = frames
+        self._started_tracing = False
+
+    def after_receive(self, context: RequestContext) -> None:
+        super().after_receive(context)
+        capture = context.state.get(self)
+        if capture is not None and capture.path is None:
+            del context.state[self]
+
+    def start(self, context: RequestContext) -> Any:
+        import tracemalloc
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_tracing = True
+        return _Allocations(tracemalloc.take_snapshot())
+
+    def pause(self, data: Any) -> None:
+        import tracemalloc
+
+        data.after = tracemalloc.take_snapshot()
+
+    def resume(self, data: Any) -> bool:
+        import tracemalloc
+
+        data.before = tracemalloc.take_snapshot()
+        return True
+
+    def write(self, data: Any, path: str) -> None:
+        import tracemalloc
+
+        ignored = (tracemalloc.__file__, __file__)
+        statistics = [
+            statistic
+            for statistic in data.after.compare_to(data.before, "lineno")
+            if statistic.traceback[0].filename not in ignored
+        ]
+        # Snapshots hold every trace of the process, don't keep them around
+        data.before = data.after = None
+        grown = sum(statistic.size_diff for statistic in statistics)
+        stage = "parsing" if data.sections else "the request"
+        data.sections.append(
+            "\n".join(
+                [f"Allocated during {stage}: {grown / 1024:.1f} KiB", ""]
+                + [str(statistic) for statistic in statistics[: self.top]]
+            )
+        )
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("\n\n".join(data.sections) + "\n")
+
+    def close(self) -> None:
+        import tracemalloc
+
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+
+def _safe(name: str) -> str:
+    return _UNSAFE_CHARACTERS.sub("_", name).strip("_")[:150] or "request"
@@ -0,0 +1,196 @@
+import hashlib
+import json
+import os
+import threading
+from time import monotonic, sleep, time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from src.base.metrics import route_template
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at ``rate`` tokens per second, holding at most
+    ``capacity`` tokens.
+
+    With the default capacity of 1 requests are evenly spaced (a leaky bucket);
+    a larger capacity lets that many requests through at once after an idle
+    period. ``reserve`` never blocks: it takes the tokens, possibly going into
+    debt, and returns how long the caller has to wait before using them, so
+    concurrent callers are queued fairly without holding a lock while waiting.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0) -> None:
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate and capacity must be positive.")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Takes ``tokens`` and returns the seconds to wait before sending.
+        """
+        with self._lock:
+            self._tokens, self._updated, delay = self._take(
+                self._tokens, self._updated, monotonic(), tokens
+            )
+        return delay
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Blocks until ``tokens`` are available. Returns the seconds waited.
+        """
+        delay = self.reserve(tokens)
+        if delay > 0:
+            sleep(delay)
+        return delay
+
+    async def acquire_async(self, tokens: float = 1.0) -> float:
+        """
+        Waits without blocking the event loop until ``tokens`` are available.
+        Returns the seconds waited.
+        """
+        delay = self.reserve(tokens)
+        if delay > 0:
+            import asyncio
+
+            await asyncio.sleep(delay)
+        return delay
+
+    def _take(
+        self, available: float, updated: float, now: float, tokens: float
+    ) -> Tuple[float, float, float]:
+        available = min(self.capacity, available + (now - updated) * self.rate)
+        available -= tokens
+        delay = -available / self.rate if available < 0 else 0.0
+        return available, now, delay
+
+
+class SharedTokenBucket(TokenBucket):
+    """
+    TokenBucket whose state lives in a file guarded by a file lock, so every
+    process pointing at the same ``directory`` and ``name`` draws from the same
+    quota (e.g. pytest-xdist workers). Uses wall-clock time, as monotonic clocks
+    are not comparable across processes.
+    """
+
+    def __init__(
+        self, rate: float, capacity: float = 1.0, directory: str = "", name: str = ""
+    ) -> None:
+        from filelock import FileLock
+
+        super().__init__(rate, capacity)
+        os.makedirs(directory, exist_ok=True)
+        file_name = hashlib.sha256(name.encode("utf-8")).hexdigest()[:16]
+        self.path = os.path.join(directory, f"rate_limit_{file_name}.json")
+        self.file_lock = FileLock(f"{self.path}.lock")
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        with self._lock, self.file_lock:
+            now = time()
+            available, updated = self._read(now)
+            available, updated, delay = self._take(available, updated, now, tokens)
+            temp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump({"tokens": available, "updated": updated}, file)
+            os.replace(temp_path, self.path)
+        return delay
+
+    def _read(self, now: float) -> Tuple[float, float]:
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                state = json.load(file)
+            return state["tokens"], state["updated"]
+        except (FileNotFoundError, ValueError, KeyError):
+            return self.capacity, now
+
+
+class RateLimiter:
+    """
+    Client-side rate limits per host, and optionally per endpoint, applied by
+    every service of the process before each request (retries included).
+
+    A request waits for the host bucket and for the bucket of its route
+    (``/booking/{id}``, see ``route_template``) when those are set. Without any
+    limit the check is a dictionary lookup.
+
+    Example:
+        rate_limiter_instance.limit("https://api.example.com", rate=10)
+        rate_limiter_instance.limit(
+            "https://api.example.com", rate=2, route="/auth", directory=".rate_limits"
+        )
+    """
+
+    def __init__(self) -> None:
+        self._buckets: Dict[Tuple[str, Optional[str]], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def limit(
+        self,
+        host: str,
+        rate: float,
+        capacity: float = 1.0,
+        route: Optional[str] = None,
+        directory: Optional[str] = None,
+    ) -> TokenBucket:
+        """
+        Limits ``host`` (a host name or a base URL), or only its ``route``, to
+        ``rate`` requests per second. With ``directory`` the quota is shared with
+        the other processes using the same directory.
+        """
+        key = (_host(host), route)
+        if directory:
+            bucket = SharedTokenBucket(rate, capacity, directory, f"{key[0]} {route}")
+        else:
+            bucket = TokenBucket(rate, capacity)
+        with self._lock:
+            self._buckets[key] = bucket
+        return bucket
+
+    def remove(self, host: str, route: Optional[str] = None) -> None:
+        with self._lock:
+            self._buckets.pop((_host(host), route), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+    def reserve(self, url: str) -> float:
+        """
+        Takes a token from every bucket matching ``url`` and returns the seconds
+        to wait before sending it.
+        """
+        if not self._buckets:
+            return 0.0
+        host = _host(url)
+        delay = 0.0
+        for route in (None, route_template(url)):
+            bucket = self._buckets.get((host, route))
+            if bucket is not None:
+                delay = max(delay, bucket.reserve())
+        return delay
+
+    def acquire(self, url: str) -> float:
+        delay = self.reserve(url)
+        if delay > 0:
+            sleep(delay)
+        return delay
+
+    async def acquire_async(self, url: str) -> float:
+        delay = self.reserve(url)
+        if delay > 0:
+            import asyncio
+
+            await asyncio.sleep(delay)
+        return delay
+
+
+def _host(url: str) -> str:
+    return urlsplit(url).netloc if "://" in url else url
+
+
+rate_limiter_instance = RateLimiter()
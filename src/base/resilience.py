@@ -0,0 +1,202 @@
+import random
+import threading
+from email.utils import parsedate_to_datetime
+from enum import Enum, auto
+from http import HTTPMethod
+from time import monotonic, time
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple, Type
+
+import requests
+
+IDEMPOTENT_METHODS = frozenset(
+    {
+        HTTPMethod.GET,
+        HTTPMethod.HEAD,
+        HTTPMethod.OPTIONS,
+        HTTPMethod.TRACE,
+        HTTPMethod.PUT,
+        HTTPMethod.DELETE,
+    }
+)
+
+
+class RetryPolicy:
+    """
+    When and how long to wait before sending a request again.
+
+    A request is retried when it raised one of ``retry_exceptions`` or got one of
+    ``retry_statuses``, only for ``methods`` (idempotent ones by default, so a POST
+    is never sent twice) and at most ``max_retries`` times. The wait grows
+    exponentially (``backoff_factor * 2 ** retry``, capped at ``max_backoff``), with
+    full jitter unless disabled. A ``Retry-After`` header takes precedence.
+
+    Example:
+        booking_service.retry_policy = RetryPolicy(max_retries=5, backoff_factor=0.2)
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.1,
+        max_backoff: float = 10.0,
+        jitter: bool = True,
+        retry_statuses: Iterable[int] = (429, 502, 503, 504),
+        methods: Iterable[str] = IDEMPOTENT_METHODS,
+        retry_exceptions: Tuple[Type[BaseException], ...] = (
+            requests.ConnectionError,
+            requests.Timeout,
+        ),
+        respect_retry_after: bool = True,
+    ) -> None:
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses: FrozenSet[int] = frozenset(retry_statuses)
+        self.methods: FrozenSet[str] = frozenset(str(method) for method in methods)
+        self.retry_exceptions = retry_exceptions
+        self.respect_retry_after = respect_retry_after
+
+    def should_retry(
+        self,
+        method: str,
+        retry: int,
+        status: Optional[int] = None,
+        error: Optional[BaseException] = None,
+    ) -> bool:
+        if retry >= self.max_retries or str(method).upper() not in self.methods:
+            return False
+        if error is not None:
+            return isinstance(error, self.retry_exceptions)
+        return status in self.retry_statuses
+
+    def backoff(self, retry: int, retry_after: Optional[str] = None) -> float:
+        """
+        Seconds to wait before retry number ``retry + 1``.
+        """
+        if retry_after and self.respect_retry_after:
+            delay = _parse_retry_after(retry_after)
+            if delay is not None:
+                return min(delay, self.max_backoff)
+        delay = min(self.backoff_factor * 2**retry, self.max_backoff)
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+def _parse_retry_after(value: str) -> Optional[float]:
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of sending a request to a host whose circuit is open.
+    """
+
+    def __init__(self, host: str, retry_in: float) -> None:
+        super().__init__(f"Circuit open for {host}, next probe in {retry_in:.1f}s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+class CircuitState(Enum):
+    CLOSED = auto()
+    OPEN = auto()
+    HALF_OPEN = auto()
+
+
+class _Circuit:
+    def __init__(self) -> None:
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probing = False
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker shared by the services it is given to.
+
+    After ``failure_threshold`` consecutive failures (connection errors or
+    ``failure_statuses``) the host's circuit opens and requests fail fast with
+    CircuitOpenError. After ``reset_timeout`` seconds it turns half-open: a
+    single probe request is let through, which closes the circuit on success or
+    opens it again on failure.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        failure_statuses: Iterable[int] = (500, 502, 503, 504),
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failure_statuses: FrozenSet[int] = frozenset(failure_statuses)
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def state(self, host: str) -> CircuitState:
+        with self._lock:
+            return self._circuit(host).state
+
+    def before_request(self, host: str) -> None:
+        """
+        Raises:
+            CircuitOpenError: If the circuit of ``host`` is open, or half-open with
+                a probe already in flight.
+        """
+        with self._lock:
+            circuit = self._circuit(host)
+            if circuit.state == CircuitState.OPEN:
+                retry_in = circuit.opened_at + self.reset_timeout - monotonic()
+                if retry_in > 0:
+                    raise CircuitOpenError(host, retry_in)
+                circuit.state = CircuitState.HALF_OPEN
+                circuit.probing = False
+            if circuit.state == CircuitState.HALF_OPEN:
+                if circuit.probing:
+                    raise CircuitOpenError(host, 0.0)
+                circuit.probing = True
+
+    def record(self, host: str, status: Optional[int] = None) -> None:
+        """
+        Records the outcome of a request: a status, or None for a connection error.
+        """
+        failed = status is None or status in self.failure_statuses
+        with self._lock:
+            circuit = self._circuit(host)
+            circuit.probing = False
+            if not failed:
+                circuit.state = CircuitState.CLOSED
+                circuit.failures = 0
+                return
+            circuit.failures += 1
+            if (
+                circuit.state == CircuitState.HALF_OPEN
+                or circuit.failures >= self.failure_threshold
+            ):
+                circuit.state = CircuitState.OPEN
+                circuit.opened_at = monotonic()
+
+    def release(self, host: str) -> None:
+        """
+        Ends a request that failed before reaching ``host``, without recording
+        an outcome: a half-open circuit lets the next request probe instead.
+        """
+        with self._lock:
+            self._circuit(host).probing = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self._circuits.clear()
+
+    def _circuit(self, host: str) -> _Circuit:
+        if host not in self._circuits:
+            self._circuits[host] = _Circuit()
+        return self._circuits[host]
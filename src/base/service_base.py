@@ -1,21 +1,47 @@
 import os
-from http import HTTPMethod
-from time import time
-from typing import Any, Dict, Optional, Type, TypeVar, List, get_args
-import requests
-from dotenv import load_dotenv
+from http import HTTPMethod, HTTPStatus
+from time import perf_counter_ns, sleep
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+from urllib.parse import urlsplit
+
 from pydantic import BaseModel
-from requests import Session
+from requests import HTTPError, RequestException, Session
+from requests.utils import get_encoding_from_headers
 
+from src.base.api_client import api_client_instance
 from src.base.auth import Authenticator, AuthMethod
 from src.base.cookie_store import CookieHeaderStore
+from src.base.compression import accept_encoding, gzip_body
+from src.base.decoding import DecodeMode, construct
+from src.base.encoding import encode_payload
+from src.base.hooks import RequestContext, request_hooks_instance
+from src.base.metrics import metrics_instance
+from src.base.rate_limit import rate_limiter_instance
 from src.base.session_manager import SessionManager
-from src.models.requests.credentials.credentials_model import CredentialsModel
-from src.models.responses.auth.auth_response import AuthResponse
-from src.models.responses.base.response import Response
+from src.base.settings import settings_instance
+from src.base.tracing import tracer_instance
+from src.base.transport import RequestsTransport, Transport
+from src.models.responses.base.response import Response, Timings
 
 T = TypeVar("T", bound=BaseModel | List[BaseModel])
 
+JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
+
+if TYPE_CHECKING:
+    from src.base.http_cache import HttpCache
+    from src.base.resilience import CircuitBreaker, RetryPolicy
+
 
 class ServiceBase(Session):
     """
@@ -31,16 +57,28 @@ class ServiceBase(Session):
         self, path: str = "", base_url: str = "", store_name: str = None
     ) -> None:
         super().__init__()
-        load_dotenv(override=True)
+        api_client_instance.mount(self)
 
-        self.base_url = base_url or os.getenv("BASE_URL")
+        self.base_url = base_url or settings_instance.get("BASE_URL")
         if not self.base_url:
             raise ValueError("A valid base_url must be provided.")
         self.headers.update(
-            {"Content-Type": "application/json", "Accept": "application/json"}
+            {
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+                "Accept-Encoding": accept_encoding(),
+            }
         )
         self.url = f"{self.base_url}/{path.strip('/')}"
         self.default_config: Dict[str, Any] = {}
+        self.decode_mode = DecodeMode.STANDARD
+        self.cache: Optional["HttpCache"] = None
+        self.retry_policy: Optional["RetryPolicy"] = None
+        self.circuit_breaker: Optional["CircuitBreaker"] = None
+        self.transport: Transport = RequestsTransport()
+        # Gzip request bodies of at least that many bytes (the server must
+        # accept Content-Encoding: gzip). None sends them as is
+        self.compress_requests_over: Optional[int] = None
 
         if not store_name:
             store_name = os.urandom(15).hex()
@@ -123,6 +161,73 @@ class ServiceBase(Session):
             HTTPMethod.CONNECT, url, response_model=response_model, **kwargs
         )
 
+    def stream_items(
+        self,
+        url: str,
+        item_model: Type[BaseModel] = None,
+        config: Optional[Dict[str, Any]] = None,
+        chunk_size: int = 64 * 1024,
+        **kwargs: Any,
+    ) -> Iterator[Any]:
+        """
+        GETs a JSON array and yields its items one by one as the body is read.
+
+        Items are validated against ``item_model`` when given (or built without
+        validation in ``DecodeMode.TRUSTED``). Peak memory stays flat regardless of
+        the array length, and stopping the iteration early closes the connection
+        without reading the rest of the body.
+
+        The request goes through ``self.transport`` with the rate limiter, retry
+        policy, circuit breaker, hooks and metrics of the other requests, but not
+        through ``self.cache``. Hooks and metrics see it once the headers are in:
+        ``context.content`` is None and ``timings.total_ns`` excludes the body.
+
+        Raises:
+            requests.HTTPError: If the response status is not successful.
+            ValueError: If the body is not a JSON array.
+        """
+        from src.base.streaming import iter_json_array
+
+        config = config or self.default_config
+        start = perf_counter_ns()
+        timings = Timings()
+        options = {**config, **kwargs}
+
+        context = None
+        if request_hooks_instance.hooks:
+            context = RequestContext(self, HTTPMethod.GET, url, None, options, timings)
+            request_hooks_instance.before_send(context)
+
+        try:
+            status, headers, body = self._send(
+                HTTPMethod.GET, url, None, options, timings, stream=True
+            )
+        except Exception as error:
+            if context is not None:
+                timings.total_ns = perf_counter_ns() - start
+                context.error = error
+                request_hooks_instance.after_receive(context)
+            raise
+
+        try:
+            timings.total_ns = perf_counter_ns() - start
+            metrics_instance.record(HTTPMethod.GET, url, status, timings)
+            if context is not None:
+                context.status, context.headers = status, headers
+                request_hooks_instance.after_receive(context)
+            if status >= 400:
+                raise HTTPError(f"{status} error streaming {url}")
+
+            for item in iter_json_array(body.iter_chunks(chunk_size)):
+                if item_model is None:
+                    yield item
+                elif self.decode_mode == DecodeMode.TRUSTED:
+                    yield construct(item_model, item)
+                else:
+                    yield item_model.model_validate(item)
+        finally:
+            body.close()
+
     def _request(
         self,
         method: str,
@@ -130,38 +235,182 @@ class ServiceBase(Session):
         data: Optional[Any] = None,
         config: Optional[Dict[str, Any]] = None,
         response_model: Type[T] = None,
+        decode_mode: Optional[DecodeMode] = None,
         **kwargs: Any,
     ) -> Response[T]:
         config = config or self.default_config
-        start_time = int(time() * 1000)
+        start = perf_counter_ns()
+        timings = Timings()
 
-        has_model_dump = data and hasattr(data, "model_dump")
-        json_payload = data.model_dump(exclude_none=True) if has_model_dump else data
+        options = {**config, **kwargs}
+        body = encode_payload(data)
+        if body is not None:
+            options["headers"] = {**JSON_CONTENT_TYPE, **options.get("headers", {})}
+            timings.payload_bytes = len(body)
+            if (
+                self.compress_requests_over is not None
+                and len(body) >= self.compress_requests_over
+            ):
+                body = gzip_body(body)
+                options["headers"]["Content-Encoding"] = "gzip"
+            timings.sent_bytes = len(body)
 
-        response = getattr(super(), method.lower())(
-            url, json=json_payload, **config, **kwargs
-        )
-        end_time = int(time() * 1000)
+        context = None
+        if request_hooks_instance.hooks:
+            context = RequestContext(self, method, url, body, options, timings)
+            request_hooks_instance.before_send(context)
 
         try:
-            raw_data = response.json()
-            if response_model and isinstance(raw_data, list):
-                model = get_args(response_model)[0]
-                parsed_data = [model.model_validate(item) for item in raw_data]
-            elif response_model:
-                parsed_data = response_model.model_validate(raw_data)
+            if self.cache is not None:
+                status, headers, content, from_cache = self._send_cached(
+                    method, url, body, options, timings
+                )
             else:
-                parsed_data = raw_data
-        except (requests.exceptions.JSONDecodeError, ValueError):
-            parsed_data = response.text
+                status, headers, content = self._send(
+                    method, url, body, options, timings
+                )
+                from_cache = False
+        except Exception as error:
+            if context is not None:
+                timings.total_ns = perf_counter_ns() - start
+                context.error = error
+                request_hooks_instance.after_receive(context)
+            raise
+
+        timings.total_ns = perf_counter_ns() - start
+        metrics_instance.record(method, url, status, timings)
+        if context is not None:
+            context.status, context.headers, context.content = status, headers, content
+            request_hooks_instance.after_receive(context)
 
         return Response(
-            status=response.status_code,
-            headers=response.headers,
-            data=parsed_data,
-            response_time=end_time - start_time,
+            status,
+            headers,
+            content,
+            response_model,
+            get_encoding_from_headers(headers),
+            decode_mode or self.decode_mode,
+            timings,
+            from_cache,
+            context=context,
         )
 
+    def _send(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        options: Dict[str, Any],
+        timings: Timings,
+        stream: bool = False,
+    ) -> Tuple[int, Mapping[str, str], Any]:
+        """
+        Sends the request, applying ``self.retry_policy`` and ``self.circuit_breaker``.
+        With ``stream``, the body is returned unread as a ``StreamedBody``.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker of the host is open.
+        """
+        policy, breaker = self.retry_policy, self.circuit_breaker
+        if policy is None and breaker is None:
+            return self._send_once(method, url, body, options, timings, stream)
+
+        host = urlsplit(url).netloc
+        retry = 0
+        while True:
+            if breaker is not None:
+                breaker.before_request(host)
+            try:
+                status, headers, content = self._send_once(
+                    method, url, body, options, timings, stream
+                )
+            except RequestException as error:
+                if breaker is not None:
+                    breaker.record(host)
+                if policy is None or not policy.should_retry(
+                    method, retry, error=error
+                ):
+                    raise
+                delay = policy.backoff(retry)
+            except BaseException:
+                # Not a failure of the host (e.g. a cassette miss or an invalid
+                # option), but a half-open probe must not stay in flight
+                if breaker is not None:
+                    breaker.release(host)
+                raise
+            else:
+                if breaker is not None:
+                    breaker.record(host, status)
+                if policy is None or not policy.should_retry(method, retry, status):
+                    return status, headers, content
+                if stream:
+                    content.close()
+                delay = policy.backoff(retry, headers.get("Retry-After"))
+
+            retry += 1
+            timings.retries = retry
+            timings.backoff_ns += int(delay * 1_000_000_000)
+            sleep(delay)
+
+    def _send_once(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        options: Dict[str, Any],
+        timings: Timings,
+        stream: bool = False,
+    ) -> Tuple[int, Mapping[str, str], Any]:
+        throttled = rate_limiter_instance.acquire(url)
+        timings.throttle_ns += int(throttled * 1_000_000_000)
+        if stream:
+            return self.transport.stream(self, method, url, body, options, timings)
+        return self.transport.send(self, method, url, body, options, timings)
+
+    def _send_cached(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        options: Dict[str, Any],
+        timings: Timings,
+    ) -> Tuple[int, Mapping[str, str], bytes, bool]:
+        """
+        Serves GET/HEAD from ``self.cache`` (revalidating stale entries), and
+        invalidates the cached resource after any other successful method.
+        """
+        from src.base.http_cache import CacheEntry
+
+        if method not in (HTTPMethod.GET, HTTPMethod.HEAD):
+            status, headers, content = self._send(method, url, body, options, timings)
+            if status < 400:
+                self.cache.invalidate(url)
+            return status, headers, content, False
+
+        cache_key = self.cache.key(
+            method,
+            url,
+            options.get("params"),
+            {**self.headers, **options.get("headers", {})},
+            {**self.cookies.get_dict(), **options.get("cookies", {})},
+        )
+        entry = self.cache.lookup(cache_key)
+        if entry is not None and self.cache.is_fresh(entry):
+            self.cache.stats.record("fresh_hits")
+            return entry.status, entry.headers, entry.content, True
+        if entry is not None:
+            options["headers"] = {**entry.validators(), **options.get("headers", {})}
+
+        status, headers, content = self._send(method, url, body, options, timings)
+        if status == HTTPStatus.NOT_MODIFIED and entry is not None:
+            self.cache.revalidated(cache_key, entry)
+            return entry.status, entry.headers, entry.content, True
+
+        self.cache.stats.record("misses")
+        if status == HTTPStatus.OK:
+            self.cache.store(cache_key, CacheEntry(status, dict(headers), content))
+        return status, headers, content, False
+
     def authenticate(
         self,
         auth_method: AuthMethod = AuthMethod.USERNAME_PASSWORD,
@@ -180,10 +429,16 @@ class ServiceBase(Session):
         """
         if not credentials:
             credentials = {
-                "username": os.getenv("USERNAME"),
-                "password": os.getenv("PASSWORD"),
+                "username": settings_instance.get("USERNAME"),
+                "password": settings_instance.get("PASSWORD"),
             }
 
+        with tracer_instance.span("authenticate", {"auth.method": auth_method.name}):
+            self._authenticate(auth_method, credentials)
+
+    def _authenticate(
+        self, auth_method: AuthMethod, credentials: Dict[str, Any]
+    ) -> None:
         auth_config = Authenticator.authenticate(auth_method, credentials)
 
         if auth_method != AuthMethod.USERNAME_PASSWORD:
@@ -192,17 +447,17 @@ class ServiceBase(Session):
 
         username = credentials.get("username")
         password = credentials.get("password")
-        cached_token = SessionManager.get_cached_token(username, password)
-        if cached_token:
-            self.store.headers["Cookie"] = f"token={cached_token}"
-            self.headers.update(self.store.headers)
-            return
 
-        credentials_req = CredentialsModel(username=username, password=password)
-        response = self.post(f"{self.base_url}/auth", data=credentials_req)
+        def fetch_token() -> str:
+            from src.models.requests.credentials.credentials_model import (
+                CredentialsModel,
+            )
+            from src.models.responses.auth.auth_response import AuthResponse
+
+            credentials_req = CredentialsModel(username=username, password=password)
+            response = self.post(f"{self.base_url}/auth", data=credentials_req)
+            return AuthResponse.model_validate(response.data).token
 
-        raw_data = response.data
-        auth_response = AuthResponse.model_validate(raw_data)
-        SessionManager.store_token(username, password, auth_response.token)
-        self.store.headers["Cookie"] = f"token={auth_response.token}"
+        token = SessionManager.get_or_create_token(username, password, fetch_token)
+        self.store.headers["Cookie"] = f"token={token}"
         self.headers.update(self.store.headers)
@@ -1,30 +1,276 @@
-from time import time
+import threading
+from time import perf_counter_ns, time
+from typing import TYPE_CHECKING, Callable, Dict, Optional
+
+if TYPE_CHECKING:
+    from src.base.token_store import FileTokenStore
+
+
+class TokenMetrics:
+    """
+    Counters for token refreshes.
+
+    A collapsed refresh is a caller that found the token expired, waited for a
+    concurrent refresh of the same credentials and reused its token instead of
+    calling /auth itself.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.refreshes = 0
+            self.collapsed_refreshes = 0
+            self.background_renewals = 0
+            self.failed_renewals = 0
+            self.total_refresh_ns = 0
+            self.max_refresh_ns = 0
+
+    def record_refresh(self, duration_ns: int, background: bool) -> None:
+        with self._lock:
+            self.refreshes += 1
+            self.background_renewals += int(background)
+            self.total_refresh_ns += duration_ns
+            self.max_refresh_ns = max(self.max_refresh_ns, duration_ns)
+
+    def record_collapsed(self) -> None:
+        with self._lock:
+            self.collapsed_refreshes += 1
+
+    def record_failed_renewal(self) -> None:
+        with self._lock:
+            self.failed_renewals += 1
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            average_ns = self.total_refresh_ns / self.refreshes if self.refreshes else 0
+            return {
+                "refreshes": self.refreshes,
+                "collapsed_refreshes": self.collapsed_refreshes,
+                "background_renewals": self.background_renewals,
+                "failed_renewals": self.failed_renewals,
+                "avg_refresh_ms": average_ns / 1_000_000,
+                "max_refresh_ms": self.max_refresh_ns / 1_000_000,
+            }
 
 
 class SessionManager:
     auth_token_cache = {}
     token_expiry_duration = 15 * 60 * 1000  # 15 minutes
+    token_ttls: Dict[str, int] = {}
+    renewal_ratio = 0.9  # renew in the background at 90% of the TTL
+    background_renewal = True
+    shared_store: Optional["FileTokenStore"] = None
+    metrics = TokenMetrics()
+
+    _lock = threading.RLock()
+    _refresh_locks: Dict[str, threading.Lock] = {}
+    _renewal_timers: Dict[str, threading.Timer] = {}
+
+    @staticmethod
+    def use_shared_store(directory: str | None) -> None:
+        """
+        Shares cached tokens with other processes through a file store in the given
+        directory (e.g. pytest-xdist workers). Pass None to go back to in-process only.
+        """
+        from src.base.token_store import FileTokenStore
+
+        SessionManager.shared_store = FileTokenStore(directory) if directory else None
+
+    @staticmethod
+    def set_token_ttl(username: str, ttl: int | None) -> None:
+        """
+        Overrides the token lifetime (in milliseconds) for the given username.
+        Pass None to go back to token_expiry_duration.
+        """
+        with SessionManager._lock:
+            if ttl is None:
+                SessionManager.token_ttls.pop(username, None)
+            else:
+                SessionManager.token_ttls[username] = ttl
+
+    @staticmethod
+    def get_token_ttl(username: str) -> int:
+        return SessionManager.token_ttls.get(
+            username, SessionManager.token_expiry_duration
+        )
 
     @staticmethod
     def get_cached_token(username: str, password: str) -> str | None:
+        return SessionManager._lookup(username, password, 1.0)
+
+    @staticmethod
+    def store_token(username: str, password: str, token: str) -> None:
         cache_key = f"{username}:{password}"
-        cached_data = SessionManager.auth_token_cache.get(cache_key)
+        entry = {"token": token, "timestamp": int(time() * 1000)}
+        with SessionManager._lock:
+            SessionManager.auth_token_cache[cache_key] = entry
+        if SessionManager.shared_store:
+            SessionManager.shared_store.set(cache_key, entry)
+
+    @staticmethod
+    def get_or_create_token(
+        username: str,
+        password: str,
+        fetch_token: Callable[[], str],
+        renew_in_background: bool = True,
+    ) -> str:
+        """
+        Returns the cached token, or calls ``fetch_token`` and caches its result.
+
+        Concurrent callers for the same credentials are collapsed into a single
+        ``fetch_token`` call: one thread refreshes while the others wait for its
+        token. With a shared store the refresh also runs under the store's file
+        lock, so only one process authenticates. Once a token is stored, a
+        background renewal is scheduled at ``renewal_ratio`` of its TTL, unless
+        ``renew_in_background`` is False: pass it for fetchers that stop working
+        with their caller (e.g. bound to an event loop), which are never called
+        from the renewal timer.
+        """
+        cached_token = SessionManager.get_cached_token(username, password)
+        if cached_token:
+            return cached_token
+
+        refresh_lock = SessionManager._refresh_lock(f"{username}:{password}")
+        waited = not refresh_lock.acquire(blocking=False)
+        if waited:
+            refresh_lock.acquire()
+        try:
+            cached_token = SessionManager.get_cached_token(username, password)
+            if cached_token:
+                if waited:
+                    SessionManager.metrics.record_collapsed()
+                return cached_token
+            return SessionManager._refresh(
+                username, password, fetch_token, 1.0, renew=renew_in_background
+            )
+        finally:
+            refresh_lock.release()
+
+    @staticmethod
+    def stop_renewals() -> None:
+        with SessionManager._lock:
+            for timer in SessionManager._renewal_timers.values():
+                timer.cancel()
+            SessionManager._renewal_timers.clear()
+
+    @staticmethod
+    def reset() -> None:
+        """
+        Drops cached tokens, pending renewals and metrics of the current process.
+        """
+        SessionManager.stop_renewals()
+        with SessionManager._lock:
+            SessionManager.auth_token_cache.clear()
+        SessionManager.metrics.reset()
+
+    @staticmethod
+    def _lookup(username: str, password: str, ttl_ratio: float) -> str | None:
+        cache_key = f"{username}:{password}"
+        max_age = SessionManager.get_token_ttl(username) * ttl_ratio
+        with SessionManager._lock:
+            cached_data = SessionManager.auth_token_cache.get(cache_key)
+        if not cached_data and SessionManager.shared_store:
+            cached_data = SessionManager.shared_store.get(cache_key)
+            if cached_data:
+                with SessionManager._lock:
+                    SessionManager.auth_token_cache[cache_key] = cached_data
 
         if cached_data:
             current_time = int(time() * 1000)
             token_age = current_time - cached_data["timestamp"]
 
-            if token_age < SessionManager.token_expiry_duration:
+            if token_age < max_age:
                 return cached_data["token"]
-            else:
-                del SessionManager.auth_token_cache[cache_key]
+            elif ttl_ratio >= 1.0:
+                with SessionManager._lock:
+                    SessionManager.auth_token_cache.pop(cache_key, None)
 
         return None
 
     @staticmethod
-    def store_token(username: str, password: str, token: str) -> None:
+    def _refresh_lock(cache_key: str) -> threading.Lock:
+        with SessionManager._lock:
+            return SessionManager._refresh_locks.setdefault(cache_key, threading.Lock())
+
+    @staticmethod
+    def _refresh(
+        username: str,
+        password: str,
+        fetch_token: Callable[[], str],
+        ttl_ratio: float,
+        background: bool = False,
+        renew: bool = True,
+    ) -> str:
+        """
+        Fetches and stores a new token. Must be called holding the refresh lock.
+        ``ttl_ratio`` decides how old a token found in the shared store may be
+        to be reused instead of fetching a new one.
+        """
+        if SessionManager.shared_store:
+            with SessionManager.shared_store.lock:
+                with SessionManager._lock:
+                    SessionManager.auth_token_cache.pop(f"{username}:{password}", None)
+                token = SessionManager._lookup(username, password, ttl_ratio)
+                if not token:
+                    token = SessionManager._fetch(
+                        username, password, fetch_token, background
+                    )
+        else:
+            token = SessionManager._fetch(username, password, fetch_token, background)
+
+        if renew and SessionManager.background_renewal:
+            SessionManager._schedule_renewal(username, password, fetch_token)
+        return token
+
+    @staticmethod
+    def _fetch(
+        username: str, password: str, fetch_token: Callable[[], str], background: bool
+    ) -> str:
+        start = perf_counter_ns()
+        token = fetch_token()
+        SessionManager.metrics.record_refresh(perf_counter_ns() - start, background)
+        SessionManager.store_token(username, password, token)
+        return token
+
+    @staticmethod
+    def _schedule_renewal(
+        username: str, password: str, fetch_token: Callable[[], str]
+    ) -> None:
         cache_key = f"{username}:{password}"
-        SessionManager.auth_token_cache[cache_key] = {
-            "token": token,
-            "timestamp": int(time() * 1000),
-        }
+        with SessionManager._lock:
+            cached_data = SessionManager.auth_token_cache.get(cache_key)
+            if not cached_data:
+                return
+            renew_at = (
+                cached_data["timestamp"]
+                + SessionManager.get_token_ttl(username) * SessionManager.renewal_ratio
+            )
+            delay = max(renew_at - time() * 1000, 0) / 1000
+            timer = threading.Timer(
+                delay, SessionManager._renew, args=(username, password, fetch_token)
+            )
+            timer.daemon = True
+            previous = SessionManager._renewal_timers.pop(cache_key, None)
+            if previous:
+                previous.cancel()
+            SessionManager._renewal_timers[cache_key] = timer
+            timer.start()
+
+    @staticmethod
+    def _renew(username: str, password: str, fetch_token: Callable[[], str]) -> None:
+        ratio = SessionManager.renewal_ratio
+        with SessionManager._refresh_lock(f"{username}:{password}"):
+            if SessionManager._lookup(username, password, ratio):
+                # Another thread or process renewed it already
+                SessionManager._schedule_renewal(username, password, fetch_token)
+                return
+            try:
+                SessionManager._refresh(
+                    username, password, fetch_token, ratio, background=True
+                )
+            except Exception:
+                # Callers fall back to a synchronous refresh once the token expires
+                SessionManager.metrics.record_failed_renewal()
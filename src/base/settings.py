@@ -0,0 +1,36 @@
+import os
+import threading
+from typing import Optional
+
+
+class Settings:
+    """
+    Process-wide access to the framework's environment.
+
+    The ``.env`` file is read once, on the first ``get``, instead of once per
+    service instance. Its values override the process environment, as before.
+    Call ``reload`` after editing ``.env`` to pick up the changes. Variables set
+    in ``os.environ`` at runtime (e.g. with ``monkeypatch.setenv``) are seen
+    immediately.
+    """
+
+    def __init__(self, dotenv_path: Optional[str] = None) -> None:
+        self.dotenv_path = dotenv_path
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def get(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        if not self._loaded:
+            self.reload()
+        return os.environ.get(name, default)
+
+    def reload(self) -> None:
+        with self._lock:
+            # python-dotenv is only imported when the environment is first read
+            from dotenv import load_dotenv
+
+            load_dotenv(self.dotenv_path, override=True)
+            self._loaded = True
+
+
+settings_instance = Settings()
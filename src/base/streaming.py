@@ -0,0 +1,80 @@
+import codecs
+import json
+from typing import Any, Iterable, Iterator
+
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",]"
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """
+    Incrementally parses a JSON array from byte chunks, yielding one item at a time.
+
+    Only the current chunk and the item being parsed are kept in memory, so peak
+    memory does not depend on the array length. Stopping the iteration early
+    stops reading ``chunks``.
+
+    Raises:
+        ValueError: If the payload is not a well-formed JSON array.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    chunks = iter(chunks)
+    buffer = ""
+    position = 0
+    exhausted = False
+    state = "start"
+
+    while True:
+        while position < len(buffer) and buffer[position] in _WHITESPACE:
+            position += 1
+
+        if position == len(buffer):
+            if exhausted:
+                raise ValueError("Unexpected end of JSON array")
+            chunk = next(chunks, None)
+            exhausted = chunk is None
+            buffer = buffer[position:] + text_decoder.decode(chunk or b"", exhausted)
+            position = 0
+            continue
+
+        char = buffer[position]
+        if state == "start":
+            if char != "[":
+                raise ValueError("Expected a JSON array")
+            position += 1
+            state = "first"
+        elif char == "]" and state in ("first", "next"):
+            return
+        elif state == "next":
+            if char != ",":
+                raise ValueError(f"Expected ',' or ']' at position {position}")
+            position += 1
+            state = "item"
+        else:
+            try:
+                item, end = decoder.raw_decode(buffer, position)
+                # A number is only complete once a delimiter follows it ("-1" of "-1.5")
+                complete = exhausted or (
+                    end < len(buffer)
+                    and (
+                        not isinstance(item, (int, float)) or buffer[end] in _DELIMITERS
+                    )
+                )
+            except json.JSONDecodeError:
+                if exhausted:
+                    raise
+                complete = False
+
+            if not complete:
+                chunk = next(chunks, None)
+                exhausted = chunk is None
+                buffer = buffer[position:] + text_decoder.decode(
+                    chunk or b"", exhausted
+                )
+                position = 0
+                continue
+
+            position = end
+            state = "next"
+            yield item
@@ -0,0 +1,46 @@
+import hashlib
+import json
+import os
+from typing import Any, Dict, Optional
+
+
+class FileTokenStore:
+    """
+    Auth token cache shared by every process pointing at the same directory.
+
+    Entries live in a JSON file guarded by a file lock, keyed by a hash of the
+    same ``username:password`` key used by SessionManager so no credentials are
+    written to disk. Holding ``lock`` while authenticating lets a single process
+    refresh a token while the others wait for it.
+    """
+
+    def __init__(self, directory: str) -> None:
+        from filelock import FileLock
+
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, "auth_tokens.json")
+        self.lock = FileLock(f"{self.path}.lock")
+
+    @staticmethod
+    def _hash(cache_key: str) -> str:
+        return hashlib.sha256(cache_key.encode("utf-8")).hexdigest()
+
+    def get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        with self.lock:
+            return self._read().get(self._hash(cache_key))
+
+    def set(self, cache_key: str, entry: Dict[str, Any]) -> None:
+        with self.lock:
+            entries = self._read()
+            entries[self._hash(cache_key)] = entry
+            temp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump(entries, file)
+            os.replace(temp_path, self.path)
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                return json.load(file)
+        except (FileNotFoundError, ValueError):
+            return {}
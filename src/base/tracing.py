@@ -0,0 +1,406 @@
+import json
+import os
+import threading
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter_ns, time_ns
+from typing import Any, Dict, Iterator, List, Optional
+from urllib.parse import urlsplit
+
+from src.base.hooks import RequestContext, RequestHook, request_hooks_instance
+from src.base.metrics import route_template
+
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_CLIENT = 3
+STATUS_UNSET = 0
+STATUS_ERROR = 2
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+class Span:
+    """
+    One timed operation of a trace, with OpenTelemetry semantics: ids are
+    random (128-bit trace, 64-bit span), times are Unix epoch nanoseconds and
+    ``to_otlp`` returns the span as OTLP/JSON.
+    """
+
+    __slots__ = (
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "kind",
+        "start_ns",
+        "end_ns",
+        "attributes",
+        "status",
+        "_started_perf_ns",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        parent: Optional["Span"] = None,
+        kind: int = SPAN_KIND_INTERNAL,
+        attributes: Optional[Dict[str, Any]] = None,
+        start_ns: Optional[int] = None,
+    ) -> None:
+        self.name = name
+        # os.urandom rather than random: forked load-runner workers would
+        # share the random state and generate the same ids
+        self.trace_id = (
+            parent.trace_id if parent else int.from_bytes(os.urandom(16), "big")
+        )
+        self.span_id = int.from_bytes(os.urandom(8), "big")
+        self.parent_id = parent.span_id if parent else None
+        self.kind = kind
+        self.start_ns = start_ns if start_ns is not None else time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes = attributes or {}
+        self.status = STATUS_UNSET
+        self._started_perf_ns = perf_counter_ns()
+
+    @property
+    def traceparent(self) -> str:
+        """
+        The W3C Trace Context header value pointing at this span.
+        """
+        return f"00-{self.trace_id:032x}-{self.span_id:016x}-01"
+
+    def set_error(self, error_type: str) -> None:
+        self.status = STATUS_ERROR
+        self.attributes["error.type"] = error_type
+
+    def end(self, end_ns: Optional[int] = None) -> None:
+        """
+        Ends the span, by default after the monotonic time elapsed since it was
+        created (wall-clock adjustments don't change durations).
+        """
+        if end_ns is None:
+            end_ns = self.start_ns + perf_counter_ns() - self._started_perf_ns
+        self.end_ns = end_ns
+
+    def to_otlp(self) -> Dict[str, Any]:
+        return {
+            "traceId": f"{self.trace_id:032x}",
+            "spanId": f"{self.span_id:016x}",
+            "parentSpanId": (
+                f"{self.parent_id:016x}" if self.parent_id is not None else ""
+            ),
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [
+                {"key": key, "value": _otlp_value(value)}
+                for key, value in self.attributes.items()
+            ],
+            "status": {"code": self.status},
+        }
+
+    def __repr__(self) -> str:
+        return f"Span({self.name!r}, span_id={self.span_id:016x})"
+
+
+def otlp_document(spans: List[Span], service_name: str) -> Dict[str, Any]:
+    """
+    Wraps spans in an OTLP/JSON ``ExportTraceServiceRequest``.
+    """
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [
+                        {"key": "service.name", "value": {"stringValue": service_name}}
+                    ]
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": __name__},
+                        "spans": [span.to_otlp() for span in spans],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+class SpanExporter:
+    """
+    Receives batches of ended spans from a BatchSpanProcessor.
+    """
+
+    def export(self, spans: List[Span]) -> None:
+        raise NotImplementedError
+
+    def shutdown(self) -> None:
+        pass
+
+
+class InMemorySpanExporter(SpanExporter):
+    """
+    Keeps the exported spans in ``spans``, for assertions in tests.
+    """
+
+    def __init__(self) -> None:
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, spans: List[Span]) -> None:
+        with self._lock:
+            self.spans.extend(spans)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.spans.clear()
+
+
+class FileSpanExporter(SpanExporter):
+    """
+    Appends every batch to ``path`` as one line of OTLP/JSON, the format of the
+    OpenTelemetry Collector file exporter (its ``otlpjsonfile`` receiver reads
+    it back). Each batch is a single append, so processes can share the file.
+    """
+
+    def __init__(self, path: str, service_name: str = "api-tests") -> None:
+        self.path = path
+        self.service_name = service_name
+
+    def export(self, spans: List[Span]) -> None:
+        line = json.dumps(otlp_document(spans, self.service_name)) + "\n"
+        descriptor = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            os.write(descriptor, line.encode("utf-8"))
+        finally:
+            os.close(descriptor)
+
+
+class BatchSpanProcessor:
+    """
+    Queues ended spans and exports them from a background thread, in batches of
+    up to ``max_batch_size`` every ``schedule_delay`` seconds (or as soon as a
+    batch is full), so requests never wait for the exporter. Past
+    ``max_queue_size`` queued spans, new spans are dropped and counted in
+    ``dropped``. Export errors are counted in ``export_errors``.
+    """
+
+    def __init__(
+        self,
+        exporter: SpanExporter,
+        max_batch_size: int = 512,
+        schedule_delay: float = 1.0,
+        max_queue_size: int = 2048,
+    ) -> None:
+        self.exporter = exporter
+        self.max_batch_size = max_batch_size
+        self.schedule_delay = schedule_delay
+        self.max_queue_size = max_queue_size
+        self.dropped = 0
+        self.export_errors = 0
+        self._queue: deque = deque()
+        self._condition = threading.Condition()
+        self._export_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._stopped = False
+
+    def on_end(self, span: Span) -> None:
+        with self._condition:
+            if self._stopped:
+                return
+            if len(self._queue) >= self.max_queue_size:
+                self.dropped += 1
+                return
+            self._queue.append(span)
+            if self._pid != os.getpid():
+                self._start_worker()
+            elif len(self._queue) >= self.max_batch_size:
+                self._condition.notify()
+
+    def force_flush(self) -> None:
+        """
+        Exports every queued span now, from the calling thread.
+        """
+        while self._export_batch():
+            pass
+
+    def shutdown(self) -> None:
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+        if self._thread is not None and self._pid == os.getpid():
+            self._thread.join()
+        self.force_flush()
+        self.exporter.shutdown()
+
+    def _start_worker(self) -> None:
+        # Also runs again in a forked child, where the parent's thread is gone
+        self._pid = os.getpid()
+        self._thread = threading.Thread(
+            target=self._work, name="span-exporter", daemon=True
+        )
+        self._thread.start()
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                if not self._stopped and len(self._queue) < self.max_batch_size:
+                    self._condition.wait(self.schedule_delay)
+                if self._stopped:
+                    return
+            self._export_batch()
+
+    def _export_batch(self) -> bool:
+        with self._export_lock:
+            with self._condition:
+                count = min(len(self._queue), self.max_batch_size)
+                batch = [self._queue.popleft() for _ in range(count)]
+            if not batch:
+                return False
+            try:
+                self.exporter.export(batch)
+            except Exception:
+                self.export_errors += 1
+            return True
+
+
+class Tracer(RequestHook):
+    """
+    Emits a CLIENT span for every request sent by ServiceBase, named
+    ``METHOD /route/{id}`` and carrying the OpenTelemetry HTTP attributes
+    (``http.request.method``, ``http.route``, ``url.full``,
+    ``http.response.status_code``, ``http.response.body.size``...). Reading
+    ``Response.data`` adds ``decode`` and ``validate`` child spans. The
+    ``traceparent`` header of the span is added to the request, so server
+    traces join the client's.
+
+    Requests sent inside ``span(...)`` (e.g. ``authenticate`` or a load test
+    iteration) become its children. Spans go to ``processor``; nothing is
+    recorded until ``start`` is called.
+
+    Example:
+        tracer_instance.start(BatchSpanProcessor(FileSpanExporter("spans.jsonl")))
+    """
+
+    def __init__(self, propagate: bool = True) -> None:
+        self.propagate = propagate
+        self.processor: Optional[BatchSpanProcessor] = None
+
+    def start(self, processor: BatchSpanProcessor) -> None:
+        self.processor = processor
+        request_hooks_instance.add_hook(self)
+
+    def stop(self) -> None:
+        """
+        Stops tracing and exports the queued spans.
+        """
+        request_hooks_instance.remove_hook(self)
+        processor, self.processor = self.processor, None
+        if processor is not None:
+            processor.shutdown()
+
+    @contextmanager
+    def span(
+        self, name: str, attributes: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Optional[Span]]:
+        """
+        Runs the block in an INTERNAL span (None when tracing is stopped).
+        """
+        processor = self.processor
+        if processor is None:
+            yield None
+            return
+
+        span = Span(name, _current_span.get(), attributes=attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as error:
+            span.set_error(type(error).__name__)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+            processor.on_end(span)
+
+    def before_send(self, context: RequestContext) -> None:
+        route = route_template(context.url)
+        address = urlsplit(context.url)
+        attributes = {
+            "http.request.method": context.method,
+            "http.route": route,
+            "url.full": context.url,
+            "server.address": address.hostname or "",
+        }
+        if address.port:
+            attributes["server.port"] = address.port
+        if context.body is not None:
+            attributes["http.request.body.size"] = len(context.body)
+        span = Span(
+            f"{context.method} {route}",
+            _current_span.get(),
+            SPAN_KIND_CLIENT,
+            attributes,
+        )
+        context.state[self] = span
+        if self.propagate:
+            context.options["headers"] = {
+                **(context.options.get("headers") or {}),
+                "traceparent": span.traceparent,
+            }
+
+    def after_receive(self, context: RequestContext) -> None:
+        span = context.state.get(self)
+        processor = self.processor
+        if span is None or processor is None:
+            return
+        if context.error is not None:
+            span.set_error(type(context.error).__name__)
+        else:
+            span.attributes["http.response.status_code"] = context.status
+            span.attributes["http.response.body.size"] = len(context.content or b"")
+            if context.status >= 400:
+                span.set_error(str(context.status))
+        if context.timings.retries:
+            span.attributes["http.request.resend_count"] = context.timings.retries
+        span.end()
+        processor.on_end(span)
+
+    def after_parse(self, context: RequestContext) -> None:
+        parent = context.state.get(self)
+        processor = self.processor
+        if parent is None or processor is None:
+            return
+        # Decoding and validation ran back to back and just ended
+        end_ns = time_ns()
+        timings = context.timings
+        validate_start_ns = end_ns - timings.validation_ns
+        stages = (
+            ("decode", validate_start_ns - timings.decode_ns, validate_start_ns),
+            ("validate", validate_start_ns, end_ns),
+        )
+        spans = []
+        for name, start_ns, stage_end_ns in stages:
+            if stage_end_ns > start_ns:
+                span = Span(name, parent, start_ns=start_ns)
+                span.end(stage_end_ns)
+                spans.append(span)
+        if context.error is not None and spans:
+            spans[-1].set_error(type(context.error).__name__)
+        for span in spans:
+            processor.on_end(span)
+
+
+tracer_instance = Tracer()
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
@@ -0,0 +1,359 @@
+import threading
+from http import HTTPMethod
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Mapping, Optional, Tuple
+
+import requests
+
+from src.models.responses.base.response import Timings
+
+if TYPE_CHECKING:
+    from src.base.service_base import ServiceBase
+
+TransportResult = Tuple[int, Mapping[str, str], bytes]
+
+
+class StreamedBody:
+    """
+    Body of a response sent by ``Transport.stream``, read chunk by chunk.
+    ``close`` must be called once done with it, read to the end or not.
+    """
+
+    def __init__(self, content: bytes = b"") -> None:
+        self._content = content
+
+    def iter_chunks(self, chunk_size: int) -> Iterator[bytes]:
+        content = self._content
+        for start in range(0, len(content), chunk_size):
+            yield content[start : start + chunk_size]
+
+    def close(self) -> None:
+        pass
+
+
+StreamResult = Tuple[int, Mapping[str, str], StreamedBody]
+
+
+class Transport:
+    """
+    Sends the requests of a ServiceBase. ``send`` gets the encoded body and the
+    merged request options, fills the network part of ``timings`` and returns the
+    status, headers and body. The service headers and cookies (including those of
+    its CookieHeaderStore and of ``authenticate``) are sent with every request.
+    """
+
+    def send(
+        self,
+        service: "ServiceBase",
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        options: Dict[str, Any],
+        timings: Timings,
+    ) -> TransportResult:
+        raise NotImplementedError
+
+    def stream(
+        self,
+        service: "ServiceBase",
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        options: Dict[str, Any],
+        timings: Timings,
+    ) -> StreamResult:
+        """
+        Like ``send``, but returns once the headers are in and leaves the body to
+        be read from the returned ``StreamedBody``. Transports that cannot read
+        it incrementally fall back to ``send`` and hand out the body they read.
+        """
+        status, headers, content = self.send(
+            service, method, url, body, options, timings
+        )
+        return status, headers, StreamedBody(content)
+
+    def close(self) -> None:
+        pass
+
+
+class RequestsTransport(Transport):
+    """
+    HTTP/1.1 through the service's own ``requests.Session`` and the pools of the
+    ApiClient. The default transport.
+    """
+
+    def send(
+        self,
+        service: "ServiceBase",
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        options: Dict[str, Any],
+        timings: Timings,
+    ) -> TransportResult:
+        response, headers_received = self._request_headers(
+            service, method, url, body, options, timings
+        )
+        # The connection goes back to the pool once the body is read
+        content = response.content
+        timings.download_ns = perf_counter_ns() - headers_received
+        timings.received_bytes = _received_bytes(response, len(content))
+        timings.decoded_bytes = len(content)
+        return response.status_code, response.headers, content
+
+    def stream(
+        self,
+        service: "ServiceBase",
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        options: Dict[str, Any],
+        timings: Timings,
+    ) -> StreamResult:
+        response, headers_received = self._request_headers(
+            service, method, url, body, options, timings
+        )
+        return (
+            response.status_code,
+            response.headers,
+            _ResponseBody(response, timings, headers_received),
+        )
+
+    @staticmethod
+    def _request_headers(
+        service: "ServiceBase",
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        options: Dict[str, Any],
+        timings: Timings,
+    ) -> Tuple[requests.Response, int]:
+        options.setdefault("allow_redirects", method != HTTPMethod.HEAD)
+        # stream=True returns once the headers are in, so the body read is timed apart
+        sent = perf_counter_ns()
+        response = requests.Session.request(
+            service, method, url, data=body, stream=True, **options
+        )
+        headers_received = perf_counter_ns()
+        connection = getattr(response.raw, "connection", None)
+        timings.connect_ns = getattr(connection, "connect_ns", 0)
+        if timings.connect_ns:
+            connection.connect_ns = 0
+        timings.ttfb_ns = headers_received - sent - timings.connect_ns
+        return response, headers_received
+
+
+class _ResponseBody(StreamedBody):
+    """
+    Body of a ``requests`` response sent with ``stream=True``. Closing it returns
+    the connection to the pool, or discards it if the body was not read to the
+    end, and fills in the download part of the timings.
+    """
+
+    def __init__(
+        self, response: requests.Response, timings: Timings, headers_received: int
+    ) -> None:
+        super().__init__()
+        self._response = response
+        self._timings = timings
+        self._headers_received = headers_received
+        self._closed = False
+
+    def iter_chunks(self, chunk_size: int) -> Iterator[bytes]:
+        for chunk in self._response.iter_content(chunk_size):
+            self._timings.decoded_bytes += len(chunk)
+            yield chunk
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        timings = self._timings
+        timings.download_ns = perf_counter_ns() - self._headers_received
+        timings.received_bytes = _received_bytes(self._response, timings.decoded_bytes)
+        self._response.close()
+
+
+def _received_bytes(response: requests.Response, decoded_bytes: int) -> int:
+    # urllib3 counts the bytes read off the socket, before decompression.
+    # Replayed cassettes have none: count their body as is
+    tell = getattr(response.raw, "tell", None)
+    return (tell() if tell else 0) or decoded_bytes
+
+
+class Http2Transport(Transport):
+    """
+    HTTP/2 through an ``httpx.AsyncClient``: concurrent requests to a host (e.g.
+    from ``run_bulk`` threads) are multiplexed as streams over a single connection
+    instead of taking one pooled socket each. Needs the optional ``httpx`` and
+    ``h2`` packages (``pip install 'httpx[http2]'``).
+
+    The client runs on an event loop in a background thread and ``send`` blocks
+    the calling thread until its response is read, so the sync services keep
+    their API. (httpx's sync HTTP/2 connection is not safe to share between
+    threads.) ``https://`` URLs negotiate HTTP/2 with ALPN and fall back to
+    HTTP/1.1; ``http://`` URLs use HTTP/2 with prior knowledge (h2c) when
+    ``prior_knowledge`` is set. Share one transport between services to share
+    its connections; ``connections_opened`` counts them. Supported request
+    options are ``params``, ``headers``, ``cookies``, ``timeout`` and
+    ``allow_redirects``; connection errors and timeouts are raised as their
+    ``requests`` counterparts, so RetryPolicy and CircuitBreaker behave as with
+    the default transport.
+
+    Example:
+        transport = Http2Transport()
+        booking_service.transport = transport
+        auth_booking_service.transport = transport
+    """
+
+    def __init__(
+        self,
+        prior_knowledge: bool = True,
+        max_connections: int = 10,
+        timeout: Optional[float] = 30.0,
+        verify: bool = True,
+    ) -> None:
+        try:
+            import h2  # noqa: F401
+            import httpx
+        except ImportError as error:  # pragma: no cover - httpx is optional
+            raise ImportError(
+                "Http2Transport needs the optional httpx and h2 packages: "
+                "pip install 'httpx[http2]'"
+            ) from error
+        import asyncio
+
+        self._httpx = httpx
+        self._asyncio = asyncio
+        self._lock = threading.Lock()
+        self.connections_opened = 0
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="http2-transport", daemon=True
+        )
+        self._thread.start()
+        self.client = self._run(
+            self._create_client(prior_knowledge, max_connections, timeout, verify)
+        )
+
+    async def _create_client(
+        self,
+        prior_knowledge: bool,
+        max_connections: int,
+        timeout: Optional[float],
+        verify: bool,
+    ) -> Any:
+        httpx = self._httpx
+        limits = httpx.Limits(max_connections=max_connections)
+        # HTTP/1.1 stays enabled for https, so ALPN can fall back to it. Without
+        # it, http:// URLs speak HTTP/2 right away (h2c with prior knowledge)
+        return httpx.AsyncClient(
+            mounts={
+                "http://": httpx.AsyncHTTPTransport(
+                    http1=not prior_knowledge, http2=True, limits=limits
+                ),
+                "https://": httpx.AsyncHTTPTransport(
+                    http1=True, http2=True, limits=limits, verify=verify
+                ),
+            },
+            timeout=timeout,
+        )
+
+    def _run(self, coroutine: Any) -> Any:
+        return self._asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def send(
+        self,
+        service: "ServiceBase",
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        options: Dict[str, Any],
+        timings: Timings,
+    ) -> TransportResult:
+        httpx = self._httpx
+        unsupported = set(options) - {
+            "params",
+            "headers",
+            "cookies",
+            "timeout",
+            "allow_redirects",
+        }
+        if unsupported:
+            raise TypeError(
+                f"Unsupported options for Http2Transport: {sorted(unsupported)}"
+            )
+        connect = _ConnectTrace()
+        request = self.client.build_request(
+            str(method),
+            url,
+            content=body,
+            params=options.get("params"),
+            headers={**service.headers, **options.get("headers", {})},
+            cookies={**service.cookies.get_dict(), **options.get("cookies", {})},
+            timeout=options.get("timeout", httpx.USE_CLIENT_DEFAULT),
+            extensions={"trace": connect},
+        )
+        follow_redirects = options.get("allow_redirects", method != HTTPMethod.HEAD)
+        sent = perf_counter_ns()
+        try:
+            response, headers_received, content = self._run(
+                self._send(request, follow_redirects)
+            )
+        except httpx.TimeoutException as error:
+            raise requests.Timeout(str(error)) from error
+        except httpx.TransportError as error:
+            raise requests.ConnectionError(str(error)) from error
+        downloaded = perf_counter_ns()
+
+        # Keep cookies set by the server, as requests.Session does
+        service.cookies.update(dict(response.cookies))
+        timings.connect_ns = connect.connect_ns
+        if connect.connect_ns:
+            with self._lock:
+                self.connections_opened += 1
+        timings.ttfb_ns = headers_received - sent - timings.connect_ns
+        timings.download_ns = downloaded - headers_received
+        timings.received_bytes = response.num_bytes_downloaded
+        timings.decoded_bytes = len(content)
+        return response.status_code, response.headers, content
+
+    async def _send(
+        self, request: Any, follow_redirects: bool
+    ) -> Tuple[Any, int, bytes]:
+        response = await self.client.send(
+            request, stream=True, follow_redirects=follow_redirects
+        )
+        headers_received = perf_counter_ns()
+        try:
+            content = await response.aread()
+        finally:
+            await response.aclose()
+        return response, headers_received, content
+
+    def close(self) -> None:
+        if self._loop.is_closed():
+            return
+        self._run(self.client.aclose())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+class _ConnectTrace:
+    """
+    httpcore trace callback measuring the TCP/TLS connect of a request, if any.
+    """
+
+    def __init__(self) -> None:
+        self.connect_ns = 0
+        self._started = 0
+
+    async def __call__(self, event_name: str, info: Dict[str, Any]) -> None:
+        if event_name == "connection.connect_tcp.started":
+            self._started = perf_counter_ns()
+        elif event_name in (
+            "connection.connect_tcp.complete",
+            "connection.start_tls.complete",
+        ):
+            self.connect_ns = perf_counter_ns() - self._started
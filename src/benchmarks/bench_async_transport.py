@@ -0,0 +1,65 @@
+"""
+Compares request throughput of the sync and async booking services against
+the local stub server.
+
+Usage:
+    python -m src.benchmarks.bench_async_transport --requests 500 --latency 0.02
+"""
+
+import argparse
+import asyncio
+from time import perf_counter
+
+from src.models.services.async_booking_service import AsyncBookingService
+from src.models.services.booking_service import BookingService
+from src.stub.booking_stub_server import StubServer
+
+
+def run_sync(base_url: str, requests: int) -> float:
+    service = BookingService(base_url=base_url)
+    start = perf_counter()
+    for index in range(requests):
+        service.get_booking(index % 10 + 1)
+    return perf_counter() - start
+
+
+async def run_async(base_url: str, requests: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with AsyncBookingService(base_url=base_url) as service:
+
+        async def fetch(index: int) -> None:
+            async with semaphore:
+                await service.get_booking(index % 10 + 1)
+
+        start = perf_counter()
+        await asyncio.gather(*(fetch(index) for index in range(requests)))
+        return perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+
+    with StubServer(latency=args.latency) as server:
+        sync_elapsed = run_sync(server.base_url, args.requests)
+        async_elapsed = asyncio.run(
+            run_async(server.base_url, args.requests, args.concurrency)
+        )
+
+    sync_rps = args.requests / sync_elapsed
+    async_rps = args.requests / async_elapsed
+    print(
+        f"sync : {args.requests} requests in {sync_elapsed:.2f}s ({sync_rps:.0f} req/s)"
+    )
+    print(
+        f"async: {args.requests} requests in {async_elapsed:.2f}s ({async_rps:.0f} req/s)"
+    )
+    print(f"speedup: {async_rps / sync_rps:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
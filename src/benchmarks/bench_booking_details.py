@@ -0,0 +1,45 @@
+"""
+Compares a full-dataset consistency check done as N+1 sequential calls
+(get_booking_ids, then get_booking per id) with get_bookings_detailed, against
+the local stub server.
+
+Usage:
+    python -m src.benchmarks.bench_booking_details --bookings 1000 --latency 0.02
+"""
+
+import argparse
+from time import perf_counter
+
+from src.models.services.booking_service import BookingService
+from src.stub.booking_stub_server import BookingStubApp, StubServer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bookings", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+
+    app = BookingStubApp(dataset_size=args.bookings)
+    with StubServer(app=app, latency=args.latency) as server:
+        service = BookingService(base_url=server.base_url)
+
+        start = perf_counter()
+        booking_ids = [booking.bookingid for booking in service.get_booking_ids().data]
+        details = [service.get_booking(booking_id).data for booking_id in booking_ids]
+        sequential = perf_counter() - start
+
+        start = perf_counter()
+        result = service.get_bookings_detailed(concurrency=args.concurrency)
+        detailed = [response.data for response in result]
+        concurrent = perf_counter() - start
+
+    assert detailed == details
+    print(f"sequential           : {len(details)} bookings in {sequential:.2f}s")
+    print(f"get_bookings_detailed: {len(detailed)} bookings in {concurrent:.2f}s")
+    print(f"speedup: {sequential / concurrent:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
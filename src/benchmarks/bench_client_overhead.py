@@ -0,0 +1,293 @@
+"""
+Measures what the ServiceBase request pipeline itself costs: payload
+serialization, transport dispatch through requests, JSON decoding, model
+validation and the Response envelope. Requests never reach the network: a
+CannedAdapter answers them from memory with bodies produced by the stub app,
+so the numbers are pure client CPU time and allocations.
+
+For every scenario it reports calls/s, microseconds per call split into stages
+(from Response.timings), the memory blocks allocated per call and the peak
+memory of a call (tracemalloc). Times are medians of --repeat runs.
+
+--save-baseline stores the results, --check compares against them and exits
+with status 1 when a scenario got slower or allocates more blocks. Absolute
+times move with the machine and its load, so the check compares the cost of a
+call relative to a fixed calibration loop timed in the same process, and fails
+past --tolerance. Block counts barely vary between runs and get the tighter
+--alloc-tolerance.
+
+Usage:
+    python -m src.benchmarks.bench_client_overhead
+    python -m src.benchmarks.bench_client_overhead --save-baseline
+    python -m src.benchmarks.bench_client_overhead --check --tolerance 0.5
+"""
+
+import argparse
+import json
+import os
+import sys
+import tracemalloc
+from io import BytesIO
+from statistics import median
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3 import HTTPResponse
+
+from src.models.requests.booking.booking_model import BookingDates, BookingModel
+from src.models.responses.base.response import Timings
+from src.models.services.booking_service import BookingService
+from src.stub.booking_stub_server import BookingStubApp
+
+BASE_URL = "http://client-overhead.invalid"
+BASELINE_PATH = os.path.join(
+    os.path.dirname(__file__), "baselines", "client_overhead.json"
+)
+
+CannedResponse = Tuple[int, Dict[str, str], bytes]
+
+CALIBRATION_ITEMS = [
+    {"bookingid": index, "firstname": f"Guest{index}", "totalprice": index}
+    for index in range(100)
+]
+
+
+class CannedAdapter(BaseAdapter):
+    """
+    Answers every request from ``responses``, keyed by method and path, without
+    opening a connection.
+    """
+
+    def __init__(self, responses: Dict[Tuple[str, str], CannedResponse]) -> None:
+        super().__init__()
+        self.responses = responses
+
+    def send(
+        self, request: requests.PreparedRequest, **kwargs: Any
+    ) -> requests.Response:
+        status, headers, content = self.responses[
+            (request.method, urlsplit(request.url).path)
+        ]
+        response = requests.Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict(headers)
+        response.raw = HTTPResponse(
+            body=BytesIO(content), headers=headers, status=status, preload_content=False
+        )
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def build_service(ids: int) -> BookingService:
+    app = BookingStubApp(dataset_size=ids)
+    booking = build_booking().model_dump_json().encode("utf-8")
+    responses = {
+        ("GET", "/booking"): app.handle("GET", "/booking", {}, b""),
+        ("GET", "/booking/1"): app.handle("GET", "/booking/1", {}, b""),
+        ("POST", "/booking"): app.handle("POST", "/booking", {}, booking),
+    }
+    service = BookingService(base_url=BASE_URL)
+    adapter = CannedAdapter(responses)
+    service.mount("http://", adapter)
+    return service
+
+
+def build_booking() -> BookingModel:
+    return BookingModel(
+        firstname="Jim",
+        lastname="Brown",
+        totalprice=111,
+        depositpaid=True,
+        bookingdates=BookingDates(checkin="2018-01-01", checkout="2019-01-01"),
+        additionalneeds="Breakfast",
+    )
+
+
+def scenarios() -> Dict[str, Callable[[], Any]]:
+    booking = build_booking()
+    small, medium, large = (
+        build_service(10),
+        build_service(1000),
+        build_service(100_000),
+    )
+    return {
+        "get_booking_ids[10]": small.get_booking_ids,
+        "get_booking_ids[1k]": medium.get_booking_ids,
+        "get_booking_ids[100k]": large.get_booking_ids,
+        "get_booking": lambda: small.get_booking(1),
+        "add_booking": lambda: small.add_booking(booking),
+    }
+
+
+def calibration_loop(loops: int) -> int:
+    """
+    Runs a fixed pure-Python workload (JSON round trip and dict building)
+    ``loops`` times and returns the nanoseconds it took: the unit the scenario
+    times are compared in.
+    """
+    start = perf_counter_ns()
+    for _ in range(loops):
+        for item in json.loads(json.dumps(CALIBRATION_ITEMS)):
+            {key: str(value) for key, value in item.items()}
+    return perf_counter_ns() - start
+
+
+def measure(call: Callable[[], Any], min_time: float, repeat: int) -> Dict[str, float]:
+    def run(calls: int) -> Tuple[int, Timings]:
+        stages = Timings()
+        start = perf_counter_ns()
+        for _ in range(calls):
+            response = call()
+            response.data
+            timings = response.timings
+            stages.ttfb_ns += timings.network_ns
+            stages.decode_ns += timings.decode_ns
+            stages.validation_ns += timings.validation_ns
+            stages.total_ns += timings.total_ns
+        return perf_counter_ns() - start, stages
+
+    calls = 1
+    while run(calls)[0] < min_time * 1e9 / repeat:
+        calls *= 2
+    loops = 1
+    while calibration_loop(loops) < min_time * 1e9 / repeat:
+        loops *= 2
+
+    # Each run is paired with a calibration run right after it, so both see the
+    # same machine state, and the median of their ratios is kept
+    runs = []
+    for _ in range(repeat):
+        elapsed, stages = run(calls)
+        calibration_ns = calibration_loop(loops) / loops
+        runs.append((elapsed / calls / calibration_ns, elapsed, stages))
+    runs.sort(key=lambda r: r[0])
+    relative_cost, elapsed, stages = runs[len(runs) // 2]
+
+    blocks, peak = allocations(call, min(calls, 5))
+
+    def per_call_us(nanoseconds: float) -> float:
+        return nanoseconds / calls / 1000
+
+    # total_ns does not include parsing, which is timed on its own
+    other_ns = stages.total_ns - stages.ttfb_ns
+    return {
+        "calls_per_s": calls / (elapsed / 1e9),
+        "us_per_call": per_call_us(elapsed),
+        "relative_cost": relative_cost,
+        "transport_us": per_call_us(stages.ttfb_ns),
+        "decode_us": per_call_us(stages.decode_ns),
+        "validation_us": per_call_us(stages.validation_ns),
+        "other_us": per_call_us(other_ns),
+        "blocks_per_call": blocks,
+        "peak_kib": peak / 1024,
+    }
+
+
+def allocations(call: Callable[[], Any], samples: int) -> Tuple[float, int]:
+    """
+    Median number of memory blocks a call leaves allocated while its parsed
+    response is alive (from tracemalloc snapshots), and the peak bytes of a call.
+    """
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    counts = []
+    peak = 0
+    tracemalloc.start()
+    try:
+        call().data  # warm up the caches filled on first use
+        for _ in range(samples):
+            before = tracemalloc.take_snapshot().filter_traces(ignore)
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            response = call()
+            response.data
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - base)
+            after = tracemalloc.take_snapshot().filter_traces(ignore)
+            counts.append(
+                sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+            )
+            del response
+    finally:
+        tracemalloc.stop()
+    return median(counts), peak
+
+
+def check(
+    results: Dict[str, Dict[str, float]],
+    path: str,
+    tolerance: float,
+    alloc_tolerance: float,
+) -> bool:
+    with open(path, encoding="utf-8") as file:
+        baseline = json.load(file)
+    passed = True
+    for name, result in results.items():
+        expected = baseline.get(name)
+        if expected is None:
+            print(f"{name}: no baseline")
+            continue
+        for metric, metric_tolerance in (
+            ("relative_cost", tolerance),
+            ("blocks_per_call", alloc_tolerance),
+        ):
+            if metric not in expected:
+                print(f"{name} {metric}: no baseline")
+                continue
+            limit = expected[metric] * (1 + metric_tolerance)
+            if result[metric] > limit:
+                passed = False
+                print(
+                    f"REGRESSION {name} {metric}: {result[metric]:.1f} > {limit:.1f} "
+                    f"(baseline {expected[metric]:.1f})"
+                )
+    return passed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--min-time", type=float, default=0.5)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--check", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.5)
+    parser.add_argument("--alloc-tolerance", type=float, default=0.1)
+    args = parser.parse_args()
+
+    results = {}
+    print(
+        f"{'scenario':<22} {'calls/s':>9} {'us/call':>9} {'transport':>9} "
+        f"{'decode':>8} {'validate':>9} {'other':>7} {'blocks':>8} {'peak KiB':>9}"
+    )
+    for name, call in scenarios().items():
+        result = results[name] = measure(call, args.min_time, args.repeat)
+        print(
+            f"{name:<22} {result['calls_per_s']:>9.0f} {result['us_per_call']:>9.1f} "
+            f"{result['transport_us']:>9.1f} {result['decode_us']:>8.1f} "
+            f"{result['validation_us']:>9.1f} {result['other_us']:>7.1f} "
+            f"{result['blocks_per_call']:>8.0f} {result['peak_kib']:>9.1f}"
+        )
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+            file.write("\n")
+        print(f"Baseline saved to {args.baseline}")
+    if args.check and not check(
+        results, args.baseline, args.tolerance, args.alloc_tolerance
+    ):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Compares a list of BookingDetails models with a ColumnTable holding the same
+bookings: memory per booking and the time of "sum of totalprice" plus "count of
+depositpaid".
+
+Usage:
+    python -m src.benchmarks.bench_columnar --bookings 100000
+"""
+
+import argparse
+import tracemalloc
+from time import perf_counter
+
+from src.base.columnar import ColumnTable
+from src.models.responses.booking.booking_response import BookingDetails
+from src.models.services.booking_service import BOOKING_COLUMNS
+from src.stub.booking_stub_server import BookingStubApp
+
+
+def build_models(count: int):
+    return [
+        BookingDetails.model_validate(BookingStubApp._sample_booking(index))
+        for index in range(count)
+    ]
+
+
+def build_table(count: int) -> ColumnTable:
+    table = ColumnTable(BOOKING_COLUMNS)
+    for index, booking in enumerate(build_models(count)):
+        table.append(
+            {
+                "bookingid": index + 1,
+                "firstname": booking.firstname,
+                "lastname": booking.lastname,
+                "totalprice": booking.totalprice,
+                "depositpaid": booking.depositpaid,
+                "checkin": booking.bookingdates.checkin,
+                "checkout": booking.bookingdates.checkout,
+                "additionalneeds": booking.additionalneeds,
+            }
+        )
+    return table
+
+
+def measure(build, count: int):
+    tracemalloc.start()
+    result = build(count)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bookings", type=int, default=100_000)
+    args = parser.parse_args()
+
+    models, model_bytes = measure(build_models, args.bookings)
+    start = perf_counter()
+    total = sum(booking.totalprice for booking in models)
+    paid = sum(1 for booking in models if booking.depositpaid)
+    model_elapsed = perf_counter() - start
+    del models
+
+    table, table_bytes = measure(build_table, args.bookings)
+    start = perf_counter()
+    assert table["totalprice"].sum() == total
+    assert table["depositpaid"].count(True) == paid
+    table_elapsed = perf_counter() - start
+
+    print(
+        f"models : {model_bytes:7.0f} B/booking, aggregates {model_elapsed * 1e3:.1f}ms"
+    )
+    print(
+        f"columns: {table_bytes:7.0f} B/booking, aggregates {table_elapsed * 1e3:.1f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Compares the response decode modes on large list payloads.
+
+Usage:
+    python -m src.benchmarks.bench_decoding --ids 100000 --bookings 10000
+"""
+
+import argparse
+import json
+from timeit import repeat
+from typing import List
+
+from src.base.decoding import DecodeMode, parse_response_data
+from src.models.responses.booking.booking_response import (
+    BookingDetails,
+    BookingIdResponse,
+)
+
+
+def build_payloads(ids: int, bookings: int) -> dict:
+    booking = {
+        "firstname": "Jim",
+        "lastname": "Brown",
+        "totalprice": 111,
+        "depositpaid": True,
+        "bookingdates": {"checkin": "2020-01-01", "checkout": "2021-01-01"},
+        "additionalneeds": "Breakfast",
+    }
+    return {
+        f"{ids} x BookingIdResponse": (
+            json.dumps([{"bookingid": index} for index in range(ids)]).encode(),
+            List[BookingIdResponse],
+        ),
+        f"{bookings} x BookingDetails": (
+            json.dumps([booking] * bookings).encode(),
+            List[BookingDetails],
+        ),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ids", type=int, default=100_000)
+    parser.add_argument("--bookings", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for name, (content, response_model) in build_payloads(
+        args.ids, args.bookings
+    ).items():
+        print(f"\n{name} ({len(content) / 1024:.0f} KiB)")
+        baseline = None
+        for decode_mode in DecodeMode:
+            best = min(
+                repeat(
+                    lambda: parse_response_data(
+                        content, response_model, decode_mode=decode_mode
+                    ),
+                    number=1,
+                    repeat=args.repeat,
+                )
+            )
+            baseline = baseline or best
+            print(
+                f"  {decode_mode.name:<10} {best * 1000:8.1f} ms"
+                f"  {baseline / best:5.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Compares concurrent booking reads over HTTP/1.1 (requests, the default
+transport) and HTTP/2 (Http2Transport, multiplexed over one connection)
+against local stub servers with the same simulated latency.
+
+With --pool-block the HTTP/1.1 pool keeps at most --pool-maxsize requests in
+flight, as when a server or proxy caps connections per client; HTTP/2 still
+sends every request over its single connection. Client and stub servers share
+one interpreter, so without that cap both are bound by Python CPU time.
+
+Usage:
+    python -m src.benchmarks.bench_http2 --requests 2000 --concurrency 100 \
+        --latency 0.1 --pool-maxsize 10 --pool-block
+"""
+
+import argparse
+from time import perf_counter
+
+from src.base.api_client import api_client_instance
+from src.base.bulk import run_bulk
+from src.base.transport import Http2Transport
+from src.models.services.booking_service import BookingService
+from src.stub.booking_stub_server import StubServer
+from src.stub.h2_stub_server import H2StubServer
+
+
+def run(service: BookingService, requests: int, concurrency: int) -> float:
+    booking_ids = [index % 10 + 1 for index in range(requests)]
+    start = perf_counter()
+    result = run_bulk(service.get_booking, booking_ids, concurrency)
+    elapsed = perf_counter() - start
+    if result.failures:
+        raise SystemExit(f"{len(result.failures)} requests failed")
+    return elapsed
+
+
+def report(name: str, requests: int, elapsed: float, connections: int) -> float:
+    rps = requests / elapsed
+    print(
+        f"{name}: {requests} requests in {elapsed:.2f}s ({rps:.0f} req/s), "
+        f"{connections} connections opened"
+    )
+    return rps
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--pool-maxsize", type=int, default=10)
+    parser.add_argument("--pool-block", action="store_true")
+    args = parser.parse_args()
+
+    api_client_instance.configure(
+        pool_maxsize=args.pool_maxsize, pool_block=args.pool_block
+    )
+    with StubServer(latency=args.latency) as server:
+        service = BookingService(base_url=server.base_url)
+        api_client_instance.stats.reset()
+        elapsed = run(service, args.requests, args.concurrency)
+        http1_rps = report(
+            "HTTP/1.1",
+            args.requests,
+            elapsed,
+            api_client_instance.stats.snapshot()["misses"],
+        )
+
+    with H2StubServer(latency=args.latency) as server:
+        transport = Http2Transport()
+        service = BookingService(base_url=server.base_url)
+        service.transport = transport
+        elapsed = run(service, args.requests, args.concurrency)
+        http2_rps = report(
+            "HTTP/2  ", args.requests, elapsed, transport.connections_opened
+        )
+        transport.close()
+
+    print(f"speedup: {http2_rps / http1_rps:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Compares request body serialization: model_dump + json (the previous path),
+encode_payload (single pass to bytes) and a pre-encoded EncodedPayload.
+
+Usage:
+    python -m src.benchmarks.bench_serialization --bookings 10000
+"""
+
+import argparse
+import json
+from timeit import repeat
+
+from src.base.encoding import EncodedPayload, encode_payload
+from src.models.requests.booking.booking_model import BookingDates, BookingModel
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bookings", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    bookings = [
+        BookingModel(
+            firstname=f"Jim{index}",
+            lastname="Brown",
+            totalprice=index,
+            depositpaid=True,
+            bookingdates=BookingDates(checkin="2024-01-01", checkout="2024-02-01"),
+            additionalneeds="Breakfast",
+        )
+        for index in range(args.bookings)
+    ]
+    encoded = [EncodedPayload(booking) for booking in bookings]
+    candidates = {
+        "model_dump + json.dumps": lambda: [
+            json.dumps(booking.model_dump(exclude_none=True)).encode("utf-8")
+            for booking in bookings
+        ],
+        "encode_payload": lambda: [encode_payload(booking) for booking in bookings],
+        "EncodedPayload": lambda: [encode_payload(payload) for payload in encoded],
+    }
+
+    baseline = None
+    for name, candidate in candidates.items():
+        best = min(repeat(candidate, number=1, repeat=args.repeat))
+        baseline = baseline or best
+        per_call = best / args.bookings * 1_000_000
+        print(f"{name:<25} {per_call:6.2f} us/booking  {baseline / best:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
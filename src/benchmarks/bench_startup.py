@@ -0,0 +1,61 @@
+"""
+Measures what test collection and fixture setup pay for the framework: the
+import time of a service module (in fresh interpreters) and the cost of
+creating service instances.
+
+Usage:
+    python -m src.benchmarks.bench_startup --imports 10 --instances 1000
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from time import perf_counter
+
+IMPORT_SNIPPET = (
+    "from time import perf_counter; start = perf_counter(); "
+    "import src.models.services.booking_service; "
+    "print(perf_counter() - start)"
+)
+
+
+def measure_import(runs: int) -> float:
+    timings = [
+        float(
+            subprocess.run(
+                [sys.executable, "-c", IMPORT_SNIPPET],
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout
+        )
+        for _ in range(runs)
+    ]
+    return statistics.median(timings)
+
+
+def measure_instances(instances: int) -> float:
+    from src.models.services.booking_service import BookingService
+
+    BookingService(base_url="http://localhost")
+    start = perf_counter()
+    for _ in range(instances):
+        BookingService(base_url="http://localhost")
+    return (perf_counter() - start) / instances
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--imports", type=int, default=10)
+    parser.add_argument("--instances", type=int, default=1000)
+    args = parser.parse_args()
+
+    import_time = measure_import(args.imports)
+    instance_time = measure_instances(args.instances)
+    print(f"import booking_service: {import_time * 1000:.1f} ms (median)")
+    print(f"BookingService(): {instance_time * 1_000_000:.1f} us per instance")
+
+
+if __name__ == "__main__":
+    main()
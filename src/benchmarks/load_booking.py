@@ -0,0 +1,70 @@
+"""
+Load test of the booking endpoints against the local stub server (or BASE_URL
+with --base-url), driven by the framework's LoadRunner.
+
+Usage:
+    python -m src.benchmarks.load_booking --duration 10 --concurrency 20
+    python -m src.benchmarks.load_booking --rps 500 --ramp-up 2 --processes 4
+"""
+
+import argparse
+from contextlib import nullcontext
+
+from src.base.load_runner import LoadRunner, Scenario
+from src.models.requests.booking.booking_model import BookingDates, BookingModel
+from src.models.services.booking_service import BookingService
+from src.stub.booking_stub_server import StubServer
+
+
+class CreateAndReadBooking(Scenario):
+    def __init__(self, base_url: str) -> None:
+        self.base_url = base_url
+
+    def setup(self) -> None:
+        self.booking_service = BookingService(base_url=self.base_url)
+        self.booking = BookingModel(
+            firstname="Load",
+            lastname="Test",
+            totalprice=100,
+            depositpaid=True,
+            bookingdates=BookingDates(checkin="2024-01-01", checkout="2024-01-02"),
+            additionalneeds="Breakfast",
+        )
+
+    def run(self) -> None:
+        created = self.booking_service.add_booking(self.booking)
+        assert created.status == 200, created.status
+        fetched = self.booking_service.get_booking(created.data.bookingid)
+        assert fetched.status == 200, fetched.status
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--base-url")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--rps", type=float)
+    parser.add_argument("--ramp-up", type=float, default=0.0)
+    parser.add_argument("--processes", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = nullcontext() if args.base_url else StubServer(latency=args.latency)
+    with server:
+        runner = LoadRunner(
+            CreateAndReadBooking,
+            duration=args.duration,
+            concurrency=args.concurrency,
+            rps=args.rps,
+            ramp_up=args.ramp_up,
+            processes=args.processes,
+            scenario_kwargs={"base_url": args.base_url or server.base_url},
+        )
+        report = runner.run()
+
+    for line in report.format():
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,238 @@
-from typing import TypeVar, Generic
-from pydantic import BaseModel
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Generic,
+    Mapping,
+    Optional,
+    Type,
+    TypeVar,
+)
+
+from src.base.decoding import DecodeMode, parse_response_data
+from src.base.hooks import request_hooks_instance
+
+if TYPE_CHECKING:
+    from src.base.hooks import RequestContext
 
 T = TypeVar("T")
 
+_UNSET = object()
+
+
+class Timings:
+    """
+    Monotonic (``perf_counter_ns``) breakdown of a request, in nanoseconds, and
+    the size of its bodies.
+
+    connect_ns: DNS lookup and TCP/TLS connect; 0 when a keep-alive connection was reused.
+    ttfb_ns: from sending the request until the response headers arrived, without connect.
+    download_ns: reading the response body.
+    decode_ns: JSON decoding of the body.
+    validation_ns: building the response model. DecodeMode.JSON_BYTES decodes and
+        validates in a single step, which is counted here.
+    total_ns: the whole call, payload serialization included, without parsing.
+    retries: requests sent again by the service's RetryPolicy.
+    backoff_ns: time spent waiting between those retries. The network times above
+        are the ones of the last attempt.
+    throttle_ns: time spent waiting for the client-side rate limiter.
+    payload_bytes / sent_bytes: the request body before and after compression.
+    received_bytes: the response body as it came over the network (compressed
+        when the server applied a Content-Encoding).
+    decoded_bytes: the response body once decompressed.
+
+    The body is parsed when ``Response.data`` is first read: decode_ns and
+    validation_ns are filled in then. total_ns is final once the response is
+    returned (it is what the metrics sinks record); parsing_ns is the cost of
+    parsing on top of it.
+    """
+
+    __slots__ = (
+        "connect_ns",
+        "ttfb_ns",
+        "download_ns",
+        "decode_ns",
+        "validation_ns",
+        "total_ns",
+        "retries",
+        "backoff_ns",
+        "throttle_ns",
+        "payload_bytes",
+        "sent_bytes",
+        "received_bytes",
+        "decoded_bytes",
+    )
+
+    def __init__(
+        self,
+        connect_ns: int = 0,
+        ttfb_ns: int = 0,
+        download_ns: int = 0,
+        decode_ns: int = 0,
+        validation_ns: int = 0,
+        total_ns: int = 0,
+        retries: int = 0,
+        backoff_ns: int = 0,
+        throttle_ns: int = 0,
+        payload_bytes: int = 0,
+        sent_bytes: int = 0,
+        received_bytes: int = 0,
+        decoded_bytes: int = 0,
+    ) -> None:
+        self.connect_ns = connect_ns
+        self.ttfb_ns = ttfb_ns
+        self.download_ns = download_ns
+        self.decode_ns = decode_ns
+        self.validation_ns = validation_ns
+        self.total_ns = total_ns
+        self.retries = retries
+        self.backoff_ns = backoff_ns
+        self.throttle_ns = throttle_ns
+        self.payload_bytes = payload_bytes
+        self.sent_bytes = sent_bytes
+        self.received_bytes = received_bytes
+        self.decoded_bytes = decoded_bytes
+
+    @property
+    def network_ns(self) -> int:
+        return self.connect_ns + self.ttfb_ns + self.download_ns
+
+    @property
+    def parsing_ns(self) -> int:
+        return self.decode_ns + self.validation_ns
+
+    def as_ms(self) -> Dict[str, float]:
+        return {
+            name.removesuffix("_ns") + "_ms": getattr(self, name) / 1_000_000
+            for name in self.__slots__
+            if name.endswith("_ns")
+        }
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)}" for name in self.__slots__)
+        return f"Timings({values})"
+
+
+class Response(Generic[T]):
+    """
+    Envelope returned by the services.
+
+    ``status``, ``timings`` and ``from_cache`` are set right away. ``data`` is
+    decoded and validated against the response model on first access, and
+    ``headers`` is copied into a dict on first access, so checks that only look at
+    the status skip both.
+    """
+
+    __slots__ = (
+        "status",
+        "timings",
+        "from_cache",
+        "_raw_headers",
+        "_headers",
+        "_content",
+        "_response_model",
+        "_encoding",
+        "_decode_mode",
+        "_data",
+        "_context",
+    )
+
+    def __init__(
+        self,
+        status: int,
+        headers: Mapping[str, str],
+        content: bytes = b"",
+        response_model: Optional[Type] = None,
+        encoding: Optional[str] = None,
+        decode_mode: DecodeMode = DecodeMode.STANDARD,
+        timings: Optional[Timings] = None,
+        from_cache: bool = False,
+        data: Any = _UNSET,
+        context: Optional["RequestContext"] = None,
+    ) -> None:
+        self.status = status
+        self.timings = timings if timings is not None else Timings()
+        self.from_cache = from_cache
+        self._raw_headers = headers
+        self._headers = None
+        self._content = content
+        self._response_model = response_model
+        self._encoding = encoding
+        self._decode_mode = decode_mode
+        self._data = data
+        self._context = context
+
+    @property
+    def data(self) -> T:
+        if self._data is _UNSET:
+            if self._context is not None:
+                return self._parse_with_hooks()
+            self._parse()
+        return self._data
+
+    def _parse(self) -> None:
+        self._data = parse_response_data(
+            self._content,
+            self._response_model,
+            self._encoding,
+            self._decode_mode,
+            self.timings,
+        )
+        self._content = None
+
+    def _parse_with_hooks(self) -> T:
+        context = self._context
+        context.response = self
+        request_hooks_instance.before_parse(context)
+        try:
+            self._parse()
+        except Exception as error:
+            context.error = error
+            raise
+        finally:
+            request_hooks_instance.after_parse(context)
+            self._context = None
+        return self._data
+
+    @property
+    def content(self) -> Optional[bytes]:
+        """
+        Raw body bytes, released (None) once ``data`` has been parsed.
+        """
+        return self._content
+
+    def set_data(self, data: T, validation_ns: int = 0) -> None:
+        """
+        Stores ``data`` parsed elsewhere (e.g. validated in bulk with other
+        responses) in place of the lazy parsing of the body.
+        """
+        self._data = data
+        self._content = None
+        self.timings.validation_ns = validation_ns
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        if self._headers is None:
+            self._headers = dict(self._raw_headers)
+        return self._headers
+
+    @property
+    def response_time(self) -> float:
+        """
+        Milliseconds, same as ``timings.total_ns``.
+        """
+        return self.timings.total_ns / 1_000_000
+
+    @property
+    def parsing_time(self) -> float:
+        """
+        Milliseconds spent decoding and validating ``data`` (0 until it is read),
+        not included in ``response_time``.
+        """
+        return self.timings.parsing_ns / 1_000_000
 
-class Response(BaseModel, Generic[T]):
-    data: T
-    status: int
-    headers: dict
-    response_time: int
+    def __repr__(self) -> str:
+        return (
+            f"Response(status={self.status}, "
+            f"response_time={self.response_time:.1f}ms, from_cache={self.from_cache})"
+        )
@@ -0,0 +1,10 @@
+from src.base.async_service_base import AsyncServiceBase
+from src.models.requests.credentials.credentials_model import CredentialsModel
+
+
+class AsyncAuthService(AsyncServiceBase):
+    def __init__(self, store_name: str = None, base_url: str = ""):
+        super().__init__("auth", base_url=base_url, store_name=store_name)
+
+    async def sign_in(self, credentials: CredentialsModel):
+        return await self.post(self.url, credentials)
@@ -0,0 +1,127 @@
+from typing import List, Sequence
+
+from src.base.async_service_base import AsyncServiceBase
+from src.base.bulk import BulkResult, run_bulk_async, validate_bulk
+from src.models.requests.booking.booking_model import BookingModel
+from src.models.responses.base.response import Response
+from src.models.responses.booking.booking_response import (
+    BookingIdResponse,
+    BookingDetails,
+    BookingResponse,
+)
+
+
+class AsyncBookingService(AsyncServiceBase):
+    def __init__(self, store_name: str = None, base_url: str = ""):
+        super().__init__("/booking", base_url=base_url, store_name=store_name)
+
+    async def get_booking_ids(
+        self, params: dict = None, config: dict = None
+    ) -> Response[List[BookingIdResponse]]:
+        config = dict(config or self.default_config)
+        if params:
+            config["params"] = params
+        return await self.get(
+            self.url, config=config, response_model=List[BookingIdResponse]
+        )
+
+    async def get_booking(
+        self, booking_id: int, config: dict | None = None
+    ) -> Response[BookingDetails]:
+        config = config or self.default_config
+        return await self.get(
+            f"{self.url}/{booking_id}",
+            config=config,
+            response_model=BookingDetails,
+        )
+
+    async def add_booking(
+        self, booking: BookingModel, config: dict | None = None
+    ) -> Response[BookingResponse]:
+        config = config or self.default_config
+        return await self.post(
+            self.url,
+            booking,
+            config=config,
+            response_model=BookingResponse,
+        )
+
+    async def update_booking(
+        self, booking_id: int, booking: BookingModel, config: dict | None = None
+    ) -> Response[BookingDetails]:
+        config = config or self.default_config
+        return await self.put(
+            f"{self.url}/{booking_id}",
+            booking,
+            config=config,
+            response_model=BookingDetails,
+        )
+
+    async def partial_update_booking(
+        self, booking_id: int, booking: BookingModel, config: dict | None = None
+    ) -> Response[BookingDetails]:
+        config = config or self.default_config
+        return await self.patch(
+            f"{self.url}/{booking_id}",
+            booking,
+            config=config,
+            response_model=BookingDetails,
+        )
+
+    async def delete_booking(
+        self, booking_id: int, config: dict | None = None
+    ) -> Response[BookingDetails]:
+        config = config or self.default_config
+        return await self.delete(
+            f"{self.url}/{booking_id}",
+            config=config,
+            response_model=BookingDetails,
+        )
+
+    async def add_bookings(
+        self,
+        bookings: Sequence[BookingModel],
+        concurrency: int = 100,
+        config: dict | None = None,
+    ) -> BulkResult[BookingResponse]:
+        return await run_bulk_async(
+            lambda booking: self.add_booking(booking, config), bookings, concurrency
+        )
+
+    async def get_bookings(
+        self,
+        booking_ids: Sequence[int],
+        concurrency: int = 100,
+        config: dict | None = None,
+    ) -> BulkResult[BookingDetails]:
+        return await run_bulk_async(
+            lambda booking_id: self.get_booking(booking_id, config),
+            booking_ids,
+            concurrency,
+        )
+
+    async def get_bookings_detailed(
+        self,
+        booking_ids: Sequence[int],
+        concurrency: int = 100,
+        config: dict | None = None,
+    ) -> BulkResult[BookingDetails]:
+        """
+        Fetches the details of ``booking_ids`` concurrently and validates all
+        bodies into BookingDetails in one pass.
+        """
+        result = await self.get_bookings(booking_ids, concurrency, config)
+        validate_bulk(result, BookingDetails)
+        return result
+
+    async def delete_bookings(
+        self,
+        booking_ids: Sequence[int],
+        concurrency: int = 100,
+        config: dict | None = None,
+    ) -> BulkResult[BookingDetails]:
+        return await run_bulk_async(
+            lambda booking_id: self.delete_booking(booking_id, config),
+            booking_ids,
+            concurrency,
+        )
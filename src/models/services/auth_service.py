@@ -3,8 +3,8 @@ from src.models.requests.credentials.credentials_model import CredentialsModel
 
 
 class AuthService(ServiceBase):
-    def __init__(self, store_name: str = None):
-        super().__init__("auth", store_name=store_name)
+    def __init__(self, store_name: str = None, base_url: str = ""):
+        super().__init__("auth", base_url=base_url, store_name=store_name)
 
     def sign_in(self, credentials: CredentialsModel):
         return self.post(self.url, credentials)
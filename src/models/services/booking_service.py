@@ -1,5 +1,9 @@
-from typing import List
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
+from requests import HTTPError
+
+from src.base.bulk import BulkFailure, BulkResult, iter_bulk, run_bulk, validate_bulk
+from src.base.columnar import ColumnTable
 from src.base.service_base import ServiceBase
 from src.models.requests.booking.booking_model import BookingModel
 from src.models.responses.base.response import Response
@@ -9,10 +13,21 @@ from src.models.responses.booking.booking_response import (
     BookingResponse,
 )
 
+BOOKING_COLUMNS = {
+    "bookingid": "int",
+    "firstname": "str",
+    "lastname": "str",
+    "totalprice": "int",
+    "depositpaid": "bool",
+    "checkin": "date",
+    "checkout": "date",
+    "additionalneeds": "str",
+}
+
 
 class BookingService(ServiceBase):
-    def __init__(self, store_name: str = None):
-        super().__init__("/booking", store_name=store_name)
+    def __init__(self, store_name: str = None, base_url: str = ""):
+        super().__init__("/booking", base_url=base_url, store_name=store_name)
 
     def get_booking_ids(
         self, params: dict = None, config: dict = None
@@ -22,6 +37,14 @@ class BookingService(ServiceBase):
             config["params"] = params
         return self.get(self.url, config=config, response_model=List[BookingIdResponse])
 
+    def iter_booking_ids(
+        self, params: dict = None, config: dict = None
+    ) -> Iterator[BookingIdResponse]:
+        config = dict(config or self.default_config)
+        if params:
+            config["params"] = params
+        return self.stream_items(self.url, BookingIdResponse, config=config)
+
     def get_booking(
         self, booking_id: int, config: dict | None = None
     ) -> Response[BookingDetails]:
@@ -74,3 +97,124 @@ class BookingService(ServiceBase):
             config=config,
             response_model=BookingDetails,
         )
+
+    def add_bookings(
+        self,
+        bookings: Sequence[BookingModel],
+        concurrency: int = 10,
+        config: dict | None = None,
+    ) -> BulkResult[BookingResponse]:
+        return run_bulk(
+            lambda booking: self.add_booking(booking, config), bookings, concurrency
+        )
+
+    def get_bookings(
+        self,
+        booking_ids: Sequence[int],
+        concurrency: int = 10,
+        config: dict | None = None,
+    ) -> BulkResult[BookingDetails]:
+        return run_bulk(
+            lambda booking_id: self.get_booking(booking_id, config),
+            booking_ids,
+            concurrency,
+        )
+
+    def get_bookings_detailed(
+        self,
+        booking_ids: Optional[Sequence[int]] = None,
+        concurrency: int = 10,
+        config: dict | None = None,
+    ) -> BulkResult[BookingDetails]:
+        """
+        Fetches the details of ``booking_ids`` (every booking when None)
+        concurrently and validates all bodies into BookingDetails in one pass.
+        """
+        if booking_ids is None:
+            booking_ids = self._all_booking_ids(config)
+        result = self.get_bookings(booking_ids, concurrency, config)
+        validate_bulk(result, BookingDetails)
+        return result
+
+    def iter_bookings_detailed(
+        self,
+        booking_ids: Optional[Iterable[int]] = None,
+        concurrency: int = 10,
+        config: dict | None = None,
+    ) -> Iterator[Tuple[int, int, Union[Response[BookingDetails], BulkFailure]]]:
+        """
+        Yields ``(index, booking_id, response or BulkFailure)`` as each booking
+        arrives, for checks that can start before the whole dataset is in.
+        ``index`` is the position of the booking in ``booking_ids``.
+        """
+        if booking_ids is None:
+            booking_ids = self._all_booking_ids(config)
+        return iter_bulk(
+            lambda booking_id: self.get_booking(booking_id, config),
+            booking_ids,
+            concurrency,
+        )
+
+    def export_bookings(
+        self,
+        booking_ids: Optional[Iterable[int]] = None,
+        concurrency: int = 10,
+        config: dict | None = None,
+    ) -> Tuple[ColumnTable, List[BulkFailure]]:
+        """
+        Streams the details of ``booking_ids`` (every booking when None) into a
+        ColumnTable, in completion order, without keeping a model per booking.
+        Returns the table and the bookings that could not be fetched or whose
+        body did not match BookingDetails.
+        """
+        table = ColumnTable(BOOKING_COLUMNS)
+        failures = []
+        for index, booking_id, outcome in self.iter_bookings_detailed(
+            booking_ids, concurrency, config
+        ):
+            if isinstance(outcome, BulkFailure):
+                failures.append(outcome)
+                continue
+            booking = outcome.data
+            if not isinstance(booking, BookingDetails):
+                # The body did not match the model and fell back to its text
+                failures.append(
+                    BulkFailure(
+                        index,
+                        booking_id,
+                        error=ValueError(f"Invalid booking body: {booking!r:.200}"),
+                        response=outcome,
+                    )
+                )
+                continue
+            table.append(
+                {
+                    "bookingid": booking_id,
+                    "firstname": booking.firstname,
+                    "lastname": booking.lastname,
+                    "totalprice": booking.totalprice,
+                    "depositpaid": booking.depositpaid,
+                    "checkin": booking.bookingdates.checkin,
+                    "checkout": booking.bookingdates.checkout,
+                    "additionalneeds": booking.additionalneeds,
+                }
+            )
+        return table, failures
+
+    def _all_booking_ids(self, config: dict | None) -> List[int]:
+        response = self.get_booking_ids(config=config)
+        if response.status >= 400:
+            raise HTTPError(f"Listing bookings failed with status {response.status}")
+        return [booking.bookingid for booking in response.data]
+
+    def delete_bookings(
+        self,
+        booking_ids: Sequence[int],
+        concurrency: int = 10,
+        config: dict | None = None,
+    ) -> BulkResult[BookingDetails]:
+        return run_bulk(
+            lambda booking_id: self.delete_booking(booking_id, config),
+            booking_ids,
+            concurrency,
+        )
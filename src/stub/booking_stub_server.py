@@ -0,0 +1,507 @@
+import argparse
+import asyncio
+import base64
+import gzip
+import hashlib
+import json
+import os
+import random
+import subprocess
+import sys
+import threading
+import zlib
+from http import HTTPStatus
+from typing import Any, Dict, Iterator, Optional, Sequence, Set, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+StubResponse = Tuple[int, Dict[str, str], bytes]
+
+
+class BookingStubApp:
+    """
+    In-memory implementation of the restful-booker /auth and /booking routes.
+
+    It mirrors the status codes and payload shapes of the public API so the
+    service models can be exercised without network access.
+
+    The ``dataset_size`` sample bookings are generated on access rather than
+    stored, so datasets of millions of bookings cost memory only for the
+    bookings that were changed. The unfiltered id list is serialized once per
+    change of the dataset. ``error_rate`` answers that fraction of requests with
+    one of ``error_statuses`` instead (seeded by ``seed`` for repeatable runs).
+
+    Like most servers, responses of at least ``compress_min_size`` bytes are
+    gzipped for clients that accept it (None disables it), and gzip or deflate
+    request bodies (``Content-Encoding``) are decompressed.
+    """
+
+    def __init__(
+        self,
+        username: str = "admin",
+        password: str = "password123",
+        dataset_size: int = 10,
+        error_rate: float = 0.0,
+        error_statuses: Sequence[int] = (500, 502, 503),
+        seed: Optional[int] = None,
+        compress_min_size: Optional[int] = 1024,
+    ) -> None:
+        self.username = username
+        self.password = password
+        self.token = hashlib.sha256(f"{username}:{password}".encode()).hexdigest()[:15]
+        self.dataset_size = dataset_size
+        self.error_rate = error_rate
+        self.error_statuses = [HTTPStatus(status) for status in error_statuses]
+        self.bookings: Dict[int, Dict[str, Any]] = {}
+        self._deleted: Set[int] = set()
+        self._next_id = dataset_size + 1
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+        self._version = 0
+        self._id_list: Optional[Tuple[int, bytes]] = None
+        self.compress_min_size = compress_min_size
+        self._gzipped: Optional[Tuple[bytes, bytes]] = None
+
+    @staticmethod
+    def _sample_booking(index: int) -> Dict[str, Any]:
+        return {
+            "firstname": f"Guest{index}",
+            "lastname": "Stub",
+            "totalprice": 100 + index,
+            "depositpaid": index % 2 == 0,
+            "bookingdates": {"checkin": "2024-01-01", "checkout": "2024-02-01"},
+            "additionalneeds": "Breakfast",
+        }
+
+    def booking(self, booking_id: int) -> Optional[Dict[str, Any]]:
+        if booking_id in self.bookings:
+            return self.bookings[booking_id]
+        if 1 <= booking_id <= self.dataset_size and booking_id not in self._deleted:
+            return self._sample_booking(booking_id - 1)
+        return None
+
+    def booking_ids(self) -> Iterator[int]:
+        for booking_id in range(1, self.dataset_size + 1):
+            if booking_id not in self._deleted and booking_id not in self.bookings:
+                yield booking_id
+        yield from list(self.bookings)
+
+    def _create(self, booking: Dict[str, Any]) -> int:
+        with self._lock:
+            booking_id = self._next_id
+            self._next_id += 1
+            self.bookings[booking_id] = booking
+            self._version += 1
+        return booking_id
+
+    def handle(
+        self, method: str, target: str, headers: Dict[str, str], body: bytes
+    ) -> StubResponse:
+        if self.error_rate and self._random.random() < self.error_rate:
+            return self._text(self._random.choice(self.error_statuses))
+        encoding = headers.get("content-encoding", "identity").lower()
+        if encoding != "identity":
+            try:
+                body = self._decompress(encoding, body)
+            except (ValueError, zlib.error, EOFError):
+                return self._text(HTTPStatus.UNSUPPORTED_MEDIA_TYPE)
+        status, response_headers, content = self._route(method, target, headers, body)
+        if method == "GET" and status == HTTPStatus.OK:
+            etag = f'"{hashlib.sha1(content).hexdigest()[:16]}"'
+            response_headers = {**response_headers, "ETag": etag}
+            if headers.get("if-none-match") == etag:
+                return HTTPStatus.NOT_MODIFIED, {"ETag": etag}, b""
+        if (
+            self.compress_min_size is not None
+            and len(content) >= self.compress_min_size
+            and _accepts_gzip(headers.get("accept-encoding", ""))
+        ):
+            response_headers = {
+                **response_headers,
+                "Content-Encoding": "gzip",
+                "Vary": "Accept-Encoding",
+            }
+            content = self._gzip(content)
+        return status, response_headers, content
+
+    @staticmethod
+    def _decompress(encoding: str, body: bytes) -> bytes:
+        if encoding == "gzip":
+            return gzip.decompress(body)
+        if encoding == "deflate":
+            return zlib.decompress(body)
+        raise ValueError(f"Unsupported Content-Encoding: {encoding}")
+
+    def _gzip(self, content: bytes) -> bytes:
+        # The unfiltered id list is the same bytes object until the dataset
+        # changes: compress it once
+        cached = self._gzipped
+        if cached is None or cached[0] is not content:
+            cached = self._gzipped = (content, gzip.compress(content, mtime=0))
+        return cached[1]
+
+    def _route(
+        self, method: str, target: str, headers: Dict[str, str], body: bytes
+    ) -> StubResponse:
+        parts = urlsplit(target)
+        segments = [segment for segment in parts.path.split("/") if segment]
+
+        if segments == ["auth"] and method == "POST":
+            return self._auth(body)
+        if segments == ["booking"]:
+            if method == "GET":
+                return self._list(parse_qs(parts.query))
+            if method == "POST":
+                return self._add(body)
+        if len(segments) == 2 and segments[0] == "booking":
+            if not segments[1].isdigit():
+                return self._text(HTTPStatus.NOT_FOUND)
+            booking_id = int(segments[1])
+            if method == "GET":
+                return self._get(booking_id)
+            if method in ("PUT", "PATCH", "DELETE") and not self._authorized(headers):
+                return self._text(HTTPStatus.FORBIDDEN)
+            if method == "PUT":
+                return self._update(booking_id, body, partial=False)
+            if method == "PATCH":
+                return self._update(booking_id, body, partial=True)
+            if method == "DELETE":
+                return self._delete(booking_id)
+        return self._text(HTTPStatus.NOT_FOUND)
+
+    def _authorized(self, headers: Dict[str, str]) -> bool:
+        cookie = headers.get("cookie", "")
+        for pair in cookie.split(";"):
+            name, _, value = pair.strip().partition("=")
+            if name == "token" and value == self.token:
+                return True
+        basic = base64.b64encode(f"{self.username}:{self.password}".encode("utf-8"))
+        return headers.get("authorization", "") == f"Basic {basic.decode('utf-8')}"
+
+    def _auth(self, body: bytes) -> StubResponse:
+        credentials = self._load(body) or {}
+        if (
+            credentials.get("username") == self.username
+            and credentials.get("password") == self.password
+        ):
+            return self._json({"token": self.token})
+        return self._json({"reason": "Bad credentials"})
+
+    def _list(self, query: Dict[str, list]) -> StubResponse:
+        filters = {key: values[0] for key, values in query.items()}
+        if not filters:
+            return self._id_list_response()
+        ids = [
+            {"bookingid": booking_id}
+            for booking_id in self.booking_ids()
+            if all(
+                self.booking(booking_id).get(key) == value
+                for key, value in filters.items()
+            )
+        ]
+        return self._json(ids)
+
+    def _id_list_response(self) -> StubResponse:
+        cached = self._id_list
+        if cached is None or cached[0] != self._version:
+            content = json.dumps(
+                [{"bookingid": booking_id} for booking_id in self.booking_ids()]
+            ).encode("utf-8")
+            cached = self._id_list = (self._version, content)
+        return (
+            HTTPStatus.OK,
+            {"Content-Type": "application/json; charset=utf-8"},
+            cached[1],
+        )
+
+    def _get(self, booking_id: int) -> StubResponse:
+        booking = self.booking(booking_id)
+        if booking is None:
+            return self._text(HTTPStatus.NOT_FOUND)
+        return self._json(booking)
+
+    def _add(self, body: bytes) -> StubResponse:
+        booking = self._load(body)
+        if not booking or not booking.get("firstname"):
+            return self._text(HTTPStatus.INTERNAL_SERVER_ERROR)
+        booking_id = self._create(booking)
+        return self._json({"bookingid": booking_id, "booking": booking})
+
+    def _update(self, booking_id: int, body: bytes, partial: bool) -> StubResponse:
+        changes = self._load(body)
+        if changes is None:
+            return self._text(HTTPStatus.BAD_REQUEST)
+        current = self.booking(booking_id)
+        if current is None:
+            return self._text(HTTPStatus.METHOD_NOT_ALLOWED)
+        booking = {**current, **changes} if partial else changes
+        with self._lock:
+            self.bookings[booking_id] = booking
+            self._version += 1
+        return self._json(booking)
+
+    def _delete(self, booking_id: int) -> StubResponse:
+        with self._lock:
+            if self.booking(booking_id) is None:
+                return self._text(HTTPStatus.METHOD_NOT_ALLOWED)
+            self.bookings.pop(booking_id, None)
+            if booking_id <= self.dataset_size:
+                self._deleted.add(booking_id)
+            self._version += 1
+        return self._text(HTTPStatus.CREATED)
+
+    @staticmethod
+    def _load(body: bytes) -> Optional[Any]:
+        try:
+            return json.loads(body) if body else None
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _json(payload: Any) -> StubResponse:
+        return (
+            HTTPStatus.OK,
+            {"Content-Type": "application/json; charset=utf-8"},
+            json.dumps(payload).encode("utf-8"),
+        )
+
+    @staticmethod
+    def _text(status: HTTPStatus) -> StubResponse:
+        return (
+            status,
+            {"Content-Type": "text/plain; charset=utf-8"},
+            status.phrase.encode("utf-8"),
+        )
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    for coding in accept_encoding.lower().split(","):
+        name, _, parameters = coding.partition(";")
+        if name.strip() in ("gzip", "*"):
+            return parameters.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00")
+    return False
+
+
+class StubServer:
+    """
+    Serves a BookingStubApp over HTTP/1.1 (with keep-alive) from an asyncio
+    event loop running on a background thread.
+
+    Example:
+        with StubServer(latency=0.01) as server:
+            service = BookingService(base_url=server.base_url)
+    """
+
+    def __init__(
+        self,
+        app: Optional[BookingStubApp] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+    ) -> None:
+        self.app = app or BookingStubApp()
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._writers: set = set()
+        self._ready = threading.Event()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> "StubServer":
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        return self
+
+    def stop(self) -> None:
+        if self._loop and self._server:
+            self._loop.call_soon_threadsafe(self._shutdown)
+        if self._thread:
+            self._thread.join()
+
+    def _shutdown(self) -> None:
+        self._server.close()
+        for writer in list(self._writers):
+            writer.close()
+        self._loop.stop()
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._server = self._loop.run_until_complete(
+            asyncio.start_server(self._handle_connection, self.host, self.port)
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._ready.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            pending = asyncio.all_tasks(self._loop)
+            self._loop.run_until_complete(
+                asyncio.gather(*pending, return_exceptions=True)
+            )
+            self._loop.close()
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self._writers.add(writer)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers: Dict[str, str] = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0))
+                body = await reader.readexactly(length) if length else b""
+
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+                status, response_headers, payload = self.app.handle(
+                    method, target, headers, body
+                )
+                keep_alive = headers.get("connection", "").lower() != "close"
+                writer.write(self._serialize(status, response_headers, payload))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    @staticmethod
+    def _serialize(status: int, headers: Dict[str, str], payload: bytes) -> bytes:
+        lines = [f"HTTP/1.1 {status} {HTTPStatus(status).phrase}"]
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        lines.append(f"Content-Length: {len(payload)}")
+        head = "\r\n".join(lines) + "\r\n\r\n"
+        return head.encode("latin-1") + payload
+
+
+class StubProcess:
+    """
+    Runs the stub server in a separate interpreter (``python -m
+    src.stub.booking_stub_server``), so its CPU time does not compete with the
+    client under test for the GIL. Options are those of the command line.
+
+    Example:
+        with StubProcess(dataset_size=1_000_000, latency=0.01) as server:
+            service = BookingService(base_url=server.base_url)
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        dataset_size: int = 10,
+        error_rate: float = 0.0,
+        seed: Optional[int] = None,
+        http2: bool = False,
+        host: str = "127.0.0.1",
+        compress_min_size: Optional[int] = 1024,
+    ) -> None:
+        self.arguments = [
+            f"--host={host}",
+            "--port=0",
+            f"--latency={latency}",
+            f"--dataset-size={dataset_size}",
+            f"--error-rate={error_rate}",
+        ]
+        if compress_min_size is None:
+            self.arguments.append("--no-compression")
+        else:
+            self.arguments.append(f"--compress-min-size={compress_min_size}")
+        if seed is not None:
+            self.arguments.append(f"--seed={seed}")
+        if http2:
+            self.arguments.append("--http2")
+        self.base_url = ""
+        self._process: Optional[subprocess.Popen] = None
+
+    def start(self) -> "StubProcess":
+        root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        self._process = subprocess.Popen(
+            [sys.executable, "-m", "src.stub.booking_stub_server", *self.arguments],
+            cwd=root,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        line = self._process.stdout.readline()
+        if not line.startswith("Serving"):
+            self.stop()
+            raise RuntimeError("The stub server process failed to start.")
+        self.base_url = line.split()[-1]
+        return self
+
+    def stop(self) -> None:
+        if self._process is not None:
+            self._process.terminate()
+            self._process.wait()
+            self._process.stdout.close()
+            self._process = None
+
+    def __enter__(self) -> "StubProcess":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+
+def main() -> None:
+    """
+    Serves the stub until interrupted and prints its base URL on the first line.
+    """
+    parser = argparse.ArgumentParser(description="Local stub of the booking API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--dataset-size", type=int, default=10)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--http2", action="store_true", help="serve h2c (needs h2)")
+    parser.add_argument("--compress-min-size", type=int, default=1024)
+    parser.add_argument("--no-compression", action="store_true")
+    args = parser.parse_args()
+
+    app = BookingStubApp(
+        dataset_size=args.dataset_size,
+        error_rate=args.error_rate,
+        seed=args.seed,
+        compress_min_size=None if args.no_compression else args.compress_min_size,
+    )
+    if args.http2:
+        from src.stub.h2_stub_server import H2StubServer
+
+        server_cls = H2StubServer
+    else:
+        server_cls = StubServer
+    server = server_cls(app, host=args.host, port=args.port, latency=args.latency)
+    with server:
+        print(f"Serving booking stub on {server.base_url}", flush=True)
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
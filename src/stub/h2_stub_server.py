@@ -0,0 +1,136 @@
+import asyncio
+from typing import Dict, Set, Tuple
+
+from src.stub.booking_stub_server import BookingStubApp, StubServer
+
+
+class H2StubServer(StubServer):
+    """
+    Serves a BookingStubApp over cleartext HTTP/2 (h2c with prior knowledge),
+    answering the streams of a connection concurrently. Requires the ``h2``
+    package.
+
+    Example:
+        with H2StubServer(latency=0.01) as server:
+            service = BookingService(base_url=server.base_url)
+            service.transport = Http2Transport()
+    """
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        from h2.exceptions import ProtocolError
+
+        self._writers.add(writer)
+        connection = _H2Connection(self.app, self.latency, writer)
+        try:
+            while True:
+                data = await reader.read(65536)
+                if not data:
+                    break
+                connection.receive(data)
+                await writer.drain()
+        except (ConnectionError, ProtocolError):
+            pass
+        finally:
+            connection.close()
+            self._writers.discard(writer)
+            writer.close()
+
+
+class _H2Connection:
+    def __init__(
+        self, app: BookingStubApp, latency: float, writer: asyncio.StreamWriter
+    ) -> None:
+        from h2.config import H2Configuration
+        from h2.connection import H2Connection
+
+        self.app = app
+        self.latency = latency
+        self.writer = writer
+        self.h2 = H2Connection(
+            H2Configuration(client_side=False, header_encoding="utf-8")
+        )
+        self.streams: Dict[int, Tuple[Dict[str, str], bytearray]] = {}
+        self.tasks: Set[asyncio.Task] = set()
+        self.window_updated = asyncio.Event()
+        self.h2.initiate_connection()
+        self.flush()
+
+    def flush(self) -> None:
+        self.writer.write(self.h2.data_to_send())
+
+    def receive(self, data: bytes) -> None:
+        from h2 import events
+
+        for event in self.h2.receive_data(data):
+            if isinstance(event, events.RequestReceived):
+                self.streams[event.stream_id] = (dict(event.headers), bytearray())
+            elif isinstance(event, events.DataReceived):
+                self.streams[event.stream_id][1].extend(event.data)
+                self.h2.acknowledge_received_data(
+                    event.flow_controlled_length, event.stream_id
+                )
+            elif isinstance(event, events.StreamEnded):
+                headers, body = self.streams.pop(event.stream_id)
+                task = asyncio.create_task(
+                    self.respond(event.stream_id, headers, bytes(body))
+                )
+                self.tasks.add(task)
+                task.add_done_callback(self.tasks.discard)
+            elif isinstance(event, events.StreamReset):
+                self.streams.pop(event.stream_id, None)
+            elif isinstance(event, events.WindowUpdated):
+                self.window_updated.set()
+        self.flush()
+
+    async def respond(
+        self, stream_id: int, headers: Dict[str, str], body: bytes
+    ) -> None:
+        from h2.exceptions import ProtocolError
+
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        request_headers = {
+            name: value for name, value in headers.items() if not name.startswith(":")
+        }
+        status, response_headers, payload = self.app.handle(
+            headers[":method"], headers[":path"], request_headers, body
+        )
+        try:
+            self.h2.send_headers(
+                stream_id,
+                [
+                    (":status", str(int(status))),
+                    *(
+                        (name.lower(), value)
+                        for name, value in response_headers.items()
+                    ),
+                    ("content-length", str(len(payload))),
+                ],
+                end_stream=not payload,
+            )
+            await self.send_body(stream_id, payload)
+            self.flush()
+            await self.writer.drain()
+        except (ConnectionError, ProtocolError):
+            pass
+
+    async def send_body(self, stream_id: int, payload: bytes) -> None:
+        # Large bodies (e.g. the booking list) have to wait for WINDOW_UPDATE frames
+        while payload:
+            window = min(
+                self.h2.local_flow_control_window(stream_id),
+                self.h2.max_outbound_frame_size,
+            )
+            if window <= 0:
+                self.window_updated.clear()
+                self.flush()
+                await self.window_updated.wait()
+                continue
+            chunk, payload = payload[:window], payload[window:]
+            self.h2.send_data(stream_id, chunk, end_stream=not payload)
+
+    def close(self) -> None:
+        for task in self.tasks:
+            task.cancel()
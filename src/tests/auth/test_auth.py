@@ -1,6 +1,6 @@
-import os
 import pytest
 
+from src.base.settings import settings_instance
 from src.models.requests.credentials.credentials_model import CredentialsModel
 from src.models.services.auth_service import AuthService
 
@@ -12,7 +12,8 @@ def auth_service():
 
 def test_sign_in_with_valid_credentials(auth_service):
     credentials = CredentialsModel(
-        username=os.getenv("USER"), password=os.getenv("PASSWORD")
+        username=settings_instance.get("USERNAME"),
+        password=settings_instance.get("PASSWORD"),
     )
     response = auth_service.sign_in(credentials)
     assert response.status == 200
@@ -20,7 +21,7 @@ def test_sign_in_with_valid_credentials(auth_service):
 
 def test_sign_in_with_wrong_username(auth_service):
     credentials = CredentialsModel(
-        username="wrong_username", password=os.getenv("PASSWORD")
+        username="wrong_username", password=settings_instance.get("PASSWORD")
     )
     response = auth_service.sign_in(credentials)
     assert response.status == 200
@@ -29,7 +30,7 @@ def test_sign_in_with_wrong_username(auth_service):
 
 def test_sign_in_with_wrong_password(auth_service):
     credentials = CredentialsModel(
-        username=os.getenv("USER"), password="wrong_password"
+        username=settings_instance.get("USERNAME"), password="wrong_password"
     )
     response = auth_service.sign_in(credentials)
     assert response.status == 200
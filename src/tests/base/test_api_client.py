@@ -0,0 +1,89 @@
+import pytest
+
+from src.base.api_client import api_client_instance
+from src.models.requests.booking.booking_model import BookingModel, BookingDates
+from src.models.services.booking_service import BookingService
+
+
+@pytest.fixture
+def pool_stats():
+    api_client_instance.stats.reset()
+    return api_client_instance.stats
+
+
+def test_services_share_the_connection_pool(stub_server, pool_stats):
+    first_service = BookingService(base_url=stub_server.base_url)
+    second_service = BookingService(base_url=stub_server.base_url)
+
+    for _ in range(5):
+        assert first_service.get_booking(1).status == 200
+        assert second_service.get_booking(1).status == 200
+
+    assert (
+        first_service.get_adapter(stub_server.base_url) is api_client_instance.adapter
+    )
+    assert pool_stats.checkouts == 10
+    assert pool_stats.misses <= 1
+    assert pool_stats.reuse_rate >= 0.9
+
+
+def test_closing_a_service_keeps_the_pool_alive(stub_server, pool_stats):
+    with BookingService(base_url=stub_server.base_url) as service:
+        service.get_booking(1)
+
+    response = BookingService(base_url=stub_server.base_url).get_booking(1)
+    assert response.status == 200
+    assert pool_stats.hits >= 1
+
+
+@pytest.fixture
+def previous_pool(monkeypatch):
+    # configure() replaces the process-wide pool: put the current one back after
+    # the test, so later tests keep the configuration of the session
+    previous = api_client_instance.adapter
+    client = api_client_instance.client
+    monkeypatch.setattr(api_client_instance, "_retired", [])
+    monkeypatch.setattr(client, "adapters", client.adapters.copy())
+    yield previous
+    replacement, api_client_instance._adapter = api_client_instance._adapter, previous
+    if replacement is not previous:
+        replacement.shutdown()
+
+
+def test_configure_leaves_existing_services_on_their_pool(
+    stub_server, pool_stats, previous_pool
+):
+    service = BookingService(base_url=stub_server.base_url)
+    service.get_booking(1)
+
+    api_client_instance.configure()
+
+    assert service.get_booking(1).status == 200
+    assert service.get_adapter(stub_server.base_url) is previous_pool
+    assert pool_stats.misses <= 1
+    assert (
+        BookingService(base_url=stub_server.base_url).get_adapter(stub_server.base_url)
+        is api_client_instance.adapter
+        is not previous_pool
+    )
+
+
+def test_shared_pool_keeps_auth_headers_isolated(stub_server):
+    authenticated_service = BookingService(base_url=stub_server.base_url)
+    authenticated_service.authenticate(
+        credentials={"username": "admin", "password": "password123"}
+    )
+    anonymous_service = BookingService(base_url=stub_server.base_url)
+
+    booking = BookingModel(
+        firstname="John",
+        lastname="Snow",
+        totalprice=1000,
+        depositpaid=True,
+        bookingdates=BookingDates(checkin="2024-01-01", checkout="2024-02-01"),
+        additionalneeds="Breakfast",
+    )
+    booking_id = authenticated_service.add_booking(booking).data.bookingid
+
+    assert anonymous_service.delete_booking(booking_id).status == 403
+    assert authenticated_service.delete_booking(booking_id).status == 201
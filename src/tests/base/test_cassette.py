@@ -0,0 +1,84 @@
+from time import perf_counter
+
+import pytest
+
+from src.base.api_client import api_client_instance
+from src.base.cassette import Cassette, CassetteMissError, CassetteMode
+from src.models.requests.booking.booking_model import BookingDates, BookingModel
+from src.models.services.booking_service import BookingService
+from src.stub.booking_stub_server import StubServer
+
+CREDENTIALS = {"username": "admin", "password": "password123"}
+
+
+@pytest.fixture
+def cassette_path(tmp_path):
+    yield str(tmp_path / "cassette.jsonl.gz")
+    api_client_instance.eject_cassette()
+
+
+def booking(firstname: str) -> BookingModel:
+    return BookingModel(
+        firstname=firstname,
+        lastname="Brown",
+        totalprice=111,
+        depositpaid=True,
+        bookingdates=BookingDates(checkin="2024-01-01", checkout="2024-02-01"),
+        additionalneeds="Breakfast",
+    )
+
+
+def scenario(service: BookingService) -> list:
+    booking_id = service.add_booking(booking("Jim")).data.bookingid
+    first = service.get_booking(booking_id)
+    service.update_booking(booking_id, booking("James"))
+    second = service.get_booking(booking_id)
+    missing = service.get_booking(999_999)
+    return [first.data.firstname, second.data.firstname, missing.status]
+
+
+def test_record_then_replay_offline(cassette_path):
+    with StubServer(latency=0.05) as server:
+        api_client_instance.use_cassette(cassette_path, CassetteMode.RECORD)
+        service = BookingService(base_url=server.base_url)
+        service.authenticate(credentials=CREDENTIALS)
+        recorded = scenario(service)
+        api_client_instance.eject_cassette()
+
+    assert recorded == ["Jim", "James", 404]
+    # /auth is only recorded when no earlier test cached the token
+    assert len(Cassette(cassette_path)) >= 5
+
+    # The server is gone: everything comes from the cassette
+    api_client_instance.use_cassette(cassette_path, CassetteMode.REPLAY)
+    service = BookingService(base_url=server.base_url)
+    service.authenticate(credentials=CREDENTIALS)
+    start = perf_counter()
+    assert scenario(service) == recorded
+    # Recording took at least 5 x 50 ms of server latency
+    assert perf_counter() - start < 0.2
+
+    with pytest.raises(CassetteMissError):
+        service.get_booking(12345)
+
+
+def test_replay_injects_recorded_latency(cassette_path):
+    with StubServer(latency=0.05) as server:
+        api_client_instance.use_cassette(cassette_path, CassetteMode.RECORD)
+        BookingService(base_url=server.base_url).get_booking(1)
+        api_client_instance.eject_cassette()
+
+    api_client_instance.use_cassette(
+        cassette_path, CassetteMode.REPLAY, latency_scale=1.0
+    )
+    response = BookingService(base_url=server.base_url).get_booking(1)
+    assert response.status == 200
+    assert response.response_time >= 50
+
+
+def test_passthrough_hosts_are_not_recorded(stub_server, cassette_path):
+    api_client_instance.use_cassette(
+        cassette_path, CassetteMode.REPLAY, passthrough_hosts={"127.0.0.1"}
+    )
+    response = BookingService(base_url=stub_server.base_url).get_booking(1)
+    assert response.status == 200
@@ -0,0 +1,128 @@
+from datetime import date
+
+import pytest
+
+from src.base.columnar import ColumnTable
+from src.models.services.booking_service import BOOKING_COLUMNS, BookingService
+from src.stub.booking_stub_server import BookingStubApp, StubServer
+from src.tests.helpers import LegacyRecordsStubApp
+
+SCHEMA = {
+    "id": "int",
+    "name": "str",
+    "price": "float",
+    "paid": "bool",
+    "checkin": "date",
+}
+
+
+@pytest.fixture
+def table():
+    table = ColumnTable(SCHEMA)
+    table.append(
+        {"id": 1, "name": "Jim", "price": 10.5, "paid": True, "checkin": "2024-01-01"}
+    )
+    table.append(
+        {"id": 2, "name": "Zoë", "price": 4.5, "paid": False, "checkin": "0NaN-aN-aN"}
+    )
+    table.append({"id": 3, "name": "", "price": 0, "paid": True, "checkin": None})
+    return table
+
+
+def test_columns_store_typed_values(table):
+    assert len(table) == 3
+    assert list(table["name"]) == ["Jim", "Zoë", ""]
+    assert table["name"][-2] == "Zoë"
+    assert list(table["paid"]) == [True, False, True]
+    assert list(table["checkin"]) == [date(2024, 1, 1), None, None]
+    assert next(table.rows()) == {
+        "id": 1,
+        "name": "Jim",
+        "price": 10.5,
+        "paid": True,
+        "checkin": date(2024, 1, 1),
+    }
+
+
+def test_aggregates_run_over_the_buffers(table):
+    assert table["price"].sum() == 15.0
+    assert table["paid"].count(True) == 2
+    assert table["checkin"].count(date(2024, 1, 1)) == 1
+    assert table["name"].count("Jim") == 1
+    with pytest.raises(TypeError):
+        table["name"].sum()
+
+
+def test_save_and_load_round_trip(table, tmp_path):
+    path = tmp_path / "table.cols"
+    table.save(str(path))
+
+    loaded = ColumnTable.load(str(path))
+
+    assert loaded.schema == SCHEMA
+    assert list(loaded.rows()) == list(table.rows())
+    assert path.stat().st_size < table.nbytes + 512
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / "other.json"
+    path.write_text("{}")
+
+    with pytest.raises(ValueError):
+        ColumnTable.load(str(path))
+
+
+def test_to_numpy(table):
+    numpy = pytest.importorskip("numpy")
+
+    arrays = table.to_numpy()
+
+    assert arrays["price"].sum() == 15.0
+    assert arrays["paid"].sum() == 2
+    assert numpy.isnat(arrays["checkin"]).sum() == 2
+
+
+def test_export_bookings_streams_into_columns():
+    app = BookingStubApp(dataset_size=200)
+    with StubServer(app=app) as server:
+        service = BookingService(base_url=server.base_url)
+
+        table, failures = service.export_bookings(concurrency=8)
+        _, missing = service.export_bookings([1, 999_999])
+
+    assert not failures
+    assert table.schema == BOOKING_COLUMNS
+    assert len(table) == 200
+    assert sorted(table["bookingid"]) == list(range(1, 201))
+    assert table["totalprice"].sum() == sum(range(100, 300))
+    assert table["depositpaid"].count(True) == 100
+    assert table["checkin"].count(date(2024, 1, 1)) == 200
+    assert [failure.item for failure in missing] == [999_999]
+
+
+def test_export_bookings_records_malformed_bookings():
+    app = LegacyRecordsStubApp(malformed=[2], dataset_size=5)
+    with StubServer(app=app) as server:
+        service = BookingService(base_url=server.base_url)
+
+        table, failures = service.export_bookings()
+
+    assert sorted(table["bookingid"]) == [1, 3, 4, 5]
+    assert [(failure.index, failure.item) for failure in failures] == [(1, 2)]
+    assert isinstance(failures[0].error, ValueError)
+    assert failures[0].response.status == 200
+
+
+def test_export_bookings_indexes_failures_of_any_iterable():
+    app = LegacyRecordsStubApp(malformed=[2], dataset_size=5)
+    with StubServer(app=app) as server:
+        service = BookingService(base_url=server.base_url)
+
+        table, failures = service.export_bookings(iter([2, 1, 2, 999_999]))
+
+    assert list(table["bookingid"]) == [1]
+    assert sorted((failure.index, failure.item) for failure in failures) == [
+        (0, 2),
+        (2, 2),
+        (3, 999_999),
+    ]
@@ -0,0 +1,94 @@
+import gzip
+import importlib.util
+import json
+
+import pytest
+
+from src.base.compression import accept_encoding, supported_encodings
+from src.base.metrics import TransferSink, metrics_instance
+from src.models.requests.booking.booking_model import BookingDates, BookingModel
+from src.models.services.booking_service import BookingService
+from src.stub.booking_stub_server import BookingStubApp, StubServer
+
+
+@pytest.fixture(scope="module")
+def server():
+    with StubServer(BookingStubApp(dataset_size=2000)) as server:
+        yield server
+
+
+@pytest.fixture
+def booking_service(server):
+    return BookingService(base_url=server.base_url)
+
+
+def test_accept_encoding_keeps_decodable_codings():
+    assert supported_encodings()[-2:] == ("gzip", "deflate")
+    assert accept_encoding(["gzip", "unknown"]) == "gzip"
+    assert accept_encoding([]) == "identity"
+    if importlib.util.find_spec("brotli") is None:
+        assert accept_encoding(["br", "gzip"]) == "gzip"
+
+
+def test_large_responses_come_compressed(booking_service):
+    response = booking_service.get_booking_ids()
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert len(response.data) == 2000
+    assert response.timings.decoded_bytes > 5 * response.timings.received_bytes
+
+
+def test_identity_turns_compression_off(booking_service):
+    booking_service.headers["Accept-Encoding"] = accept_encoding([])
+
+    response = booking_service.get_booking_ids()
+
+    assert "Content-Encoding" not in response.headers
+    assert response.timings.received_bytes == response.timings.decoded_bytes
+
+
+def test_streamed_items_are_decompressed_on_the_fly(booking_service):
+    items = booking_service.stream_items(booking_service.url, chunk_size=1024)
+
+    assert [item["bookingid"] for item in items][:2000] == list(range(1, 2001))
+
+
+def test_request_bodies_can_be_gzipped(booking_service):
+    booking_service.compress_requests_over = 0
+    booking = BookingModel(
+        firstname="Zip" * 200,
+        lastname="Brown",
+        totalprice=111,
+        depositpaid=True,
+        bookingdates=BookingDates(checkin="2018-01-01", checkout="2019-01-01"),
+        additionalneeds="Breakfast",
+    )
+
+    response = booking_service.add_booking(booking)
+
+    assert response.status == 200
+    assert response.data.booking.firstname == "Zip" * 200
+    assert response.timings.sent_bytes < response.timings.payload_bytes / 5
+
+
+def test_stub_rejects_unknown_content_encodings():
+    app = BookingStubApp()
+    body = gzip.compress(json.dumps({"firstname": "Jim"}).encode("utf-8"))
+
+    assert app.handle("POST", "/booking", {"content-encoding": "br"}, body)[0] == 415
+    assert app.handle("POST", "/booking", {"content-encoding": "gzip"}, body)[0] == 200
+
+
+def test_transfer_sink_reports_savings(booking_service):
+    sink = metrics_instance.add_sink(TransferSink())
+    try:
+        booking_service.get_booking_ids()
+        booking_service.get_booking(1)
+    finally:
+        metrics_instance.remove_sink(sink)
+
+    total = sink.total()
+    assert total["count"] == 2
+    assert total["received_bytes"] < total["decoded_bytes"]
+    assert 0.5 < sink.saved_ratio() < 1
+    assert sink.format_summary()[-1].startswith("bandwidth saved by compression")
@@ -0,0 +1,99 @@
+import json
+from typing import List
+
+import pytest
+from pydantic import BaseModel, Field, PrivateAttr
+
+from src.base.decoding import DecodeMode, parse_response_data
+from src.models.responses.base.response import _UNSET, Response
+from src.models.responses.booking.booking_response import (
+    BookingDetails,
+    BookingIdResponse,
+)
+
+BOOKING = {
+    "firstname": "Jim",
+    "lastname": "Brown",
+    "totalprice": 111,
+    "depositpaid": True,
+    "bookingdates": {"checkin": "2020-01-01", "checkout": "2021-01-01"},
+    "additionalneeds": "Breakfast",
+}
+
+
+@pytest.mark.parametrize("decode_mode", list(DecodeMode))
+def test_decode_modes_parse_lists(decode_mode):
+    content = json.dumps([{"bookingid": 1}, {"bookingid": 2}]).encode()
+
+    data = parse_response_data(
+        content, List[BookingIdResponse], decode_mode=decode_mode
+    )
+    assert [item.bookingid for item in data] == [1, 2]
+    assert all(isinstance(item, BookingIdResponse) for item in data)
+
+
+@pytest.mark.parametrize("decode_mode", list(DecodeMode))
+def test_decode_modes_parse_nested_models(decode_mode):
+    content = json.dumps(BOOKING).encode()
+
+    data = parse_response_data(content, BookingDetails, decode_mode=decode_mode)
+    assert data.firstname == "Jim"
+    assert data.bookingdates.checkin == "2020-01-01"
+
+
+@pytest.mark.parametrize("decode_mode", list(DecodeMode))
+def test_decode_modes_fall_back_to_text(decode_mode):
+    data = parse_response_data(b"Not Found", BookingDetails, decode_mode=decode_mode)
+    assert data == "Not Found"
+
+
+@pytest.mark.parametrize(
+    "decode_mode",
+    [DecodeMode.STANDARD, DecodeMode.FAST_JSON, DecodeMode.JSON_BYTES, DecodeMode.BULK],
+)
+def test_validating_modes_reject_invalid_payloads(decode_mode):
+    content = json.dumps({"firstname": "Jim"}).encode()
+
+    data = parse_response_data(content, BookingDetails, decode_mode=decode_mode)
+    assert isinstance(data, str)
+
+
+def test_trusted_mode_skips_validation():
+    content = json.dumps({"firstname": "Jim"}).encode()
+
+    data = parse_response_data(content, BookingDetails, decode_mode=DecodeMode.TRUSTED)
+    assert isinstance(data, BookingDetails)
+    assert data.firstname == "Jim"
+
+
+def test_trusted_mode_sets_defaults_and_private_attributes():
+    class Booking(BaseModel):
+        firstname: str
+        tags: List[str] = Field(default_factory=list)
+        _source: str = PrivateAttr(default="api")
+
+    class Page(BaseModel):
+        bookings: List[Booking]
+
+    content = json.dumps({"bookings": [{"firstname": "Jim"}]}).encode()
+
+    data = parse_response_data(content, Page, decode_mode=DecodeMode.TRUSTED)
+    booking = data.bookings[0]
+    assert isinstance(booking, Booking)
+    assert booking.tags == []
+    assert booking._source == "api"
+    assert booking.model_fields_set == {"firstname"}
+
+
+def test_response_data_and_headers_are_lazy():
+    content = json.dumps(BOOKING).encode()
+    response = Response(200, {"ETag": '"1"'}, content, BookingDetails)
+
+    assert response.status == 200
+    assert response._data is _UNSET
+    assert response._headers is None
+
+    assert response.data.firstname == "Jim"
+    assert response.data is response.data
+    assert response.headers == {"ETag": '"1"'}
+    assert response.timings.decode_ns > 0
@@ -0,0 +1,48 @@
+import json
+
+from src.base.encoding import EncodedPayload, encode_payload
+from src.models.requests.booking.booking_model import BookingDates, BookingModel
+from src.models.services.booking_service import BookingService
+
+BOOKING = BookingModel(
+    firstname="Jim",
+    lastname="Brown",
+    totalprice=111,
+    depositpaid=True,
+    bookingdates=BookingDates(checkin="2024-01-01", checkout="2024-02-01"),
+    additionalneeds="Breakfast",
+)
+
+
+def test_models_encode_like_model_dump():
+    content = encode_payload(BOOKING)
+
+    assert isinstance(content, bytes)
+    assert json.loads(content) == BOOKING.model_dump(exclude_none=True)
+    assert b'"id"' not in content
+
+
+def test_other_payloads():
+    assert encode_payload(None) is None
+    assert encode_payload(b"raw") == b"raw"
+    assert json.loads(encode_payload({"a": [1, None]})) == {"a": [1, None]}
+    assert (
+        json.loads(encode_payload([BOOKING, BOOKING]))
+        == [BOOKING.model_dump(exclude_none=True)] * 2
+    )
+
+
+def test_encoded_payload_is_reused():
+    payload = EncodedPayload(BOOKING)
+
+    assert encode_payload(payload) is payload.content
+
+
+def test_services_send_encoded_payloads(stub_server):
+    service = BookingService(base_url=stub_server.base_url)
+    payload = EncodedPayload(BOOKING)
+
+    responses = [service.add_booking(payload) for _ in range(3)]
+    assert [response.status for response in responses] == [200] * 3
+    assert responses[0].data.booking.firstname == "Jim"
+    assert len({response.data.bookingid for response in responses}) == 3
@@ -0,0 +1,140 @@
+import time
+
+import pytest
+
+from src.base.auth import AuthMethod
+from src.base.http_cache import CacheEntry, HttpCache
+from src.models.requests.booking.booking_model import BookingDates, BookingModel
+from src.models.services.booking_service import BookingService
+
+CREDENTIALS = {"username": "admin", "password": "password123"}
+
+
+@pytest.fixture
+def booking_service(stub_server):
+    service = BookingService(base_url=stub_server.base_url)
+    service.authenticate(credentials=CREDENTIALS)
+    service.cache = HttpCache(ttl=60)
+    return service
+
+
+@pytest.fixture
+def booking_id(booking_service):
+    booking = BookingModel(
+        firstname="Cached",
+        lastname="Brown",
+        totalprice=111,
+        depositpaid=True,
+        bookingdates=BookingDates(checkin="2024-01-01", checkout="2024-02-01"),
+        additionalneeds="Breakfast",
+    )
+    return booking_service.add_booking(booking).data.bookingid
+
+
+def test_fresh_entries_are_served_without_request(booking_service, booking_id):
+    first = booking_service.get_booking(booking_id)
+    second = booking_service.get_booking(booking_id)
+
+    assert not first.from_cache
+    assert second.from_cache
+    assert second.data == first.data
+    assert second.timings.ttfb_ns == 0
+    assert booking_service.cache.stats.snapshot()["fresh_hits"] == 1
+
+
+def test_stale_entries_are_revalidated(booking_service, booking_id):
+    booking_service.cache.ttl = 0
+
+    first = booking_service.get_booking(booking_id)
+    second = booking_service.get_booking(booking_id)
+
+    assert second.from_cache
+    assert second.status == 200
+    assert second.data == first.data
+    assert second.timings.ttfb_ns > 0
+    assert booking_service.cache.stats.revalidated_hits == 1
+
+
+def test_updates_invalidate_the_resource_and_its_collection(
+    booking_service, booking_id
+):
+    booking_service.get_booking(booking_id)
+    booking_service.get_booking_ids({"firstname": "Cached"})
+
+    booking_service.partial_update_booking(
+        booking_id, BookingModel(firstname="Changed")
+    )
+    response = booking_service.get_booking(booking_id)
+
+    assert not response.from_cache
+    assert response.data.firstname == "Changed"
+    assert booking_service.cache.stats.invalidations == 2
+    assert len(booking_service.cache) == 1
+
+
+def test_delete_invalidates(booking_service, booking_id):
+    booking_service.get_booking(booking_id)
+    booking_service.delete_booking(booking_id)
+
+    assert booking_service.get_booking(booking_id).status == 404
+
+
+def test_failed_updates_keep_the_cache(stub_server, booking_service, booking_id):
+    booking_service.get_booking(booking_id)
+    anonymous_service = BookingService(base_url=stub_server.base_url)
+    anonymous_service.cache = booking_service.cache
+
+    assert anonymous_service.delete_booking(booking_id).status == 403
+    assert booking_service.get_booking(booking_id).from_cache
+
+
+def test_entries_are_kept_apart_per_token(stub_server, booking_service, booking_id):
+    services = []
+    for token in ("first", "second", "first"):
+        service = BookingService(base_url=stub_server.base_url)
+        service.authenticate(AuthMethod.BEARER, {"token": token})
+        service.cache = booking_service.cache
+        services.append(service)
+
+    responses = [service.get_booking(booking_id) for service in services]
+
+    assert [response.from_cache for response in responses] == [False, False, True]
+    assert len(booking_service.cache) == 2
+    assert booking_service.delete_booking(booking_id).status == 201
+    assert len(booking_service.cache) == 0
+
+
+def test_lru_eviction_and_hit_rate():
+    cache = HttpCache(max_entries=2)
+    for index in range(3):
+        cache.store(f"GET http://host/booking/{index}", CacheEntry(200, {}, b"{}"))
+
+    assert cache.lookup("GET http://host/booking/0") is None
+    assert cache.stats.evictions == 1
+    cache.stats.record("fresh_hits")
+    cache.stats.record("misses")
+    assert cache.stats.hit_rate == 0.5
+
+
+def test_no_store_responses_are_not_cached():
+    cache = HttpCache()
+    cache.store(
+        "GET http://host/a", CacheEntry(200, {"Cache-Control": "no-store"}, b"")
+    )
+    assert cache.lookup("GET http://host/a") is None
+
+
+def test_disk_tier(tmp_path):
+    key = HttpCache.key("GET", "http://host/booking", {"firstname": "Jim"})
+    HttpCache(directory=str(tmp_path)).store(
+        key, CacheEntry(200, {"ETag": '"abc"'}, b"[]", stored_at=time.time())
+    )
+
+    cache = HttpCache(directory=str(tmp_path))
+    entry = cache.lookup(key)
+    assert entry.content == b"[]"
+    assert entry.validators() == {"If-None-Match": '"abc"'}
+
+    cache = HttpCache(directory=str(tmp_path))
+    assert cache.invalidate("http://host/booking/5") == 1
+    assert cache.lookup(key) is None
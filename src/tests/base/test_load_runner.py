@@ -0,0 +1,122 @@
+import threading
+
+import pytest
+
+from src.base.load_runner import LoadRunner, Scenario, _arrival_time
+from src.models.services.booking_service import BookingService
+
+
+class GetBooking(Scenario):
+    def __init__(self, base_url: str, booking_id: int = 1) -> None:
+        self.base_url = base_url
+        self.booking_id = booking_id
+
+    def setup(self) -> None:
+        self.booking_service = BookingService(base_url=self.base_url)
+
+    def run(self) -> None:
+        response = self.booking_service.get_booking(self.booking_id)
+        assert response.status == 200, response.status
+
+
+def test_closed_loop(stub_server):
+    report = LoadRunner(
+        GetBooking,
+        duration=0.5,
+        concurrency=4,
+        scenario_kwargs={"base_url": stub_server.base_url},
+    ).run()
+
+    assert report.iterations > 20
+    assert report.errors == 0
+    assert report.throughput > 0
+    assert report.requests.histogram("GET", "/booking/{id}").count == report.iterations
+    assert report.latency.percentile(99) <= report.latency.max_ns
+
+
+def test_open_loop_keeps_the_rate(stub_server):
+    report = LoadRunner(
+        GetBooking,
+        duration=1.0,
+        concurrency=4,
+        rps=100,
+        ramp_up=0.2,
+        scenario_kwargs={"base_url": stub_server.base_url},
+    ).run()
+
+    # 100 arrivals per second, minus the 10 lost to the linear ramp-up
+    assert report.iterations == 90
+    assert report.errors == 0
+
+
+def test_errors_are_counted(stub_server):
+    report = LoadRunner(
+        GetBooking,
+        duration=0.3,
+        concurrency=2,
+        scenario_kwargs={"base_url": stub_server.base_url, "booking_id": 999_999},
+    ).run()
+
+    assert report.iterations > 0
+    assert report.error_rate == 1.0
+    assert report.error_types == {"AssertionError": report.iterations}
+    assert any("errors" in line for line in report.format())
+
+
+class FlakySetup(GetBooking):
+    # The first user fails its setup, the others run normally
+    lock = threading.Lock()
+    setups = 0
+    teardowns = 0
+
+    def setup(self) -> None:
+        with FlakySetup.lock:
+            FlakySetup.setups += 1
+            if FlakySetup.setups == 1:
+                raise ConnectionError("setup failed")
+        super().setup()
+
+    def teardown(self) -> None:
+        with FlakySetup.lock:
+            FlakySetup.teardowns += 1
+
+
+@pytest.mark.parametrize("rps", [None, 50])
+def test_setup_errors_are_counted(stub_server, monkeypatch, rps):
+    monkeypatch.setattr(FlakySetup, "setups", 0)
+    monkeypatch.setattr(FlakySetup, "teardowns", 0)
+
+    report = LoadRunner(
+        FlakySetup,
+        duration=0.3,
+        concurrency=3,
+        rps=rps,
+        scenario_kwargs={"base_url": stub_server.base_url},
+    ).run()
+
+    assert report.error_types == {"ConnectionError": 1}
+    assert report.iterations > report.errors
+    assert FlakySetup.teardowns == 2
+
+
+def test_worker_processes(stub_server):
+    report = LoadRunner(
+        GetBooking,
+        duration=0.5,
+        concurrency=4,
+        rps=40,
+        processes=2,
+        scenario_kwargs={"base_url": stub_server.base_url},
+    ).run()
+
+    assert report.iterations == 20
+    assert report.errors == 0
+    assert report.requests.histogram("GET", "/booking/{id}").count == 20
+
+
+@pytest.mark.parametrize("ramp_up", [0.0, 2.0])
+def test_arrival_times_reach_the_target_rate(ramp_up):
+    times = [_arrival_time(arrival, 50, ramp_up) for arrival in range(500)]
+
+    assert times == sorted(times)
+    assert times[-1] - times[-51] == pytest.approx(1.0)
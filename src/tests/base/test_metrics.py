@@ -0,0 +1,79 @@
+import random
+
+import pytest
+
+from src.base.metrics import (
+    HistogramSink,
+    LatencyHistogram,
+    metrics_instance,
+    route_template,
+)
+from src.models.services.booking_service import BookingService
+
+
+@pytest.mark.parametrize(
+    "url, route",
+    [
+        ("http://localhost/booking/42", "/booking/{id}"),
+        ("http://localhost/booking?firstname=Jim", "/booking"),
+        ("http://localhost/users/ab12cd34ef56ab78/orders/7", "/users/{id}/orders/{id}"),
+        ("http://localhost/auth", "/auth"),
+    ],
+)
+def test_route_template(url, route):
+    assert route_template(url) == route
+
+
+def test_histogram_percentiles_are_within_precision():
+    values = [random.randint(1_000_000, 900_000_000) for _ in range(10_000)]
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.record(value)
+
+    values.sort()
+    for percentile in (50, 95, 99, 100):
+        exact = values[max(0, -(-len(values) * percentile // 100) - 1)]
+        assert exact <= histogram.percentile(percentile) <= exact * 1.01
+    assert histogram.count == 10_000
+    assert histogram.max_ns == values[-1]
+    assert histogram.min_ns == values[0]
+
+
+def test_histogram_merge():
+    first, second, merged = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for value in range(1, 1001):
+        (first if value % 2 else second).record(value * 1000)
+        merged.record(value * 1000)
+
+    first.merge(second)
+    assert first.counts == merged.counts
+    assert first.percentile(99) == merged.percentile(99)
+
+
+def test_requests_are_recorded_per_endpoint(stub_server):
+    sink = metrics_instance.add_sink(HistogramSink())
+    try:
+        service = BookingService(base_url=stub_server.base_url)
+        for booking_id in range(1, 21):
+            service.get_booking(booking_id)
+        service.get_booking_ids()
+    finally:
+        metrics_instance.remove_sink(sink)
+
+    assert sink.histogram("GET", "/booking/{id}").count == 20
+    assert sink.histogram("GET", "/booking").count == 1
+    sink.assert_percentile("GET", "/booking/{id}", 95, 2000, min_samples=20)
+    assert [row["route"] for row in sink.summary()] == ["/booking", "/booking/{id}"]
+
+    with pytest.raises(AssertionError, match="samples recorded"):
+        sink.assert_percentile("GET", "/booking/{id}", 95, 2000, min_samples=50)
+    with pytest.raises(AssertionError, match="p95"):
+        sink.assert_percentile("GET", "/booking/{id}", 95, 0)
+
+
+def test_session_histograms_fixture(stub_server, latency_histograms):
+    service = BookingService(base_url=stub_server.base_url)
+    before = latency_histograms.histogram("GET", "/booking/{id}").count
+
+    service.get_booking(1)
+    assert latency_histograms.histogram("GET", "/booking/{id}").count == before + 1
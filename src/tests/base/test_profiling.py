@@ -0,0 +1,93 @@
+import pstats
+
+import pytest
+import requests
+
+from src.base.hooks import RequestHook, request_hooks_instance
+from src.base.profiling import CProfileProfiler, TracemallocProfiler
+from src.models.services.booking_service import BookingService
+from src.tests.helpers import closed_port_url
+
+
+class RecordingHook(RequestHook):
+    def __init__(self):
+        self.calls = []
+
+    def before_send(self, context):
+        self.calls.append(("before_send", context.status))
+
+    def after_receive(self, context):
+        self.calls.append(("after_receive", context.status, context.error))
+
+    def before_parse(self, context):
+        self.calls.append(("before_parse", context.response is not None))
+
+    def after_parse(self, context):
+        self.calls.append(("after_parse", context.timings.validation_ns > 0))
+
+
+@pytest.fixture
+def hook(monkeypatch):
+    # Keeps hooks registered for the session (PROFILE_REQUESTS) out of the tests
+    monkeypatch.setattr(request_hooks_instance, "hooks", [])
+    return request_hooks_instance.add_hook
+
+
+def test_hooks_run_at_each_stage(stub_server, hook):
+    recorder = hook(RecordingHook())
+    service = BookingService(base_url=stub_server.base_url)
+
+    response = service.get_booking(1)
+    assert recorder.calls == [("before_send", None), ("after_receive", 200, None)]
+
+    response.data
+    response.data
+    assert recorder.calls[2:] == [("before_parse", True), ("after_parse", True)]
+
+
+def test_no_context_without_hooks(stub_server, hook):
+    service = BookingService(base_url=stub_server.base_url)
+
+    assert service.get_booking(1)._context is None
+
+
+def test_after_receive_runs_when_sending_fails(hook):
+    recorder = hook(RecordingHook())
+    service = BookingService(base_url=closed_port_url())
+
+    with pytest.raises(requests.ConnectionError):
+        service.get_booking(1)
+
+    stage, status, error = recorder.calls[-1]
+    assert (stage, status) == ("after_receive", None)
+    assert isinstance(error, requests.ConnectionError)
+
+
+def test_cprofile_profiler_keeps_matching_requests(stub_server, hook, tmp_path):
+    hook(
+        CProfileProfiler(
+            str(tmp_path), endpoint="/booking/{id}", min_latency_ms=0, label="test"
+        )
+    )
+    service = BookingService(base_url=stub_server.base_url)
+
+    service.get_booking(1).data
+    service.get_booking_ids()
+
+    files = list((tmp_path / "test").iterdir())
+    assert [file.name for file in files] == ["0001-GET-_booking_id.prof"]
+    functions = {function for _, _, function in pstats.Stats(str(files[0])).stats}
+    assert {"send", "parse_response_data"} <= functions
+
+
+def test_tracemalloc_profiler_filters_by_status(stub_server, hook, tmp_path):
+    profiler = hook(TracemallocProfiler(str(tmp_path), statuses={404}, label="test"))
+    service = BookingService(base_url=stub_server.base_url)
+
+    service.get_booking(1)
+    service.get_booking(999_999)
+    profiler.close()
+
+    files = list((tmp_path / "test").iterdir())
+    assert [file.name for file in files] == ["0001-GET-_booking_id.allocations.txt"]
+    assert files[0].read_text().startswith("Allocated during the request:")
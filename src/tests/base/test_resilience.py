@@ -0,0 +1,204 @@
+import time
+from http import HTTPStatus
+
+import pytest
+from requests import HTTPError
+
+from src.base.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    RetryPolicy,
+)
+from src.base.transport import Transport
+from src.models.services.booking_service import BookingService
+from src.stub.booking_stub_server import BookingStubApp, StubServer
+from src.tests.helpers import closed_port_url
+
+
+class FlakyStubApp(BookingStubApp):
+    """
+    Answers the next ``failures`` requests with ``status`` (and ``Retry-After``).
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.failures = 0
+        self.status = HTTPStatus.SERVICE_UNAVAILABLE
+        self.retry_after = None
+        self.requests = 0
+
+    def handle(self, method, target, headers, body):
+        self.requests += 1
+        if self.failures:
+            self.failures -= 1
+            response_headers = {"Content-Type": "text/plain; charset=utf-8"}
+            if self.retry_after is not None:
+                response_headers["Retry-After"] = self.retry_after
+            return self.status, response_headers, self.status.phrase.encode("utf-8")
+        return super().handle(method, target, headers, body)
+
+
+@pytest.fixture
+def flaky_app():
+    app = FlakyStubApp()
+    with StubServer(app=app) as server:
+        app.base_url = server.base_url
+        yield app
+
+
+@pytest.fixture
+def booking_service(flaky_app):
+    service = BookingService(base_url=flaky_app.base_url)
+    service.retry_policy = RetryPolicy(max_retries=3, backoff_factor=0.01)
+    return service
+
+
+def test_idempotent_requests_are_retried(booking_service, flaky_app):
+    flaky_app.failures = 2
+
+    response = booking_service.get_booking(1)
+
+    assert response.status == 200
+    assert response.data.firstname == "Guest0"
+    assert response.timings.retries == 2
+    assert flaky_app.requests == 3
+
+
+def test_retries_give_up_after_max_retries(booking_service, flaky_app):
+    flaky_app.failures = 10
+
+    response = booking_service.get_booking(1)
+
+    assert response.status == 503
+    assert response.timings.retries == 3
+    assert flaky_app.requests == 4
+
+
+def test_streamed_requests_are_retried(booking_service, flaky_app):
+    flaky_app.failures = 2
+
+    streamed = list(booking_service.iter_booking_ids())
+
+    assert [item.bookingid for item in streamed][:1] == [1]
+    assert flaky_app.requests == 3
+
+
+def test_streamed_requests_raise_once_retries_give_up(booking_service, flaky_app):
+    flaky_app.failures = 10
+
+    with pytest.raises(HTTPError, match="503"):
+        next(booking_service.iter_booking_ids())
+    assert flaky_app.requests == 4
+
+
+def test_post_is_not_retried(booking_service, flaky_app):
+    flaky_app.failures = 1
+
+    response = booking_service.post(booking_service.url, data={})
+
+    assert response.status == 503
+    assert response.timings.retries == 0
+    assert flaky_app.requests == 1
+
+
+def test_retry_after_is_honored(booking_service, flaky_app):
+    flaky_app.failures = 1
+    flaky_app.status = HTTPStatus.TOO_MANY_REQUESTS
+    flaky_app.retry_after = "0.2"
+
+    started = time.perf_counter()
+    response = booking_service.get_booking(1)
+
+    assert response.status == 200
+    assert time.perf_counter() - started >= 0.2
+    assert response.timings.backoff_ns == 200_000_000
+
+
+def test_connection_errors_are_retried():
+    service = BookingService(base_url=closed_port_url())
+    policy = RetryPolicy(max_retries=2, backoff_factor=0.01)
+    service.retry_policy = policy
+    # Counts the attempts: the third connection error opens the circuit
+    service.circuit_breaker = CircuitBreaker(failure_threshold=3)
+
+    with pytest.raises(policy.retry_exceptions):
+        service.get_booking(1)
+
+    host = service.url.split("/")[2]
+    assert service.circuit_breaker.state(host) == CircuitState.OPEN
+
+
+def test_backoff_grows_exponentially_up_to_the_cap():
+    policy = RetryPolicy(backoff_factor=0.5, max_backoff=3.0, jitter=False)
+
+    assert [policy.backoff(retry) for retry in range(5)] == [0.5, 1, 2, 3, 3]
+    assert 0 <= RetryPolicy(backoff_factor=0.5).backoff(2) <= 2
+    assert policy.backoff(0, "Wed, 21 Oct 2015 07:28:00 GMT") == 0
+
+
+def test_circuit_opens_and_fails_fast(booking_service, flaky_app):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    booking_service.retry_policy = None
+    booking_service.circuit_breaker = breaker
+    flaky_app.failures = 3
+
+    for _ in range(3):
+        booking_service.get_booking(1)
+
+    host = booking_service.url.split("/")[2]
+    assert breaker.state(host) == CircuitState.OPEN
+    with pytest.raises(CircuitOpenError):
+        booking_service.get_booking(1)
+    assert flaky_app.requests == 3
+
+
+def test_half_open_probe_closes_the_circuit(booking_service, flaky_app):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    booking_service.circuit_breaker = breaker
+    booking_service.retry_policy = None
+    flaky_app.failures = 1
+    host = booking_service.url.split("/")[2]
+
+    booking_service.get_booking(1)
+    assert breaker.state(host) == CircuitState.OPEN
+
+    time.sleep(0.06)
+    assert booking_service.get_booking(1).status == 200
+    assert breaker.state(host) == CircuitState.CLOSED
+
+
+class BrokenTransport(Transport):
+    def send(self, service, method, url, body, options, timings):
+        raise TypeError("unsupported option")
+
+
+def test_probe_raising_other_errors_keeps_the_circuit_usable(booking_service):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    booking_service.circuit_breaker = breaker
+    booking_service.retry_policy = None
+    host = booking_service.url.split("/")[2]
+    breaker.record(host)
+    transport = booking_service.transport
+
+    booking_service.transport = BrokenTransport()
+    with pytest.raises(TypeError):
+        booking_service.get_booking(1)
+    assert breaker.state(host) == CircuitState.HALF_OPEN
+
+    booking_service.transport = transport
+    assert booking_service.get_booking(1).status == 200
+    assert breaker.state(host) == CircuitState.CLOSED
+
+
+def test_half_open_allows_a_single_probe():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record("api")
+
+    breaker.before_request("api")
+    assert breaker.state("api") == CircuitState.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request("api")
+
+    breaker.record("api", 503)
+    assert breaker.state("api") == CircuitState.OPEN
@@ -0,0 +1,110 @@
+import multiprocessing
+import threading
+from pathlib import Path
+from time import sleep
+
+import pytest
+
+from src.base.session_manager import SessionManager
+
+
+def authenticate_in_worker(directory: str) -> str:
+    SessionManager.use_shared_store(directory)
+
+    def fetch_token() -> str:
+        sleep(0.2)
+        with open(Path(directory, "fetches.log"), "a") as log:
+            log.write("fetch\n")
+        return "shared-token"
+
+    return SessionManager.get_or_create_token("admin", "secret", fetch_token)
+
+
+@pytest.fixture
+def clean_cache():
+    shared_store = SessionManager.shared_store
+    SessionManager.shared_store = None
+    SessionManager.reset()
+    yield
+    SessionManager.reset()
+    SessionManager.shared_store = shared_store
+
+
+def test_workers_authenticate_only_once(tmp_path, clean_cache):
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(4) as pool:
+        tokens = pool.map(authenticate_in_worker, [str(tmp_path)] * 4)
+
+    assert tokens == ["shared-token"] * 4
+    assert Path(tmp_path, "fetches.log").read_text().count("fetch") == 1
+
+
+def test_shared_store_does_not_write_credentials(tmp_path, clean_cache):
+    SessionManager.use_shared_store(str(tmp_path))
+    SessionManager.store_token("admin", "secret", "abc123")
+
+    content = Path(tmp_path, "auth_tokens.json").read_text()
+    assert "abc123" in content
+    assert "secret" not in content
+
+
+def test_token_is_read_from_shared_store(tmp_path, clean_cache):
+    SessionManager.use_shared_store(str(tmp_path))
+    SessionManager.store_token("admin", "secret", "abc123")
+    SessionManager.auth_token_cache.clear()
+
+    assert SessionManager.get_cached_token("admin", "secret") == "abc123"
+
+
+def test_concurrent_refreshes_are_collapsed(clean_cache):
+    fetches = []
+    barrier = threading.Barrier(10)
+
+    def fetch_token() -> str:
+        sleep(0.2)
+        fetches.append(1)
+        return "token"
+
+    def authenticate() -> None:
+        barrier.wait()
+        SessionManager.get_or_create_token("admin", "secret", fetch_token)
+
+    threads = [threading.Thread(target=authenticate) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    metrics = SessionManager.metrics.snapshot()
+    assert len(fetches) == 1
+    assert metrics["refreshes"] == 1
+    assert metrics["collapsed_refreshes"] == 9
+    assert metrics["max_refresh_ms"] >= 200
+
+
+def test_token_is_renewed_in_the_background(clean_cache):
+    tokens = iter(["first-token", "second-token"])
+    SessionManager.set_token_ttl("admin", 300)
+    try:
+        token = SessionManager.get_or_create_token(
+            "admin", "secret", lambda: next(tokens)
+        )
+        assert token == "first-token"
+
+        sleep(0.4)
+        assert SessionManager.get_cached_token("admin", "secret") == "second-token"
+        assert SessionManager.metrics.background_renewals == 1
+    finally:
+        SessionManager.set_token_ttl("admin", None)
+
+
+def test_token_ttl_is_configurable_per_username(clean_cache):
+    SessionManager.set_token_ttl("short-lived", 0)
+    try:
+        SessionManager.store_token("short-lived", "secret", "abc123")
+        SessionManager.store_token("admin", "secret", "def456")
+
+        assert SessionManager.get_cached_token("short-lived", "secret") is None
+        assert SessionManager.get_cached_token("admin", "secret") == "def456"
+    finally:
+        SessionManager.set_token_ttl("short-lived", None)
@@ -0,0 +1,46 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from src.base.settings import Settings
+
+
+def test_dotenv_is_read_once_until_reloaded(tmp_path, monkeypatch):
+    dotenv_path = tmp_path / ".env"
+    dotenv_path.write_text("SETTINGS_TEST_VALUE=first\n")
+    monkeypatch.delenv("SETTINGS_TEST_VALUE", raising=False)
+    settings = Settings(str(dotenv_path))
+
+    assert settings.get("SETTINGS_TEST_VALUE") == "first"
+
+    dotenv_path.write_text("SETTINGS_TEST_VALUE=second\n")
+    assert settings.get("SETTINGS_TEST_VALUE") == "first"
+
+    settings.reload()
+    assert settings.get("SETTINGS_TEST_VALUE") == "second"
+    monkeypatch.delenv("SETTINGS_TEST_VALUE")
+
+
+def test_runtime_environment_changes_are_seen(monkeypatch):
+    settings = Settings()
+    settings.get("BASE_URL")
+
+    monkeypatch.setenv("SETTINGS_TEST_VALUE", "runtime")
+    assert settings.get("SETTINGS_TEST_VALUE") == "runtime"
+    assert settings.get("SETTINGS_TEST_MISSING", "default") == "default"
+
+
+def test_importing_services_skips_optional_modules():
+    code = (
+        "import sys, src.models.services.booking_service; "
+        "print(sorted({'asyncio', 'filelock', 'dotenv', 'aiohttp', 'gzip'}"
+        " & set(sys.modules)))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+        cwd=Path(__file__).parents[3],
+    ).stdout
+    assert output.strip() == "[]"
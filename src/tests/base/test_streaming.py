@@ -0,0 +1,91 @@
+import json
+from itertools import islice
+from urllib.parse import urlsplit
+
+import pytest
+
+from src.base.streaming import iter_json_array
+from src.models.responses.booking.booking_response import BookingIdResponse
+from src.models.services.booking_service import BookingService
+
+ITEMS = [
+    {"bookingid": 1},
+    {"name": 'Zoë "quoted" ✓', "nested": {"list": [1, 2, {"a": None}]}},
+    12345,
+    -1.5e3,
+    "text",
+    True,
+    None,
+    [],
+]
+
+
+def checked_out_connections(service, url):
+    pool_manager = service.get_adapter(url).poolmanager
+    port = urlsplit(url).port
+    # PoolManager.pools cannot be iterated, only its keys
+    (pool,) = [
+        pool_manager.pools[key]
+        for key in pool_manager.pools.keys()
+        if key.key_port == port
+    ]
+    return pool.pool.maxsize - pool.pool.qsize()
+
+
+def byte_chunks(payload: bytes, size: int):
+    return (payload[index : index + size] for index in range(0, len(payload), size))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 4096])
+def test_iter_json_array_handles_any_chunk_boundary(chunk_size):
+    payload = json.dumps(ITEMS, ensure_ascii=False, indent=1).encode("utf-8")
+    assert list(iter_json_array(byte_chunks(payload, chunk_size))) == ITEMS
+
+
+def test_iter_json_array_handles_empty_array():
+    assert list(iter_json_array([b" [ ", b"]"])) == []
+
+
+@pytest.mark.parametrize("payload", [b'{"bookingid": 1}', b"[1, 2", b"[1 2]", b""])
+def test_iter_json_array_rejects_invalid_payloads(payload):
+    with pytest.raises(ValueError):
+        list(iter_json_array(byte_chunks(payload, 3)))
+
+
+def test_iter_json_array_stops_reading_on_early_exit():
+    read_chunks = []
+
+    def chunks():
+        for chunk in [b"[1,", b"2,", b"3,", b"4]"]:
+            read_chunks.append(chunk)
+            yield chunk
+
+    assert list(islice(iter_json_array(chunks()), 1)) == [1]
+    assert len(read_chunks) <= 2
+
+
+def test_iter_booking_ids_yields_models(stub_server):
+    booking_service = BookingService(base_url=stub_server.base_url)
+
+    streamed = list(booking_service.iter_booking_ids())
+    loaded = booking_service.get_booking_ids().data
+
+    assert all(isinstance(item, BookingIdResponse) for item in streamed)
+    assert [item.bookingid for item in streamed] == [item.bookingid for item in loaded]
+
+
+def test_stream_items_early_exit_releases_the_connection(stub_server):
+    booking_service = BookingService(base_url=stub_server.base_url)
+
+    # Small chunks, so the body is not read to the end with the first item
+    items = booking_service.stream_items(
+        booking_service.url, BookingIdResponse, chunk_size=16
+    )
+    first = next(items)
+    assert isinstance(first.bookingid, int)
+    assert checked_out_connections(booking_service, stub_server.base_url) == 1
+
+    items.close()
+
+    assert checked_out_connections(booking_service, stub_server.base_url) == 0
+    assert booking_service.get_booking(first.bookingid).status == 200
@@ -0,0 +1,58 @@
+import json
+import tracemalloc
+
+from src.models.services.booking_service import BookingService
+from src.stub.booking_stub_server import BookingStubApp, StubProcess
+
+
+def test_large_datasets_are_generated_on_access():
+    tracemalloc.start()
+    app = BookingStubApp(dataset_size=1_000_000)
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    status, _, content = app.handle("GET", "/booking/1000000", {}, b"")
+
+    assert allocated < 1_000_000
+    assert status == 200
+    assert json.loads(content)["firstname"] == "Guest999999"
+
+
+def test_changes_to_generated_bookings_are_kept():
+    app = BookingStubApp(dataset_size=3)
+    headers = {"cookie": f"token={app.token}"}
+    changes = json.dumps({"firstname": "Changed"}).encode("utf-8")
+
+    assert app.handle("PATCH", "/booking/2", headers, changes)[0] == 200
+    assert app.handle("DELETE", "/booking/3", headers, b"")[0] == 201
+    created = json.loads(app.handle("POST", "/booking", {}, changes)[2])
+
+    assert json.loads(app.handle("GET", "/booking/2", {}, b"")[2])["firstname"] == (
+        "Changed"
+    )
+    assert app.handle("GET", "/booking/3", {}, b"")[0] == 404
+    assert created["bookingid"] == 4
+    ids = json.loads(app.handle("GET", "/booking", {}, b"")[2])
+    assert sorted(item["bookingid"] for item in ids) == [1, 2, 4]
+    filtered = json.loads(app.handle("GET", "/booking?firstname=Changed", {}, b"")[2])
+    assert sorted(item["bookingid"] for item in filtered) == [2, 4]
+
+
+def test_error_rate_is_seeded():
+    def statuses():
+        app = BookingStubApp(error_rate=0.3, seed=7)
+        return [app.handle("GET", "/booking/1", {}, b"")[0] for _ in range(200)]
+
+    first = statuses()
+
+    assert first == statuses()
+    assert 30 < sum(status != 200 for status in first) < 90
+    assert {status for status in first if status != 200} <= {500, 502, 503}
+
+
+def test_stub_runs_in_a_separate_process():
+    with StubProcess(dataset_size=100) as server:
+        service = BookingService(base_url=server.base_url)
+
+        assert len(service.get_booking_ids().data) == 100
+        assert service.get_booking(100).data.totalprice == 199
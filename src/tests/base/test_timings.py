@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+from src.models.services.async_booking_service import AsyncBookingService
+from src.models.services.booking_service import BookingService
+from src.stub.booking_stub_server import StubServer
+
+LATENCY_NS = 20_000_000
+
+
+@pytest.fixture
+def slow_server():
+    with StubServer(latency=LATENCY_NS / 1_000_000_000) as server:
+        yield server
+
+
+def assert_consistent(timings):
+    parts = [
+        timings.connect_ns,
+        timings.ttfb_ns,
+        timings.download_ns,
+    ]
+    assert all(part >= 0 for part in parts)
+    assert timings.decode_ns >= 0 and timings.validation_ns >= 0
+    assert sum(parts) <= timings.total_ns
+
+
+def test_sync_response_timings(slow_server):
+    service = BookingService(base_url=slow_server.base_url)
+
+    first = service.get_booking(1)
+    second = service.get_booking(1)
+
+    assert first.timings.connect_ns > 0
+    assert second.timings.connect_ns == 0
+    for response in (first, second):
+        assert_consistent(response.timings)
+        assert response.timings.ttfb_ns >= LATENCY_NS
+        assert response.response_time == response.timings.total_ns / 1_000_000
+        assert response.response_time < 2000
+
+
+def test_parsing_is_timed_on_first_data_access(stub_server):
+    response = BookingService(base_url=stub_server.base_url).get_booking(1)
+    total_ns = response.timings.total_ns
+    assert response.timings.parsing_ns == 0
+
+    assert response.data.firstname
+    assert response.timings.validation_ns > 0
+    assert response.timings.total_ns == total_ns
+    assert response.parsing_time == response.timings.parsing_ns / 1_000_000
+    assert_consistent(response.timings)
+
+
+def test_async_response_timings(slow_server):
+    async def scenario():
+        async with AsyncBookingService(base_url=slow_server.base_url) as service:
+            first = await service.get_booking(1)
+            second = await service.get_booking(1)
+            return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert first.timings.connect_ns > 0
+    assert second.timings.connect_ns == 0
+    for response in (first, second):
+        assert_consistent(response.timings)
+        assert response.timings.ttfb_ns >= LATENCY_NS
+        assert response.timings.as_ms()["total_ms"] == response.response_time
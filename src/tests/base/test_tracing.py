@@ -0,0 +1,170 @@
+import json
+import os
+import time
+
+import pytest
+
+from src.base.hooks import request_hooks_instance
+from src.base.load_runner import LoadRunner, Scenario
+from src.base.tracing import (
+    SPAN_KIND_CLIENT,
+    STATUS_ERROR,
+    BatchSpanProcessor,
+    InMemorySpanExporter,
+    Span,
+    tracer_instance,
+)
+from src.models.services.booking_service import BookingService
+from src.stub.booking_stub_server import BookingStubApp, StubServer
+
+
+class RecordingStubApp(BookingStubApp):
+    def __init__(self):
+        super().__init__()
+        self.traceparents = []
+
+    def handle(self, method, target, headers, body):
+        self.traceparents.append(headers.get("traceparent"))
+        return super().handle(method, target, headers, body)
+
+
+class GetBooking(Scenario):
+    def __init__(self, base_url):
+        self.base_url = base_url
+
+    def setup(self):
+        self.booking_service = BookingService(base_url=self.base_url)
+
+    def run(self):
+        assert self.booking_service.get_booking(1).status == 200
+
+
+@pytest.fixture
+def app():
+    app = RecordingStubApp()
+    with StubServer(app) as server:
+        app.base_url = server.base_url
+        yield app
+
+
+@pytest.fixture
+def spans(monkeypatch):
+    monkeypatch.setattr(request_hooks_instance, "hooks", [])
+    exporter = InMemorySpanExporter()
+    processor = BatchSpanProcessor(exporter)
+    tracer_instance.start(processor)
+    yield exporter.spans
+    tracer_instance.stop()
+
+
+def by_name(spans):
+    return {span.name: span for span in spans}
+
+
+def test_request_spans(app, spans):
+    service = BookingService(base_url=app.base_url)
+
+    service.get_booking(1).data
+    service.get_booking(999_999)
+    tracer_instance.processor.force_flush()
+
+    request, decode, validate, missing = spans
+    assert request.name == "GET /booking/{id}"
+    assert request.kind == SPAN_KIND_CLIENT
+    assert request.attributes["http.route"] == "/booking/{id}"
+    assert request.attributes["url.full"] == f"{app.base_url}/booking/1"
+    assert request.attributes["http.response.status_code"] == 200
+    assert request.attributes["http.response.body.size"] > 0
+    assert request.end_ns > request.start_ns
+    assert missing.status == STATUS_ERROR
+    assert missing.attributes["error.type"] == "404"
+    assert [decode.name, validate.name] == ["decode", "validate"]
+    assert decode.parent_id == validate.parent_id == request.span_id
+    assert decode.end_ns == validate.start_ns
+    assert app.traceparents[-2] == request.traceparent
+
+
+def test_authenticate_span_is_the_parent_of_its_request(spans):
+    # Credentials of their own, so that no cached token skips the /auth call
+    app = BookingStubApp(username="tracing", password=os.urandom(8).hex())
+    with StubServer(app) as server:
+        service = BookingService(base_url=server.base_url)
+
+        service.authenticate(
+            credentials={"username": app.username, "password": app.password}
+        )
+    tracer_instance.processor.force_flush()
+
+    named = by_name(spans)
+    assert named["authenticate"].attributes["auth.method"] == "USERNAME_PASSWORD"
+    assert named["POST /auth"].parent_id == named["authenticate"].span_id
+    assert named["POST /auth"].trace_id == named["authenticate"].trace_id
+
+
+def test_no_spans_or_headers_when_stopped(app, monkeypatch):
+    monkeypatch.setattr(request_hooks_instance, "hooks", [])
+    monkeypatch.setattr(tracer_instance, "processor", None)
+    service = BookingService(base_url=app.base_url)
+
+    with tracer_instance.span("unused") as span:
+        service.get_booking(1)
+
+    assert span is None
+    assert app.traceparents == [None]
+
+
+def test_batch_processor_exports_off_the_calling_thread():
+    exporter = InMemorySpanExporter()
+    processor = BatchSpanProcessor(exporter, max_batch_size=2, schedule_delay=10)
+
+    for index in range(2):
+        span = Span(f"span {index}")
+        span.end()
+        processor.on_end(span)
+    deadline = time.monotonic() + 5
+    while len(exporter.spans) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert [span.name for span in exporter.spans] == ["span 0", "span 1"]
+    processor.shutdown()
+
+
+def test_batch_processor_drops_spans_past_the_queue_size():
+    exporter = InMemorySpanExporter()
+    processor = BatchSpanProcessor(
+        exporter, max_batch_size=10, schedule_delay=10, max_queue_size=3
+    )
+
+    for index in range(5):
+        span = Span(f"span {index}")
+        span.end()
+        processor.on_end(span)
+    processor.shutdown()
+
+    assert len(exporter.spans) == 3
+    assert processor.dropped == 2
+
+
+def test_load_runner_writes_otlp_file(app, tmp_path):
+    path = tmp_path / "spans.jsonl"
+
+    LoadRunner(
+        GetBooking,
+        duration=0.2,
+        concurrency=1,
+        scenario_kwargs={"base_url": app.base_url},
+        trace_file=str(path),
+    ).run()
+
+    spans = [
+        span
+        for line in path.read_text().splitlines()
+        for resource in json.loads(line)["resourceSpans"]
+        for scope in resource["scopeSpans"]
+        for span in scope["spans"]
+    ]
+    iterations = {span["spanId"] for span in spans if span["name"].startswith("it")}
+    requests = [span for span in spans if span["name"] == "GET /booking/{id}"]
+    assert requests
+    assert all(span["parentSpanId"] in iterations for span in requests)
+    assert tracer_instance.processor is None
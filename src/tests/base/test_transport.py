@@ -0,0 +1,111 @@
+import pytest
+
+from src.base.bulk import run_bulk
+from src.base.resilience import RetryPolicy
+from src.base.transport import Http2Transport, RequestsTransport
+from src.models.requests.booking.booking_model import BookingDates, BookingModel
+from src.models.services.booking_service import BookingService
+from src.stub.booking_stub_server import BookingStubApp
+from src.tests.helpers import closed_port_url
+
+pytest.importorskip("httpx")
+pytest.importorskip("h2")
+
+from src.stub.h2_stub_server import H2StubServer  # noqa: E402
+
+CREDENTIALS = {"username": "admin", "password": "password123"}
+
+
+@pytest.fixture
+def h2_server():
+    with H2StubServer(app=BookingStubApp(dataset_size=5_000)) as server:
+        yield server
+
+
+@pytest.fixture
+def transport():
+    transport = Http2Transport()
+    yield transport
+    transport.close()
+
+
+@pytest.fixture
+def booking_service(h2_server, transport):
+    service = BookingService(base_url=h2_server.base_url)
+    service.transport = transport
+    return service
+
+
+def test_requests_is_the_default_transport(stub_server):
+    service = BookingService(base_url=stub_server.base_url)
+
+    assert isinstance(service.transport, RequestsTransport)
+    assert service.get_booking(1).status == 200
+
+
+def test_verbs_and_models_work_over_http2(booking_service):
+    booking = BookingModel(
+        firstname="Multi",
+        lastname="Plexed",
+        totalprice=42,
+        depositpaid=True,
+        bookingdates=BookingDates(checkin="2024-01-01", checkout="2024-02-01"),
+        additionalneeds="Breakfast",
+    )
+    booking_service.authenticate(credentials=CREDENTIALS)
+
+    created = booking_service.add_booking(booking)
+    fetched = booking_service.get_booking(created.data.bookingid)
+    deleted = booking_service.delete_booking(created.data.bookingid)
+
+    assert fetched.status == 200
+    assert fetched.data.firstname == "Multi"
+    assert fetched.timings.ttfb_ns > 0
+    assert deleted.status == 201
+    assert booking_service.get_booking(created.data.bookingid).status == 404
+
+
+def test_large_bodies_respect_flow_control(booking_service):
+    response = booking_service.get_booking_ids()
+
+    assert response.status == 200
+    assert len(response.data) == 5_000
+
+
+def test_streamed_lists_go_through_the_transport(booking_service, transport):
+    streamed = list(booking_service.iter_booking_ids())
+
+    assert len(streamed) == 5_000
+    assert transport.connections_opened == 1
+
+
+def test_compressed_responses_count_bytes_on_the_wire(booking_service):
+    response = booking_service.get_booking_ids()
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.timings.received_bytes < response.timings.decoded_bytes
+
+
+def test_concurrent_requests_share_one_connection(booking_service, transport):
+    result = run_bulk(booking_service.get_booking, list(range(1, 51)), concurrency=25)
+
+    assert not result.failures
+    assert [response.data.totalprice for response in result.responses] == list(
+        range(100, 150)
+    )
+    assert transport.connections_opened == 1
+
+
+def test_connection_errors_are_raised_as_requests_errors(transport):
+    service = BookingService(base_url=closed_port_url())
+    service.transport = transport
+    policy = RetryPolicy(max_retries=1, backoff_factor=0)
+    service.retry_policy = policy
+
+    with pytest.raises(policy.retry_exceptions):
+        service.get_booking(1)
+
+
+def test_unsupported_options_are_rejected(booking_service):
+    with pytest.raises(TypeError, match="verify"):
+        booking_service.get(booking_service.url, verify=False)
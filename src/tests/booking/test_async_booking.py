@@ -0,0 +1,109 @@
+import asyncio
+import os
+
+import pytest
+
+from src.models.requests.booking.booking_model import BookingModel, BookingDates
+from src.base.session_manager import SessionManager
+from src.models.services.async_booking_service import AsyncBookingService
+from src.stub.booking_stub_server import BookingStubApp, StubServer
+
+
+class CountingStubApp(BookingStubApp):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.auth_calls = 0
+
+    def handle(self, method, target, headers, body):
+        if target == "/auth":
+            self.auth_calls += 1
+        return super().handle(method, target, headers, body)
+
+
+@pytest.fixture
+def booking():
+    return BookingModel(
+        firstname="Jim",
+        lastname="Brown",
+        totalprice=111,
+        depositpaid=True,
+        bookingdates=BookingDates(checkin="2020-01-01", checkout="2021-01-01"),
+        additionalneeds="Breakfast",
+    )
+
+
+def test_async_add_and_get_booking(stub_server, booking):
+    async def scenario():
+        async with AsyncBookingService(base_url=stub_server.base_url) as service:
+            created = await service.add_booking(booking)
+            fetched = await service.get_booking(created.data.bookingid)
+            return created, fetched
+
+    created, fetched = asyncio.run(scenario())
+    assert created.status == 200
+    assert isinstance(created.data.bookingid, int)
+    assert fetched.status == 200
+    assert fetched.data.firstname == booking.firstname
+    assert fetched.data.bookingdates.checkin == booking.bookingdates.checkin
+
+
+def test_async_concurrent_get_booking(stub_server):
+    async def scenario():
+        async with AsyncBookingService(base_url=stub_server.base_url) as service:
+            ids = await service.get_booking_ids()
+            booking_ids = [item.bookingid for item in ids.data][:5]
+            return await asyncio.gather(
+                *(service.get_booking(booking_id) for booking_id in booking_ids)
+            )
+
+    responses = asyncio.run(scenario())
+    assert len(responses) == 5
+    assert all(response.status == 200 for response in responses)
+
+
+def test_async_authenticated_delete_booking(stub_server, booking):
+    async def scenario():
+        async with AsyncBookingService(base_url=stub_server.base_url) as service:
+            await service.authenticate(
+                credentials={"username": "admin", "password": "password123"}
+            )
+            created = await service.add_booking(booking)
+            deleted = await service.delete_booking(created.data.bookingid)
+            fetched = await service.get_booking(created.data.bookingid)
+            return deleted, fetched
+
+    deleted, fetched = asyncio.run(scenario())
+    assert deleted.status == 201
+    assert fetched.status == 404
+
+
+def test_async_unauthorized_delete_booking(stub_server, booking):
+    async def scenario():
+        async with AsyncBookingService(base_url=stub_server.base_url) as service:
+            created = await service.add_booking(booking)
+            return await service.delete_booking(created.data.bookingid)
+
+    response = asyncio.run(scenario())
+    assert response.status == 403
+
+
+def test_async_concurrent_authenticate_posts_once():
+    # Credentials of their own, so that the token cache starts cold
+    app = CountingStubApp(username="async", password=os.urandom(8).hex())
+    credentials = {"username": app.username, "password": app.password}
+
+    async def authenticate(base_url):
+        async with AsyncBookingService(base_url=base_url) as service:
+            await service.authenticate(credentials=credentials)
+            return service.headers["Cookie"]
+
+    async def scenario(base_url):
+        return await asyncio.gather(*(authenticate(base_url) for _ in range(10)))
+
+    with StubServer(app) as server:
+        cookies = asyncio.run(scenario(server.base_url))
+
+    assert len(set(cookies)) == 1
+    assert app.auth_calls == 1
+    # The fetcher is bound to the finished event loop: no renewal may call it
+    assert f"{app.username}:{app.password}" not in SessionManager._renewal_timers
@@ -0,0 +1,182 @@
+import asyncio
+import time
+
+import pytest
+
+from src.models.requests.booking.booking_model import BookingModel, BookingDates
+from src.models.services.async_booking_service import AsyncBookingService
+from src.models.services.booking_service import BookingService
+from src.stub.booking_stub_server import StubServer
+from src.tests.helpers import LegacyRecordsStubApp
+
+
+def build_booking(index: int) -> BookingModel:
+    return BookingModel(
+        firstname=f"Bulk{index}",
+        lastname="Brown",
+        totalprice=100 + index,
+        depositpaid=True,
+        bookingdates=BookingDates(checkin="2024-01-01", checkout="2024-02-01"),
+        additionalneeds="Breakfast",
+    )
+
+
+@pytest.fixture
+def booking_service(stub_server):
+    service = BookingService(base_url=stub_server.base_url)
+    service.authenticate(credentials={"username": "admin", "password": "password123"})
+    return service
+
+
+def test_add_bookings_preserves_input_order(booking_service):
+    bookings = [build_booking(index) for index in range(25)]
+
+    result = booking_service.add_bookings(bookings, concurrency=5)
+    assert result.succeeded
+    assert len(result) == 25
+    assert [response.data.booking.firstname for response in result] == [
+        booking.firstname for booking in bookings
+    ]
+
+
+def test_add_bookings_collects_failures(booking_service):
+    bookings = [build_booking(0), BookingModel(lastname="Snow"), build_booking(2)]
+
+    result = booking_service.add_bookings(bookings, concurrency=3)
+    assert not result.succeeded
+    assert [failure.index for failure in result.failures] == [1]
+    assert result.failures[0].response.status == 500
+    assert result[0].status == 200
+    assert result[2].status == 200
+
+
+def test_get_and_delete_bookings(booking_service):
+    created = booking_service.add_bookings([build_booking(index) for index in range(5)])
+    booking_ids = [response.data.bookingid for response in created]
+
+    fetched = booking_service.get_bookings(booking_ids)
+    assert [response.data.firstname for response in fetched] == [
+        f"Bulk{index}" for index in range(5)
+    ]
+
+    deleted = booking_service.delete_bookings(booking_ids)
+    assert all(response.status == 201 for response in deleted)
+
+    missing = booking_service.get_bookings(booking_ids)
+    assert len(missing.failures) == 5
+
+
+def test_unauthorized_delete_bookings(stub_server, booking_service):
+    created = booking_service.add_bookings([build_booking(index) for index in range(3)])
+    booking_ids = [response.data.bookingid for response in created]
+
+    unauthorized_service = BookingService(base_url=stub_server.base_url)
+    result = unauthorized_service.delete_bookings(booking_ids)
+    assert [failure.response.status for failure in result.failures] == [403] * 3
+
+
+def test_bulk_operation_collects_exceptions():
+    service = BookingService(base_url="http://127.0.0.1:9")
+
+    result = service.get_bookings([1, 2], concurrency=2)
+    assert result.responses == [None, None]
+    assert all(failure.error is not None for failure in result.failures)
+
+
+def test_async_add_bookings(stub_server):
+    async def scenario():
+        async with AsyncBookingService(base_url=stub_server.base_url) as service:
+            return await service.add_bookings(
+                [build_booking(index) for index in range(50)], concurrency=20
+            )
+
+    result = asyncio.run(scenario())
+    assert result.succeeded
+    assert [response.data.booking.totalprice for response in result] == [
+        100 + index for index in range(50)
+    ]
+
+
+def test_get_bookings_detailed_validates_in_bulk(booking_service):
+    result = booking_service.get_bookings_detailed(concurrency=5)
+
+    assert result.succeeded
+    assert len(result) >= 10
+    assert all(response.content is None for response in result)
+    assert result[0].data.firstname == "Guest0"
+    assert result[0].timings.validation_ns > 0
+
+
+def test_get_bookings_detailed_keeps_failures_per_item(booking_service):
+    result = booking_service.get_bookings_detailed([1, 999_999, 2])
+
+    assert [failure.index for failure in result.failures] == [1]
+    assert result[1].status == 404
+    assert [result[0].data.firstname, result[2].data.firstname] == ["Guest0", "Guest1"]
+
+
+def test_get_bookings_detailed_reports_invalid_records():
+    app = LegacyRecordsStubApp(malformed=[3])
+    with StubServer(app=app) as server:
+        service = BookingService(base_url=server.base_url)
+
+        result = service.get_bookings_detailed([1, 2, 3, 999_999])
+
+    assert not result.succeeded
+    assert [(failure.index, failure.item) for failure in result.failures] == [
+        (2, 3),
+        (3, 999_999),
+    ]
+    assert "additionalneeds" in str(result.failures[0].error)
+    assert result.failures[0].response.status == 200
+    assert result[2] is None
+    assert [result[0].data.firstname, result[1].data.firstname] == [
+        "Guest0",
+        "Guest1",
+    ]
+
+
+def test_iter_bookings_detailed_yields_as_completed(booking_service):
+    yielded = list(
+        booking_service.iter_bookings_detailed([1, 2, 999_999, 3], concurrency=2)
+    )
+    outcomes = {booking_id: outcome for _, booking_id, outcome in yielded}
+
+    assert sorted((index, booking_id) for index, booking_id, _ in yielded) == [
+        (0, 1),
+        (1, 2),
+        (2, 999_999),
+        (3, 3),
+    ]
+    assert outcomes[999_999].response.status == 404
+    assert outcomes[3].data.firstname == "Guest2"
+
+
+def test_iter_bookings_detailed_can_stop_early():
+    app = LegacyRecordsStubApp()
+    with StubServer(app=app) as server:
+        service = BookingService(base_url=server.base_url)
+        iterator = service.iter_bookings_detailed(range(1, 1000), concurrency=4)
+
+        first = [next(iterator) for _ in range(3)]
+        iterator.close()
+        fetched = list(app.targets)
+        time.sleep(0.05)
+
+        assert app.targets == fetched
+
+    # At most 2 * concurrency queued, plus one refill per yielded booking
+    fetched_ids = {int(target.rsplit("/", 1)[1]) for target in fetched}
+    assert len(first) == 3
+    assert {booking_id for _, booking_id, _ in first} <= fetched_ids
+    assert fetched_ids <= set(range(1, 12))
+
+
+def test_async_get_bookings_detailed(stub_server):
+    async def scenario():
+        async with AsyncBookingService(base_url=stub_server.base_url) as service:
+            return await service.get_bookings_detailed(range(1, 11), concurrency=5)
+
+    result = asyncio.run(scenario())
+    assert result.succeeded
+    assert [response.data.totalprice for response in result] == list(range(100, 110))
@@ -0,0 +1,191 @@
+import os
+
+import pytest
+
+from src.base.api_client import api_client_instance
+from src.base.cassette import CassetteMode
+from src.base.hooks import request_hooks_instance
+from src.base.metrics import HistogramSink, TransferSink, metrics_instance
+from src.base.profiling import CProfileProfiler, TracemallocProfiler
+from src.base.session_manager import SessionManager
+from src.base.settings import settings_instance
+from src.base.tracing import BatchSpanProcessor, FileSpanExporter, tracer_instance
+from src.stub.booking_stub_server import BookingStubApp, StubServer
+
+latency_histograms_key = pytest.StashKey[HistogramSink]()
+transfer_stats_key = pytest.StashKey[TransferSink]()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--stub",
+        action="store_true",
+        help="run against the local stub of the booking API instead of BASE_URL "
+        "(or set USE_STUB=1)",
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def api_target(pytestconfig):
+    """
+    Points the suite at BASE_URL (e.g. from .env), or at the local stub of the
+    booking API with ``--stub`` or USE_STUB=1, so it runs without network
+    access. The stub accepts USERNAME/PASSWORD (admin/password123 by default).
+    Stops the run when neither is configured.
+    """
+    use_stub = pytestconfig.getoption("--stub") or (
+        settings_instance.get("USE_STUB", "").lower() in ("1", "true", "yes")
+    )
+    if not use_stub:
+        if not settings_instance.get("BASE_URL"):
+            pytest.exit(
+                "No API to test: set BASE_URL (e.g. in .env), or run against the "
+                "local stub with --stub or USE_STUB=1",
+                returncode=pytest.ExitCode.USAGE_ERROR,
+            )
+        yield None
+        return
+
+    app = BookingStubApp(
+        username=settings_instance.get("USERNAME") or "admin",
+        password=settings_instance.get("PASSWORD") or "password123",
+    )
+    with StubServer(app) as server, pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("BASE_URL", server.base_url)
+        monkeypatch.setenv("USERNAME", app.username)
+        monkeypatch.setenv("PASSWORD", app.password)
+        yield server
+
+
+@pytest.fixture(scope="session", autouse=True)
+def parallel_run(tmp_path_factory):
+    """
+    Shares auth tokens between processes when the suite is sharded with
+    pytest-xdist (``pytest -n auto``), so only one worker calls /auth.
+    TOKEN_STORE_DIR selects the shared directory for other multi-process runs.
+    """
+    directory = settings_instance.get("TOKEN_STORE_DIR")
+    if not directory and os.getenv("PYTEST_XDIST_WORKER"):
+        directory = str(tmp_path_factory.getbasetemp().parent)
+
+    SessionManager.use_shared_store(directory)
+    yield
+    SessionManager.stop_renewals()
+    SessionManager.use_shared_store(None)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def cassette():
+    """
+    CASSETTE_MODE=record saves every exchange with the API to CASSETTE_PATH,
+    CASSETTE_MODE=replay answers from it without network (CASSETTE_LATENCY=1.0
+    to replay at the recorded speed). The local stub server is never recorded.
+    """
+    mode = settings_instance.get("CASSETTE_MODE")
+    if not mode:
+        yield None
+        return
+
+    loaded = api_client_instance.use_cassette(
+        settings_instance.get("CASSETTE_PATH", "src/tests/cassettes/suite.jsonl.gz"),
+        CassetteMode[mode.upper()],
+        latency_scale=float(settings_instance.get("CASSETTE_LATENCY", 0)),
+        passthrough_hosts={"127.0.0.1", "localhost"},
+    )
+    yield loaded
+    api_client_instance.eject_cassette()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def request_profiling():
+    """
+    PROFILE_REQUESTS=cprofile,tracemalloc captures the requests of the run and
+    writes them under PROFILE_DIR (default .profiles), one folder per test.
+    Narrow it down with PROFILE_ENDPOINT (e.g. /booking/{id}), PROFILE_STATUS
+    (e.g. 500,503) and PROFILE_MIN_MS (only requests at least that slow).
+    """
+    kinds = settings_instance.get("PROFILE_REQUESTS")
+    if not kinds:
+        yield []
+        return
+
+    statuses = settings_instance.get("PROFILE_STATUS")
+    min_latency_ms = settings_instance.get("PROFILE_MIN_MS")
+    options = {
+        "directory": settings_instance.get("PROFILE_DIR", ".profiles"),
+        "endpoint": settings_instance.get("PROFILE_ENDPOINT"),
+        "statuses": (
+            [int(status) for status in statuses.split(",")] if statuses else None
+        ),
+        "min_latency_ms": float(min_latency_ms) if min_latency_ms else None,
+    }
+    profiler_types = {"cprofile": CProfileProfiler, "tracemalloc": TracemallocProfiler}
+    profilers = [
+        request_hooks_instance.add_hook(profiler_types[kind.strip()](**options))
+        for kind in kinds.lower().split(",")
+    ]
+    yield profilers
+    for profiler in profilers:
+        request_hooks_instance.remove_hook(profiler)
+        if isinstance(profiler, TracemallocProfiler):
+            profiler.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def tracing():
+    """
+    TRACE_FILE=spans.jsonl records a span for every request of the run (and
+    for authenticate) in that file, as OTLP/JSON lines.
+    """
+    path = settings_instance.get("TRACE_FILE")
+    if not path:
+        yield None
+        return
+
+    tracer_instance.start(BatchSpanProcessor(FileSpanExporter(path)))
+    yield tracer_instance
+    tracer_instance.stop()
+
+
+@pytest.fixture(scope="session")
+def stub_server():
+    with StubServer() as server:
+        yield server
+
+
+@pytest.fixture(scope="session", autouse=True)
+def latency_histograms(pytestconfig):
+    """
+    Records the latency of every request of the run per endpoint. Tests can use
+    it for percentile assertions, and the p50/p95/p99 summary is printed at the
+    end of the session.
+    """
+    sink = metrics_instance.add_sink(HistogramSink())
+    pytestconfig.stash[latency_histograms_key] = sink
+    yield sink
+    metrics_instance.remove_sink(sink)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def transfer_stats(pytestconfig):
+    """
+    Adds up the bytes sent and received per endpoint, compressed against
+    uncompressed. The totals are printed at the end of the session.
+    """
+    sink = metrics_instance.add_sink(TransferSink())
+    pytestconfig.stash[transfer_stats_key] = sink
+    yield sink
+    metrics_instance.remove_sink(sink)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    for key, title in (
+        (latency_histograms_key, "request latency"),
+        (transfer_stats_key, "request and response bodies"),
+    ):
+        sink = config.stash.get(key, None)
+        lines = sink.format_summary() if sink else []
+        if lines:
+            terminalreporter.write_sep("-", title)
+            for line in lines:
+                terminalreporter.write_line(line)
@@ -0,0 +1,40 @@
+import json
+import socket
+import threading
+
+from src.stub.booking_stub_server import BookingStubApp
+
+
+class LegacyRecordsStubApp(BookingStubApp):
+    """
+    Serves ``malformed`` bookings without ``additionalneeds`` (as some records of
+    the shared public API) and records the GET targets.
+    """
+
+    def __init__(self, malformed=(), **kwargs):
+        super().__init__(**kwargs)
+        self.malformed = {f"/booking/{booking_id}" for booking_id in malformed}
+        self.targets = []
+        self.lock = threading.Lock()
+
+    def _route(self, method, target, headers, body):
+        status, response_headers, content = super()._route(
+            method, target, headers, body
+        )
+        with self.lock:
+            self.targets.append(target)
+        if target in self.malformed:
+            booking = json.loads(content)
+            del booking["additionalneeds"]
+            content = json.dumps(booking).encode("utf-8")
+        return status, response_headers, content
+
+
+def closed_port_url():
+    """
+    URL of a local port nothing listens on, for connection errors.
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}"